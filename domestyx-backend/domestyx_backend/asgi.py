@@ -2,6 +2,8 @@
 ASGI config for domestyx_backend project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP requests go to Django; WebSocket connections on ``/ws/`` go to the
+realtime gateway (see ``realtime.gateway``).
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -13,4 +15,16 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'domestyx_backend.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported after Django is set up: the gateway authenticates against the user model.
+from realtime.gateway import websocket_application  # noqa: E402
+
+
+async def application(scope, receive, send):
+    if scope["type"] != "websocket":
+        return await django_application(scope, receive, send)
+    if scope["path"].rstrip("/") == "/ws":
+        return await websocket_application(scope, receive, send)
+    await receive()
+    await send({"type": "websocket.close"})
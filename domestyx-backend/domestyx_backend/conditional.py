@@ -0,0 +1,40 @@
+# domestyx_backend/conditional.py
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(validator):
+    digest = hashlib.md5(repr(validator).encode(), usedforsecurity=False).hexdigest()
+    return quote_etag(digest)
+
+
+def set_validators(response, etag, last_modified=None, private=True):
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    # Clients may keep the body but must revalidate before reusing it.
+    patch_cache_control(response, no_cache=True, **{"private" if private else "public": True})
+    patch_vary_headers(response, ["Authorization"])
+    return response
+
+
+def conditional_get(request, validator, render, last_modified=None, private=True):
+    """Answer a GET with 304 when the client's copy still matches ``validator``.
+
+    ``validator`` is any cheap, repr-able summary of the data behind the
+    response (counts, max timestamps, ids) that changes whenever the body
+    would. ``render`` builds the full response and only runs on a miss.
+    """
+    etag = make_etag(validator)
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified is not None else None,
+    )
+    if response is None:
+        response = render()
+    if response.status_code in (200, 304):
+        set_validators(response, etag, last_modified, private=private)
+    return response
@@ -0,0 +1,35 @@
+# domestyx_backend/serializers.py
+
+
+def _field_names(value):
+    return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+
+class SparseFieldsMixin:
+    """Lets GET clients trim serializer output with ``?fields=a,b`` or ``?exclude=c``.
+
+    Only top-level serializers built with the request in their context are
+    trimmed; nested serializers always render in full. List a serializer's
+    expensive columns in ``Meta.deferrable_fields`` and views can skip loading
+    them with ``defer_unrequested_fields`` when the client did not ask for them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None or request.method != "GET":
+            return
+        requested = _field_names(request.query_params.get("fields"))
+        excluded = _field_names(request.query_params.get("exclude"))
+        for name in list(self.fields):
+            if (requested and name not in requested) or name in excluded:
+                self.fields.pop(name)
+
+    @classmethod
+    def defer_unrequested_fields(cls, queryset, request):
+        deferrable = getattr(cls.Meta, "deferrable_fields", ())
+        if not deferrable:
+            return queryset
+        rendered = cls(context={"request": request}).fields
+        deferred = [name for name in deferrable if name not in rendered]
+        return queryset.defer(*deferred) if deferred else queryset
@@ -138,6 +138,23 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# --- Cache ---
+# Per-process memory by default; point CACHE_BACKEND/CACHE_LOCATION at a shared
+# store (e.g. django.core.cache.backends.redis.RedisCache) when running several workers.
+# Otherwise anonymous job-feed pages may trail job edits made through another
+# worker by up to JOB_FEED_CACHE_TIMEOUT seconds (see jobs/cache.py).
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("CACHE_LOCATION", "domestyx"),
+    }
+}
+JOB_FEED_CACHE_TIMEOUT = int(os.environ.get("JOB_FEED_CACHE_TIMEOUT", "300"))
+
+# Pub/sub backend for WebSocket events (see realtime/brokers.py). The default
+# only reaches sockets served by the same process.
+REALTIME_BROKER = os.environ.get("REALTIME_BROKER", "realtime.brokers.InMemoryBroker")
+
 # --- Custom Settings ---
 AUTH_USER_MODEL = "users.CustomUser"
 
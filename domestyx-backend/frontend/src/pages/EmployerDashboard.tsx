@@ -36,6 +36,7 @@ const EmployerDashboard = () => {
 
  const [jobs, setJobs] = useState<any[]>([]);
  const [selectedJob, setSelectedJob] = useState<any | null>(null);
+ const [selectedJobApplicants, setSelectedJobApplicants] = useState<any[]>([]);
  const [isLoading, setIsLoading] = useState(true);
  const [viewMode, setViewMode] = useState<ViewMode>("active");
 
@@ -66,7 +67,7 @@ const EmployerDashboard = () => {
  const [calls, setCalls] = useState<any[]>([]);
 
  const metrics = useMemo(() => {
- const totalApplicants = jobs.reduce((sum, j) => sum + (j.applicants?.length || 0), 0);
+ const totalApplicants = jobs.reduce((sum, j) => sum + (j.applicant_count || 0), 0);
  const hiredCount = history.filter((h) => h.status === "hired").length;
  const rejectedCount = history.filter((h) => h.status === "rejected").length;
  return {
@@ -95,6 +96,7 @@ const EmployerDashboard = () => {
 
  const updated = jobsData.find((j: any) => j.id === selectedJob.id);
  setSelectedJob(updated || jobsData[0]);
+ if (updated) void fetchSelectedJobApplicants(updated.id);
  } catch (error) {
  toast({ title: "Error", description: "Failed to fetch jobs", variant: "destructive" });
  } finally {
@@ -102,6 +104,15 @@ const EmployerDashboard = () => {
  }
  };
 
+ const fetchSelectedJobApplicants = async (jobId: number) => {
+ try {
+ const response = await api.get(`/employer/jobs/${jobId}/`);
+ setSelectedJobApplicants(response.data?.applicants || []);
+ } catch {
+ setSelectedJobApplicants([]);
+ }
+ };
+
  const fetchHistory = async () => {
  try {
  const response = await api.get("/employer/application-history/");
@@ -190,6 +201,7 @@ const EmployerDashboard = () => {
  location: selectedJob.location || prev.location,
  salary: selectedJob.salary || prev.salary,
  }));
+ void fetchSelectedJobApplicants(selectedJob.id);
  void fetchRecommendedWorkers(selectedJob.id);
  void fetchShortlistedWorkers(selectedJob.id);
  }, [selectedJob?.id]);
@@ -480,7 +492,7 @@ const EmployerDashboard = () => {
  <div>
  <h3 className="font-bold text-lg">{job.title}</h3>
  <div className="flex space-x-4 text-sm text-gray-500 mt-1">
- <span className="flex items-center"><Users className="w-4 h-4 mr-1" /> {job.applicants?.length || 0} applicants</span>
+ <span className="flex items-center"><Users className="w-4 h-4 mr-1" /> {job.applicant_count || 0} applicants</span>
  <span className="flex items-center"><MapPin className="w-4 h-4 mr-1" /> {job.location}</span>
  <Badge variant="outline" className="capitalize">{job.status || "active"}</Badge>
  <Badge variant={job.review_status === "approved" ? "default" : "secondary"} className="capitalize">
@@ -526,9 +538,9 @@ const EmployerDashboard = () => {
  <div className="rounded-xl border border-amber-200 bg-amber-50 p-5 text-sm text-amber-700">
  Applications are blocked while this job is in {selectedJob.review_status || "pending"} review state.
  </div>
- ) : selectedJob.applicants?.length === 0 ? (
+ ) : selectedJobApplicants.length === 0 ? (
  <div className="rounded-xl border border-border/60 bg-secondary/40 p-8 text-center text-gray-500">No applicants yet.</div>
- ) : selectedJob.applicants.map((app: any) => (
+ ) : selectedJobApplicants.map((app: any) => (
  <Card key={app.id}>
  <CardContent className="p-4 space-y-3">
  <div className="flex items-center space-x-3">
@@ -0,0 +1,79 @@
+# jobs/automaton.py
+import threading
+from collections import OrderedDict
+
+
+class TermMatcher:
+    """Aho-Corasick automaton reporting which of a fixed set of terms occur in a text.
+
+    Matching is by substring, like ``term in text``, but every term is found in
+    a single pass over the text. Results are memoized per text, so repeated
+    lookups for the same job cost a dictionary hit.
+    """
+
+    def __init__(self, terms, cache_size=2048):
+        self._goto = [{}]
+        self._fail = [0]
+        self._term = [None]
+        # Nearest node on the failure chain that ends a term (0 when there is none).
+        self._output = [0]
+        for term in terms:
+            if term:
+                self._insert(term)
+        self._link()
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+
+    def _insert(self, term):
+        node = 0
+        for char in term:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._term.append(None)
+                self._output.append(0)
+            node = child
+        self._term[node] = term
+
+    def _link(self):
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                failed = self._goto[fallback].get(char, 0)
+                self._fail[child] = failed
+                self._output[child] = failed if self._term[failed] is not None else self._output[failed]
+                queue.append(child)
+
+    def find(self, text):
+        """Return the frozenset of terms that occur in ``text``."""
+        with self._cache_lock:
+            found = self._cache.get(text)
+            if found is not None:
+                self._cache.move_to_end(text)
+                return found
+
+        goto, fail, terms, output = self._goto, self._fail, self._term, self._output
+        matches = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            hit = node if terms[node] is not None else output[node]
+            while hit:
+                matches.add(terms[hit])
+                hit = output[hit]
+
+        found = frozenset(matches)
+        with self._cache_lock:
+            self._cache[text] = found
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return found
@@ -0,0 +1,172 @@
+# jobs/benchmark.py
+"""Synthetic catalogs for benchmarking job/worker matching.
+
+``generate_catalog`` bulk-inserts employers, workers with profiles and jobs
+whose vocabulary, casing and field shapes resemble real listings (services
+as lists or legacy comma-separated strings, emirate/neighbourhood locations,
+optional nationality and language requirements). Stored match features, the
+directory search columns and the worker token index are written alongside,
+exactly as saving each row would, but without per-row signals so large
+catalogs insert quickly.
+"""
+import random
+import secrets
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+
+from users.models import EmployerProfile, WorkerProfile
+from users.search import build_worker_filter_fields
+
+from .matching import add_match_terms, build_job_features, build_worker_features, build_worker_tokens
+from .models import Job, WorkerMatchToken
+from .salary import derive_salary_bounds
+
+# Weighted roughly by how often each appears on the platform.
+SERVICES = (
+    ("housekeeping", 10), ("cleaning", 9), ("cooking", 8), ("childcare", 7), ("nanny", 6),
+    ("elderly care", 4), ("driving", 4), ("laundry", 3), ("ironing", 3), ("babysitting", 3),
+    ("gardening", 2), ("pet care", 2), ("caregiving", 2), ("tutoring", 1), ("maid", 5),
+)
+LANGUAGES = (
+    ("english", 10), ("arabic", 6), ("hindi", 4), ("tagalog", 5), ("urdu", 2), ("malayalam", 2),
+    ("tamil", 1), ("bengali", 1), ("nepali", 1), ("sinhala", 1), ("swahili", 1), ("amharic", 1),
+    ("indonesian", 2), ("french", 1),
+)
+NATIONALITIES = (
+    ("Philippines", 10), ("India", 8), ("Indonesia", 5), ("Sri Lanka", 4), ("Nepal", 3), ("Ethiopia", 4),
+    ("Kenya", 3), ("Uganda", 2), ("Bangladesh", 2), ("Pakistan", 2), ("Ghana", 1), ("Myanmar", 1),
+)
+CITIES = (
+    (("Dubai", "Dubai"), 10), (("Abu Dhabi", "Abu Dhabi"), 6), (("Al Ain", "Abu Dhabi"), 2),
+    (("Sharjah", "Sharjah"), 5), (("Ajman", "Ajman"), 2), (("Ras Al Khaimah", "Ras Al Khaimah"), 1),
+    (("Fujairah", "Fujairah"), 1), (("Umm Al Quwain", "Umm Al Quwain"), 1),
+)
+JOB_LOCATIONS = (
+    ("Jumeirah, Dubai", 5), ("Dubai Marina, Dubai", 4), ("Arabian Ranches, Dubai", 3), ("Al Barsha, Dubai", 3),
+    ("Mirdif, Dubai", 2), ("Khalifa City, Abu Dhabi", 3), ("Al Reem Island, Abu Dhabi", 2), ("Al Ain", 1),
+    ("Al Nahda, Sharjah", 3), ("Al Khan, Sharjah", 1), ("Ajman", 1), ("Ras Al Khaimah", 1), ("Fujairah", 1),
+)
+FAMILY_DETAILS = (
+    "Family of four with two young children.", "Elderly couple living in a villa.", "Busy working parents.",
+    "Large villa with a garden and two dogs.", "Apartment with a newborn baby.", "Household of six adults.",
+)
+JOB_TYPES = (("full-time", 8), ("part-time", 3), ("contract", 1), ("one-time", 1))
+
+
+def _pick(rng, weighted, k=1):
+    values, weights = zip(*weighted)
+    picked = []
+    while len(picked) < min(k, len(values)):
+        value = rng.choices(values, weights)[0]
+        if value not in picked:
+            picked.append(value)
+    return picked
+
+
+def _casing(rng, value):
+    return rng.choice((value, value.title(), value.capitalize()))
+
+
+def _worker_profile(rng, user):
+    services = [_casing(rng, service) for service in _pick(rng, SERVICES, rng.choice((0, 1, 2, 2, 3, 3, 4)))]
+    city, state = _pick(rng, CITIES)[0]
+    profile = WorkerProfile(
+        user=user,
+        services=", ".join(services) if rng.random() < 0.1 else services,
+        languages=[_casing(rng, language) for language in _pick(rng, LANGUAGES, rng.choice((0, 1, 1, 2, 2, 3)))],
+        nationality=_pick(rng, NATIONALITIES)[0] if rng.random() < 0.85 else "",
+        city=city if rng.random() < 0.8 else "",
+        state=state if rng.random() < 0.5 else "",
+        country="UAE" if rng.random() < 0.6 else "",
+        experience=rng.choice(("", "1-2 years", "3-5 years", "5+ years")),
+        bio="Hardworking and reliable domestic worker.",
+    )
+    profile.match_features = build_worker_features(profile)
+    for field, value in build_worker_filter_fields(profile).items():
+        setattr(profile, field, value)
+    return profile
+
+
+def _job(rng, employer_id):
+    services = _pick(rng, SERVICES, rng.choice((1, 1, 2, 2, 3)))
+    languages = _pick(rng, LANGUAGES, rng.choice((0, 1, 1, 2)))
+    job_type = _pick(rng, JOB_TYPES)[0]
+    full_time_salary = rng.randrange(1500, 6001, 100) if job_type != "part-time" else None
+    hourly_wage = rng.randrange(25, 61, 5) if job_type == "part-time" else None
+    description = f"Looking for help with {' and '.join(services)}. {rng.choice(FAMILY_DETAILS)}"
+    if languages and rng.random() < 0.5:
+        description += f" Must speak {languages[0].title()}."
+    job = Job(
+        employer_id=employer_id,
+        title=f"{rng.choice(('Experienced', 'Live-in', 'Reliable', 'Part-time'))} {services[0].title()} Needed",
+        description=description,
+        location=_pick(rng, JOB_LOCATIONS)[0],
+        salary=f"AED {full_time_salary}/month" if full_time_salary else f"AED {hourly_wage}/hour",
+        job_type=job_type,
+        full_time_salary=full_time_salary,
+        hourly_wage=hourly_wage,
+        skills_required=[_casing(rng, service) for service in services if rng.random() < 0.7],
+        language_requirements=[language.title() for language in languages if rng.random() < 0.6],
+        preferred_nationality=_pick(rng, NATIONALITIES)[0] if rng.random() < 0.3 else "",
+        accommodation_provided=rng.choice(("Yes", "No", "")),
+        workplace_type=rng.choice(("Villa", "Apartment", "Townhouse")),
+        status="active" if rng.random() < 0.9 else "closed",
+        review_status="approved" if rng.random() < 0.95 else "pending",
+    )
+    job.salary_min, job.salary_max, job.salary_monthly = derive_salary_bounds(job)
+    job.match_features = build_job_features(job)
+    return job
+
+
+def generate_catalog(workers, jobs, seed=0, batch_size=1000):
+    """Insert ``workers`` worker accounts and ``jobs`` jobs; return ``(employer_ids, worker_user_ids)``.
+
+    Callers are expected to run this inside a transaction they roll back.
+    """
+    User = get_user_model()
+    rng = random.Random(seed)
+    prefix = f"bench-{secrets.token_hex(4)}"
+    password = make_password(None)
+
+    employer_count = max(1, jobs // 5)
+    User.objects.bulk_create(
+        [
+            User(email=f"{prefix}-e{index}@example.com", password=password, role="employer")
+            for index in range(employer_count)
+        ],
+        batch_size=batch_size,
+    )
+    User.objects.bulk_create(
+        [
+            User(email=f"{prefix}-w{index}@example.com", password=password, role="worker", first_name=f"Worker{index}")
+            for index in range(workers)
+        ],
+        batch_size=batch_size,
+    )
+    # Reload ids: not every backend returns primary keys from bulk inserts.
+    accounts = User.objects.filter(email__startswith=f"{prefix}-").order_by("id")
+    employer_ids = list(accounts.filter(role="employer").values_list("id", flat=True))
+    worker_accounts = list(accounts.filter(role="worker").only("id", "first_name", "last_name"))
+    worker_ids = [user.id for user in worker_accounts]
+
+    EmployerProfile.objects.bulk_create(
+        [EmployerProfile(user_id=user_id, employer_type="individual") for user_id in employer_ids], batch_size=batch_size
+    )
+    for start in range(0, len(worker_accounts), batch_size):
+        profiles = [_worker_profile(rng, user) for user in worker_accounts[start:start + batch_size]]
+        WorkerProfile.objects.bulk_create(profiles)
+        profile_ids = dict(
+            WorkerProfile.objects.filter(user_id__in=[profile.user_id for profile in profiles]).values_list("user_id", "id")
+        )
+        tokens = []
+        for profile in profiles:
+            profile.pk = profile_ids[profile.user_id]
+            tokens.extend(
+                WorkerMatchToken(profile_id=profile.pk, kind=kind, token=token) for kind, token in build_worker_tokens(profile)
+            )
+        WorkerMatchToken.objects.bulk_create(tokens, batch_size=batch_size)
+        add_match_terms((token.kind, token.token) for token in tokens)
+
+    Job.objects.bulk_create([_job(rng, rng.choice(employer_ids)) for _ in range(jobs)], batch_size=batch_size)
+    return employer_ids, worker_ids
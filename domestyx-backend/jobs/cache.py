@@ -0,0 +1,75 @@
+# jobs/cache.py
+"""Response cache for the public job feed and its facet counts.
+
+Entries are keyed by a feed version plus the normalized query string. Any
+change to a job bumps the version, which orphans every cached page at once;
+stale entries then simply age out of the cache backend.
+
+The version lives in the same backend as the pages. With the default
+per-process LocMemCache a bump only reaches the process that handled the
+write, so other server processes keep serving their anonymous pages for up
+to ``JOB_FEED_CACHE_TIMEOUT`` seconds. That lag is accepted for the public
+feed; deployments that need writes to show up at once across processes set
+``CACHE_BACKEND`` to a shared store.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+FEED_VERSION_KEY = "jobs:public-feed:version"
+
+
+def _cache():
+    return caches[getattr(settings, "JOB_FEED_CACHE_ALIAS", "default")]
+
+
+def _timeout():
+    return getattr(settings, "JOB_FEED_CACHE_TIMEOUT", 300)
+
+
+def job_feed_version():
+    cache = _cache()
+    version = cache.get(FEED_VERSION_KEY)
+    if version is None:
+        # Seed from the clock so a lost counter never reuses an old version.
+        cache.add(FEED_VERSION_KEY, time.time_ns(), None)
+        version = cache.get(FEED_VERSION_KEY)
+    return version
+
+
+def bump_job_feed_version():
+    cache = _cache()
+    try:
+        cache.incr(FEED_VERSION_KEY)
+    except ValueError:
+        cache.set(FEED_VERSION_KEY, time.time_ns(), None)
+
+
+def invalidate_job_feed(using="default"):
+    """Bump the feed version once the surrounding transaction commits."""
+    transaction.on_commit(bump_job_feed_version, using=using)
+
+
+def job_feed_cache_key(request, namespace="public-feed"):
+    """Cache key for ``request``, bound to the feed version current at call time.
+
+    Compute the key before querying so a bump that lands mid-request cannot
+    file stale rows under the new version.
+    """
+    params = request.query_params
+    normalized = sorted((key, value) for key in params for value in params.getlist(key) if value != "")
+    # Pagination links are absolute, so the host is part of the payload.
+    signature = repr((request.get_host(), normalized)).encode()
+    digest = hashlib.md5(signature, usedforsecurity=False).hexdigest()
+    return f"jobs:{namespace}:{job_feed_version()}:{digest}"
+
+
+def get_cached_job_feed(key):
+    return _cache().get(key)
+
+
+def set_cached_job_feed(key, data):
+    _cache().set(key, data, _timeout())
@@ -0,0 +1,79 @@
+# jobs/facets.py
+"""Facet counts for job listings.
+
+Each facet is its own grouped aggregate over the filtered listing (one row
+per distinct value), and the aggregates are combined with UNION ALL so all
+facets still come back in one round trip. The total is the sum of the salary
+buckets, which cover every job exactly once.
+"""
+from django.db.models import Case, CharField, Count, F, Q, Value, When
+
+FACET_FIELDS = ("job_type", "location", "workplace_type", "accommodation_provided")
+FACET_VALUE_LIMIT = 20
+
+# (label, lower bound, upper bound) over salary_max, the highest amount a job states.
+SALARY_BUCKETS = (
+    ("0-1000", 0, 1000),
+    ("1000-2000", 1000, 2000),
+    ("2000-3000", 2000, 3000),
+    ("3000-5000", 3000, 5000),
+    ("5000+", 5000, None),
+)
+UNSPECIFIED_SALARY = "unspecified"
+
+
+def _salary_bucket():
+    whens = []
+    for label, low, high in SALARY_BUCKETS:
+        condition = Q(salary_max__gte=low)
+        if high is not None:
+            condition &= Q(salary_max__lt=high)
+        whens.append(When(condition, then=Value(label)))
+    return Case(*whens, default=Value(UNSPECIFIED_SALARY), output_field=CharField())
+
+
+def _facet_counts(queryset, facet, value):
+    return (
+        queryset.order_by()
+        .annotate(facet=Value(facet, output_field=CharField()), value=value)
+        .values("facet", "value")
+        .annotate(count=Count("id"))
+    )
+
+
+def job_facets(queryset):
+    """Return ``{"total": n, "facets": {...}}`` for the jobs in ``queryset``."""
+    salary_rows = _facet_counts(queryset, "salary", _salary_bucket())
+    rows = salary_rows.union(
+        *(_facet_counts(queryset, field, F(field)) for field in FACET_FIELDS),
+        all=True,
+    )
+
+    counts = {field: {} for field in FACET_FIELDS}
+    salary_counts = {}
+    for row in rows:
+        if row["facet"] == "salary":
+            salary_counts[row["value"]] = row["count"]
+            continue
+        # Values differing only in surrounding whitespace are one facet value.
+        value = (row["value"] or "").strip()
+        if value:
+            counts[row["facet"]][value] = counts[row["facet"]].get(value, 0) + row["count"]
+
+    facets = {
+        field: [
+            {"value": value, "count": count}
+            for value, count in sorted(values.items(), key=lambda item: (-item[1], item[0]))[:FACET_VALUE_LIMIT]
+        ]
+        for field, values in counts.items()
+    }
+    facets["salary"] = [
+        {"value": label, "min": low, "max": high, "count": salary_counts[label]}
+        for label, low, high in SALARY_BUCKETS
+        if label in salary_counts
+    ]
+    if UNSPECIFIED_SALARY in salary_counts:
+        facets["salary"].append(
+            {"value": UNSPECIFIED_SALARY, "min": None, "max": None, "count": salary_counts[UNSPECIFIED_SALARY]}
+        )
+    return {"total": sum(salary_counts.values()), "facets": facets}
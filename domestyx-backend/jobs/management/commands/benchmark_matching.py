@@ -0,0 +1,213 @@
+import json
+import math
+import platform
+import random
+import statistics
+import subprocess
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from jobs import matching
+from jobs.benchmark import generate_catalog
+from jobs.matching import job_features, score_features, score_matrix, worker_features
+from jobs.models import Job
+from jobs.recommendations import rescore_job, rescore_worker
+from users.models import WorkerProfile
+
+# Jobs scored against the catalog's workers in the scoring benchmarks.
+SCORING_JOBS = 20
+# Cap on workers for the pure-Python per-pair scorer, which is orders of magnitude slower.
+SCORE_FEATURES_MAX_WORKERS = 5000
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _size(value):
+    value = value.strip().lower()
+    try:
+        return int(float(value[:-1]) * 1000) if value.endswith("k") else int(value)
+    except ValueError:
+        raise CommandError(f"Invalid size: {value!r}.")
+
+
+def _timings(seconds):
+    if not seconds:
+        return None
+    milliseconds = sorted(value * 1000 for value in seconds)
+    return {
+        "runs": len(milliseconds),
+        "median_ms": round(statistics.median(milliseconds), 3),
+        "p95_ms": round(milliseconds[math.ceil(0.95 * len(milliseconds)) - 1], 3),
+        "max_ms": round(milliseconds[-1], 3),
+    }
+
+
+def _throughput(pairs, seconds):
+    return {"pairs": pairs, "seconds": round(seconds, 4), "pairs_per_second": round(pairs / seconds) if seconds else None}
+
+
+def _commit():
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark job/worker matching against synthetic catalogs and print a JSON report. "
+        "Catalogs are generated inside a transaction that is rolled back; run it against a scratch database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="1k",
+            help="Comma-separated worker counts to benchmark, e.g. 1k,10k,100k.",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=None,
+            help="Jobs per catalog (default: a tenth of the worker count, at least 10).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=10,
+            help="Requests timed per endpoint and size.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed for the synthetic catalogs.",
+        )
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="Write the JSON report to this file instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        sizes = [_size(value) for value in options["sizes"].split(",") if value.strip()]
+        repeat = options["repeat"]
+        if not sizes or min(sizes) < 1 or repeat < 1:
+            raise CommandError("--sizes and --repeat must be positive.")
+
+        report = {
+            "commit": _commit(),
+            "created_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "database": connection.vendor,
+            "numpy": matching.np is not None,
+            "seed": options["seed"],
+            "repeat": repeat,
+            "results": [],
+        }
+        setup_test_environment()
+        try:
+            for size in sizes:
+                jobs = options["jobs"] or max(10, size // 10)
+                self.stderr.write(f"Benchmarking {size} workers x {jobs} jobs...")
+                try:
+                    with transaction.atomic():
+                        report["results"].append(self._benchmark(size, jobs, options["seed"], repeat))
+                        raise _Rollback
+                except _Rollback:
+                    pass
+        finally:
+            teardown_test_environment()
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                handle.write(output + "\n")
+            self.stderr.write(self.style.SUCCESS(f"Wrote benchmark report to {options['output']}."))
+        else:
+            self.stdout.write(output)
+
+    def _benchmark(self, size, job_count, seed, repeat):
+        rng = random.Random(seed)
+        started = time.perf_counter()
+        generate_catalog(size, job_count, seed=seed)
+        result = {"workers": size, "jobs": job_count, "generate_seconds": round(time.perf_counter() - started, 3)}
+
+        User = get_user_model()
+        listable = Job.objects.filter(status="active", review_status="approved")
+        listable_ids = list(listable.values_list("id", flat=True))
+        profiles = list(WorkerProfile.objects.filter(user__role="worker").only("id", "user_id", "match_features"))
+        scoring_ids = rng.sample(listable_ids, min(SCORING_JOBS, len(listable_ids)))
+        sample_jobs = [job_features(job) for job in Job.objects.filter(pk__in=scoring_ids)]
+        workers = [worker_features(profile) for profile in profiles]
+
+        started = time.perf_counter()
+        for job in sample_jobs:
+            for worker in workers[:SCORE_FEATURES_MAX_WORKERS]:
+                score_features(job, worker)
+        result["score_features"] = _throughput(
+            len(sample_jobs) * len(workers[:SCORE_FEATURES_MAX_WORKERS]), time.perf_counter() - started
+        )
+        started = time.perf_counter()
+        score_matrix(sample_jobs, workers)
+        result["score_matrix"] = _throughput(len(sample_jobs) * len(workers), time.perf_counter() - started)
+
+        # Materializes JobMatch rows for the sampled workers, which recommended_jobs then reads.
+        worker_sample = rng.sample(profiles, min(repeat, len(profiles)))
+        seconds = []
+        for profile in WorkerProfile.objects.select_related("user").filter(pk__in=[p.pk for p in worker_sample]):
+            started = time.perf_counter()
+            rescore_worker(profile)
+            seconds.append(time.perf_counter() - started)
+        result["rescore_worker"] = _timings(seconds)
+
+        workers_by_id = User.objects.in_bulk([profile.user_id for profile in worker_sample])
+        result["recommended_jobs"] = self._endpoint(
+            [(workers_by_id[profile.user_id], "/worker/recommended-jobs/") for profile in worker_sample]
+        )
+
+        job_ids = rng.sample(listable_ids, min(repeat, len(listable_ids)))
+        job_sample = list(Job.objects.select_related("employer").filter(pk__in=job_ids))
+        result["recommended_workers"] = self._endpoint(
+            [(job.employer, f"/employer/jobs/{job.id}/recommended-workers/") for job in job_sample]
+        )
+
+        seconds = []
+        for job in job_sample:
+            started = time.perf_counter()
+            rescore_job(job)
+            seconds.append(time.perf_counter() - started)
+        result["rescore_job"] = _timings(seconds)
+        return result
+
+    def _endpoint(self, requests):
+        """Time GET requests made as ``(user, path)`` pairs through the test client, after one warm-up request."""
+        if not requests:
+            return None
+        client = APIClient()
+        client.force_authenticate(requests[0][0])
+        client.get(requests[0][1])
+
+        seconds, queries = [], []
+        for user, path in requests:
+            client.force_authenticate(user)
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = client.get(path)
+                seconds.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                raise CommandError(f"GET {path} returned {response.status_code}.")
+            queries.append(len(captured))
+        return {**_timings(seconds), "queries_median": statistics.median(queries), "queries_max": max(queries)}
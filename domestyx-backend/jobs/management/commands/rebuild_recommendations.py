@@ -0,0 +1,182 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone
+
+from jobs.matching import add_match_terms, build_job_features, build_worker_features, build_worker_tokens
+from jobs.recommendations import match_rows, rescore_job
+
+# Models are imported inside functions: with the "spawn" start method pool
+# processes import this module before Django is set up.
+_jobs = None
+
+
+def _init_process():
+    global _jobs
+    if not apps.ready:
+        import django
+
+        django.setup()
+    from jobs.models import Job
+
+    _jobs = list(Job.objects.filter(status="active", review_status="approved").only("id", "posted_at", "match_features"))
+
+
+def _score_chunk(task):
+    """Score one chunk of workers against every listable job; runs in a pool process."""
+    from users.models import WorkerProfile
+
+    user_ids, rebuild_features = task
+    profiles = WorkerProfile.objects.filter(user_id__in=user_ids)
+    if rebuild_features:
+        profiles = list(profiles)
+        tokens = [(profile.pk, kind, token) for profile in profiles for kind, token in build_worker_tokens(profile)]
+        for profile in profiles:
+            profile.match_features = build_worker_features(profile)
+        features = [(profile.pk, profile.match_features) for profile in profiles]
+    else:
+        profiles = list(profiles.only("id", "user_id", "match_features"))
+        tokens = features = None
+    rows = [(match.worker_id, match.job_id, match.score, match.posted_at) for match in match_rows(_jobs, profiles)]
+    return user_ids, rows, features, tokens
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized job recommendations (JobMatch) for every worker."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes scoring chunks in parallel (1 scores in this process).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of workers scored and written per chunk.",
+        )
+        parser.add_argument(
+            "--resume-after",
+            type=int,
+            default=None,
+            help="Skip workers with a user id up to and including this one, as reported by an interrupted run.",
+        )
+        parser.add_argument(
+            "--features",
+            action="store_true",
+            help="Also recompute stored match features and the worker token index.",
+        )
+
+    def handle(self, *args, **options):
+        from jobs.models import JobMatch
+        from users.models import WorkerProfile
+
+        workers = options["workers"]
+        chunk_size = options["chunk_size"]
+        resume_after = options["resume_after"]
+        rebuild_features = options["features"]
+        if workers < 1 or chunk_size < 1:
+            raise CommandError("--workers and --chunk-size must be at least 1.")
+
+        # Chunks are scored against a snapshot of the listable jobs, so jobs saved after this
+        # point are rescored once every chunk is written.
+        started = timezone.now()
+        if rebuild_features and resume_after is None:
+            self._rebuild_job_features(chunk_size)
+
+        worker_profiles = WorkerProfile.objects.filter(user__role="worker")
+        if resume_after is None:
+            # Drop matches left behind by users who are no longer workers.
+            JobMatch.objects.exclude(worker_id__in=worker_profiles.values("user_id")).delete()
+        else:
+            worker_profiles = worker_profiles.filter(user_id__gt=resume_after)
+
+        user_ids = list(worker_profiles.order_by("user_id").values_list("user_id", flat=True))
+        chunks = [user_ids[start:start + chunk_size] for start in range(0, len(user_ids), chunk_size)]
+        tasks = [(chunk, rebuild_features) for chunk in chunks]
+        self.stdout.write(f"Rebuilding recommendations for {len(user_ids)} workers in {len(chunks)} chunks.")
+
+        done = 0
+        last_user_id = resume_after
+        try:
+            if workers == 1 or len(chunks) <= 1:
+                _init_process()
+                results = map(_score_chunk, tasks)
+                for result in results:
+                    done, last_user_id = self._write_chunk(result, done, len(user_ids))
+            else:
+                # Pool processes open their own connections instead of sharing this one.
+                connections.close_all()
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_process) as pool:
+                    # map() yields in submission order, so every chunk up to the last
+                    # written one is complete and --resume-after stays correct.
+                    for result in pool.map(_score_chunk, tasks):
+                        done, last_user_id = self._write_chunk(result, done, len(user_ids))
+        except (Exception, KeyboardInterrupt):
+            if last_user_id is not None:
+                self.stderr.write(f"Interrupted; resume with --resume-after {last_user_id}.")
+            raise
+
+        changed = self._rescore_changed_jobs(started)
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt recommendations for {done} workers; rescored {changed} jobs changed during the run.")
+        )
+
+    def _write_chunk(self, result, done, total):
+        from jobs.models import Job, JobMatch, WorkerMatchToken
+        from users.models import WorkerProfile
+
+        user_ids, rows, features, tokens = result
+        # Jobs deleted since the snapshot would fail the foreign key.
+        existing = set(Job.objects.filter(pk__in={row[1] for row in rows}).values_list("id", flat=True))
+        rows = [row for row in rows if row[1] in existing]
+        with transaction.atomic():
+            if features is not None:
+                WorkerProfile.objects.bulk_update(
+                    [WorkerProfile(pk=pk, match_features=value) for pk, value in features], ["match_features"]
+                )
+                WorkerMatchToken.objects.filter(profile_id__in=[pk for pk, _ in features]).delete()
+                WorkerMatchToken.objects.bulk_create(
+                    [WorkerMatchToken(profile_id=pk, kind=kind, token=token) for pk, kind, token in tokens],
+                    batch_size=1000,
+                )
+                add_match_terms((kind, token) for _, kind, token in tokens)
+            JobMatch.objects.filter(worker_id__in=user_ids).delete()
+            JobMatch.objects.bulk_create(
+                [
+                    JobMatch(worker_id=worker_id, job_id=job_id, score=score, posted_at=posted_at)
+                    for worker_id, job_id, score, posted_at in rows
+                ],
+                batch_size=1000,
+            )
+
+        done += len(user_ids)
+        self.stdout.write(f"{done}/{total} workers, {len(rows)} matches written (through user id {user_ids[-1]}).")
+        return done, user_ids[-1]
+
+    def _rescore_changed_jobs(self, started):
+        from jobs.models import Job
+
+        changed = 0
+        for job in Job.objects.filter(updated_at__gte=started).iterator():
+            rescore_job(job)
+            changed += 1
+        return changed
+
+    def _rebuild_job_features(self, chunk_size):
+        from jobs.models import Job
+
+        batch = []
+        for job in Job.objects.iterator(chunk_size=chunk_size):
+            job.match_features = build_job_features(job)
+            batch.append(job)
+            if len(batch) >= chunk_size:
+                Job.objects.bulk_update(batch, ["match_features"])
+                batch = []
+        if batch:
+            Job.objects.bulk_update(batch, ["match_features"])
+        self.stdout.write("Rebuilt job match features.")
@@ -0,0 +1,56 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.models import UserStats
+from jobs.stats import STAT_FIELDS, compute_user_stats, save_user_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute every user's UserStats row from applications, offers and reviews."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of users recomputed per batch.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report missing and out-of-date rows without writing them.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        dry_run = options["dry_run"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        user_ids = list(get_user_model().objects.order_by("id").values_list("id", flat=True))
+        missing = stale = 0
+        for start in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[start:start + chunk_size]
+            stats = compute_user_stats(chunk)
+            existing = UserStats.objects.in_bulk(chunk)
+            changed = {}
+            for user_id, values in stats.items():
+                row = existing.get(user_id)
+                if row is None:
+                    if not any(values.values()):
+                        # Readers treat a missing row as all zeros.
+                        continue
+                    missing += 1
+                elif any(getattr(row, field) != values[field] for field in STAT_FIELDS):
+                    stale += 1
+                else:
+                    continue
+                changed[user_id] = values
+            if changed and not dry_run:
+                save_user_stats(changed)
+
+        summary = f"{len(user_ids)} users checked, {missing} rows missing, {stale} rows out of date."
+        if dry_run:
+            self.stdout.write(self.style.WARNING(f"Dry run: {summary}"))
+            return
+        self.stdout.write(self.style.SUCCESS(f"Reconciled user stats: {summary}"))
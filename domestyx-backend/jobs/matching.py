@@ -0,0 +1,274 @@
+# jobs/matching.py
+"""Job/worker matching: precomputed features, scoring and candidate generation.
+
+Jobs and worker profiles persist their normalized match inputs in
+``match_features`` on save, so scoring a pair is a handful of set operations
+over prebuilt data.
+
+Every worker profile is also indexed in ``WorkerMatchToken`` by its normalized
+services, languages, nationality and location parts. A worker can only score
+above zero for a job if one of those tokens appears in the job (as a required
+skill or language, the preferred nationality, or a substring of the job text
+or location), so recommendations only need to score the workers returned by
+``candidate_profile_ids`` instead of every worker on the platform. The
+distinct service, language and location tokens are kept in ``MatchTerm``,
+the vocabulary the job text is matched against; it lives in the database
+rather than a cache so every process sees a newly indexed term as soon as
+the worker's transaction commits.
+
+Substring rules over large term sets (the whole token vocabulary, or every
+worker in a batch) go through ``find_terms``, which runs a cached
+Aho-Corasick automaton over the job text once instead of testing each term.
+
+``score_matrix`` scores many jobs against many workers at once: it encodes
+both sides against a shared vocabulary and computes all scores as matrix
+products with NumPy, which is a deployment requirement. The per-pair
+``score_features`` fallback only keeps the module usable where NumPy cannot
+be installed, at the per-pair cost.
+"""
+from functools import lru_cache
+
+from django.db.models import Q
+
+from .automaton import TermMatcher
+from .search import fold
+
+try:
+    import numpy as np
+except ImportError:  # Listed in requirements.txt; score_matrix falls back to pure Python without it.
+    np = None
+
+SERVICE = "service"
+LANGUAGE = "language"
+NATIONALITY = "nationality"
+LOCATION = "location"
+MATCH_TOKEN_KINDS = (SERVICE, LANGUAGE, NATIONALITY, LOCATION)
+# Kinds matched as substrings of the job, which need the whole indexed vocabulary.
+VOCABULARY_KINDS = (SERVICE, LANGUAGE, LOCATION)
+MAX_MATCH_TOKEN_LENGTH = 128
+# Below this many terms, plain ``in`` checks beat walking the text in Python.
+AUTOMATON_MIN_TERMS = 32
+
+WORKER_MATCH_FIELDS = frozenset({"services", "languages", "nationality", "city", "state", "country"})
+JOB_MATCH_FIELDS = frozenset(
+    {"title", "description", "location", "skills_required", "language_requirements", "preferred_nationality"}
+)
+
+
+def normalize_list(value):
+    if isinstance(value, list):
+        return [str(item).strip().lower() for item in value if str(item).strip()]
+    if isinstance(value, str):
+        return [item.strip().lower() for item in value.split(",") if item.strip()]
+    return []
+
+
+@lru_cache(maxsize=16)
+def _term_matcher(terms):
+    return TermMatcher(terms)
+
+
+def find_terms(terms, text):
+    """Return the members of the frozenset ``terms`` that occur in ``text`` as substrings."""
+    if len(terms) < AUTOMATON_MIN_TERMS:
+        return {term for term in terms if term in text}
+    return _term_matcher(terms).find(text)
+
+
+def _clip(token):
+    # Folding (see jobs.search.fold) keeps collation-equivalent spellings from colliding on
+    # the index's unique key; it and clipping only ever widen a match, so candidates stay a
+    # superset of scoring workers.
+    return fold(token)[:MAX_MATCH_TOKEN_LENGTH]
+
+
+def build_job_features(job):
+    """JSON-serializable match inputs for ``job``, stored in ``Job.match_features``."""
+    return {
+        "text": f"{job.title} {job.description}".lower(),
+        "location": (job.location or "").lower(),
+        "skills": sorted(set(normalize_list(job.skills_required))),
+        "languages": sorted(set(normalize_list(job.language_requirements))),
+        "nationality": (job.preferred_nationality or "").strip().lower(),
+    }
+
+
+def build_worker_features(profile):
+    """JSON-serializable match inputs for ``profile``, stored in ``WorkerProfile.match_features``."""
+    return {
+        "services": sorted(set(normalize_list(profile.services))),
+        "languages": sorted(set(normalize_list(profile.languages))),
+        "nationality": (profile.nationality or "").strip().lower(),
+        "locations": sorted({part.lower() for part in (profile.city, profile.state, profile.country) if part}),
+    }
+
+
+def job_features(job):
+    features = getattr(job, "match_features", None) or build_job_features(job)
+    return {
+        "text": features["text"],
+        "location": features["location"],
+        "skills": frozenset(features["skills"]),
+        "languages": frozenset(features["languages"]),
+        "nationality": features["nationality"],
+    }
+
+
+def worker_features(profile):
+    features = getattr(profile, "match_features", None) or build_worker_features(profile)
+    return {
+        "services": frozenset(features["services"]),
+        "languages": frozenset(features["languages"]),
+        "nationality": features["nationality"],
+        "locations": features["locations"],
+    }
+
+
+def score_features(job, worker):
+    """Match score for a pair of ``job_features`` / ``worker_features`` results."""
+    text = job["text"]
+    score = sum(1 for service in worker["services"] if service in text)
+    score += min(sum(1 for language in worker["languages"] if language in text), 2)
+    score += 2 * len(worker["services"] & job["skills"])
+    score += len(worker["languages"] & job["languages"])
+    if job["nationality"] and job["nationality"] == worker["nationality"]:
+        score += 2
+    if any(part in job["location"] for part in worker["locations"]):
+        score += 2
+    return score
+
+
+def score_matrix(jobs, workers):
+    """Score every pair of ``jobs`` x ``workers`` (``job_features`` / ``worker_features`` results).
+
+    Returns one row per job, indexable as ``scores[job_index][worker_index]``:
+    a 2-D integer array when NumPy is available, nested lists otherwise.
+    Results are identical to calling ``score_features`` on each pair.
+    """
+    if np is None:
+        return [[score_features(job, worker) for worker in workers] for job in jobs]
+    if not jobs or not workers:
+        return np.zeros((len(jobs), len(workers)), dtype=np.int64)
+
+    services, worker_services = _encode(workers, "services")
+    languages, worker_languages = _encode(workers, "languages")
+    locations, worker_locations = _encode(workers, "locations")
+    nationalities = {}
+    worker_nationalities = np.array(
+        [nationalities.setdefault(w["nationality"], len(nationalities)) if w["nationality"] else -2 for w in workers]
+    )
+
+    service_terms, language_terms, location_terms = frozenset(services), frozenset(languages), frozenset(locations)
+    service_hits = np.zeros((len(jobs), len(services)), dtype=np.float32)
+    language_text_hits = np.zeros((len(jobs), len(languages)), dtype=np.float32)
+    language_required_hits = np.zeros((len(jobs), len(languages)), dtype=np.float32)
+    location_hits = np.zeros((len(jobs), len(locations)), dtype=np.float32)
+    job_nationalities = np.full(len(jobs), -1)
+    for row, job in enumerate(jobs):
+        # A service found in the text scores 1, as a required skill 2 more.
+        for token in find_terms(service_terms, job["text"]):
+            service_hits[row, services[token]] += 1
+        for token in job["skills"] & service_terms:
+            service_hits[row, services[token]] += 2
+        for token in find_terms(language_terms, job["text"]):
+            language_text_hits[row, languages[token]] = 1
+        for token in job["languages"] & language_terms:
+            language_required_hits[row, languages[token]] = 1
+        for token in find_terms(location_terms, job["location"]):
+            location_hits[row, locations[token]] = 1
+        if job["nationality"]:
+            job_nationalities[row] = nationalities.get(job["nationality"], -1)
+
+    scores = service_hits @ worker_services.T
+    scores += np.minimum(language_text_hits @ worker_languages.T, 2)
+    scores += language_required_hits @ worker_languages.T
+    scores += 2 * (job_nationalities[:, None] == worker_nationalities[None, :])
+    scores += 2 * ((location_hits @ worker_locations.T) > 0)
+    return np.rint(scores).astype(np.int64)
+
+
+def _encode(workers, key):
+    vocabulary = {}
+    cells = [[vocabulary.setdefault(token, len(vocabulary)) for token in worker[key]] for worker in workers]
+    matrix = np.zeros((len(workers), len(vocabulary)), dtype=np.float32)
+    for row, columns in enumerate(cells):
+        matrix[row, columns] = 1
+    return vocabulary, matrix
+
+
+def build_worker_tokens(profile):
+    features = build_worker_features(profile)
+    tokens = {(SERVICE, _clip(service)) for service in features["services"]}
+    tokens |= {(LANGUAGE, _clip(language)) for language in features["languages"]}
+    if features["nationality"]:
+        tokens.add((NATIONALITY, _clip(features["nationality"])))
+    for part in features["locations"]:
+        part = part.strip()
+        if part:
+            tokens.add((LOCATION, _clip(part)))
+    return tokens
+
+
+def index_worker_profile(profile, using="default"):
+    from .models import WorkerMatchToken
+
+    tokens = build_worker_tokens(profile)
+    WorkerMatchToken.objects.using(using).filter(profile_id=profile.pk).delete()
+    WorkerMatchToken.objects.using(using).bulk_create(
+        [WorkerMatchToken(profile_id=profile.pk, kind=kind, token=token) for kind, token in tokens]
+    )
+    add_match_terms(tokens, using)
+
+
+def add_match_terms(tokens, using="default"):
+    """Record the vocabulary terms among the ``(kind, token)`` pairs ``tokens``."""
+    from .models import MatchTerm
+
+    terms = {(kind, token) for kind, token in tokens if kind in VOCABULARY_KINDS}
+    if terms:
+        MatchTerm.objects.using(using).bulk_create(
+            [MatchTerm(kind=kind, token=token) for kind, token in terms], batch_size=1000, ignore_conflicts=True
+        )
+
+
+def job_match_tokens(features, vocabulary):
+    """Return the ``(kind, token)`` pairs a worker needs at least one of to score above zero.
+
+    ``features`` comes from ``job_features``; ``vocabulary`` is the set of
+    indexed ``(kind, token)`` pairs, used to resolve the substring rules
+    against the job's text and location.
+    """
+    tokens = {(SERVICE, _clip(skill)) for skill in features["skills"]}
+    tokens |= {(LANGUAGE, _clip(language)) for language in features["languages"]}
+    if features["nationality"]:
+        tokens.add((NATIONALITY, _clip(features["nationality"])))
+
+    text_terms = frozenset(token for kind, token in vocabulary if kind in (SERVICE, LANGUAGE))
+    for token in find_terms(text_terms, fold(features["text"])):
+        tokens |= {(kind, token) for kind in (SERVICE, LANGUAGE) if (kind, token) in vocabulary}
+    location_terms = frozenset(token for kind, token in vocabulary if kind == LOCATION)
+    tokens |= {(LOCATION, token) for token in find_terms(location_terms, fold(features["location"]))}
+    return tokens
+
+
+def match_vocabulary(using="default"):
+    """Every indexed ``(kind, token)`` pair of the substring-matched kinds (see ``MatchTerm``)."""
+    from .models import MatchTerm
+
+    return frozenset(MatchTerm.objects.using(using).values_list("kind", "token"))
+
+
+def candidate_profile_ids(job, using="default"):
+    """Queryset of ids of worker profiles that share at least one match token with ``job``."""
+    from .models import WorkerMatchToken
+
+    by_kind = {}
+    for kind, token in job_match_tokens(job_features(job), match_vocabulary(using)):
+        by_kind.setdefault(kind, set()).add(token)
+    if not by_kind:
+        return WorkerMatchToken.objects.none().values("profile_id")
+
+    condition = Q()
+    for kind, tokens in by_kind.items():
+        condition |= Q(kind=kind, token__in=tokens)
+    return WorkerMatchToken.objects.using(using).filter(condition).values("profile_id").distinct()
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0011_employerreview'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64)),
+                ('weight', models.PositiveIntegerField(default=0)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['token', 'job'], name='jobs_jobsea_token_b88e6e_idx')],
+                'unique_together': {('job', 'token')},
+            },
+        ),
+    ]
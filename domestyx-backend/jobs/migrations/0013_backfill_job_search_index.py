@@ -0,0 +1,71 @@
+import re
+import unicodedata
+
+from django.db import migrations
+
+POSTGRES_SEARCH_INDEX = "jobs_job_search_gin"
+
+# Frozen copy of the jobs.search tokenizer as of this migration.
+TOKEN_RE = re.compile(r"[^\W_]+")
+MAX_TOKEN_LENGTH = 64
+SEARCH_FIELD_WEIGHTS = (("title", 3), ("location", 2), ("description", 1))
+
+
+def fold(text):
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def build_job_tokens(job):
+    weights = {}
+    for field, weight in SEARCH_FIELD_WEIGHTS:
+        for token in TOKEN_RE.findall(fold(getattr(job, field, ""))):
+            token = token[:MAX_TOKEN_LENGTH]
+            weights[token] = weights.get(token, 0) + weight
+    return weights
+
+
+def build_job_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        # Must match jobs.search.job_search_vector() so the planner can use it.
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {POSTGRES_SEARCH_INDEX} ON jobs_job USING GIN (("
+            "(setweight(to_tsvector('simple'::regconfig, COALESCE(title, '')), 'A') || "
+            "setweight(to_tsvector('simple'::regconfig, COALESCE(location, '')), 'B')) || "
+            "setweight(to_tsvector('simple'::regconfig, COALESCE(description, '')), 'C')"
+            "))"
+        )
+        return
+
+    Job = apps.get_model("jobs", "Job")
+    JobSearchToken = apps.get_model("jobs", "JobSearchToken")
+    db_alias = connection.alias
+    JobSearchToken.objects.using(db_alias).all().delete()
+    batch = []
+    for job in Job.objects.using(db_alias).only("id", "title", "location", "description").iterator():
+        batch.extend(
+            JobSearchToken(job_id=job.id, token=token, weight=weight)
+            for token, weight in build_job_tokens(job).items()
+        )
+        if len(batch) >= 1000:
+            JobSearchToken.objects.using(db_alias).bulk_create(batch)
+            batch = []
+    if batch:
+        JobSearchToken.objects.using(db_alias).bulk_create(batch)
+
+
+def drop_job_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {POSTGRES_SEARCH_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0012_jobsearchtoken"),
+    ]
+
+    operations = [
+        migrations.RunPython(build_job_search_index, drop_job_search_index),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0013_backfill_job_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'review_status', 'posted_at', 'id'], name='jobs_job_status_80e727_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['employer', 'posted_at', 'id'], name='jobs_job_employe_39699f_idx'),
+        ),
+    ]
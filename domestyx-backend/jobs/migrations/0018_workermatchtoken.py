@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0017_application_updated_at_job_updated_at_and_more'),
+        ('users', '0015_customuser_deactivated_at_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkerMatchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('service', 'Service'), ('language', 'Language'), ('nationality', 'Nationality'), ('location', 'Location')], max_length=20)),
+                ('token', models.CharField(max_length=128)),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='match_tokens', to='users.workerprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'token', 'profile'], name='jobs_worker_kind_01efa4_idx')],
+                'unique_together': {('profile', 'kind', 'token')},
+            },
+        ),
+    ]
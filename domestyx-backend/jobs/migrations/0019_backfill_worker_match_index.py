@@ -0,0 +1,68 @@
+import unicodedata
+
+from django.db import migrations
+
+# Frozen copy of the jobs.matching tokenizer as of this migration.
+MAX_MATCH_TOKEN_LENGTH = 128
+
+
+def fold(text):
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def normalize_list(value):
+    if isinstance(value, list):
+        return [str(item).strip().lower() for item in value if str(item).strip()]
+    if isinstance(value, str):
+        return [item.strip().lower() for item in value.split(",") if item.strip()]
+    return []
+
+
+def _clip(token):
+    return fold(token)[:MAX_MATCH_TOKEN_LENGTH]
+
+
+def build_worker_tokens(profile):
+    tokens = {("service", _clip(service)) for service in normalize_list(profile.services)}
+    tokens |= {("language", _clip(language)) for language in normalize_list(profile.languages)}
+    nationality = (profile.nationality or "").strip().lower()
+    if nationality:
+        tokens.add(("nationality", _clip(nationality)))
+    for part in (profile.city, profile.state, profile.country):
+        part = (part or "").strip().lower()
+        if part:
+            tokens.add(("location", _clip(part)))
+    return tokens
+
+
+def build_worker_match_index(apps, schema_editor):
+    WorkerProfile = apps.get_model("users", "WorkerProfile")
+    WorkerMatchToken = apps.get_model("jobs", "WorkerMatchToken")
+    db_alias = schema_editor.connection.alias
+    WorkerMatchToken.objects.using(db_alias).all().delete()
+    batch = []
+    profiles = WorkerProfile.objects.using(db_alias).only(
+        "id", "services", "languages", "nationality", "city", "state", "country"
+    )
+    for profile in profiles.iterator():
+        batch.extend(
+            WorkerMatchToken(profile_id=profile.id, kind=kind, token=token)
+            for kind, token in build_worker_tokens(profile)
+        )
+        if len(batch) >= 1000:
+            WorkerMatchToken.objects.using(db_alias).bulk_create(batch)
+            batch = []
+    if batch:
+        WorkerMatchToken.objects.using(db_alias).bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0018_workermatchtoken"),
+    ]
+
+    operations = [
+        migrations.RunPython(build_worker_match_index, migrations.RunPython.noop),
+    ]
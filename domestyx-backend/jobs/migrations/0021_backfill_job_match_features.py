@@ -0,0 +1,48 @@
+from django.db import migrations
+
+
+# Frozen copy of jobs.matching as of this migration.
+def normalize_list(value):
+    if isinstance(value, list):
+        return [str(item).strip().lower() for item in value if str(item).strip()]
+    if isinstance(value, str):
+        return [item.strip().lower() for item in value.split(",") if item.strip()]
+    return []
+
+
+def build_job_features(job):
+    return {
+        "text": f"{job.title} {job.description}".lower(),
+        "location": (job.location or "").lower(),
+        "skills": sorted(set(normalize_list(job.skills_required))),
+        "languages": sorted(set(normalize_list(job.language_requirements))),
+        "nationality": (job.preferred_nationality or "").strip().lower(),
+    }
+
+
+def backfill_job_match_features(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    db_alias = schema_editor.connection.alias
+    batch = []
+    jobs = Job.objects.using(db_alias).only(
+        "id", "title", "description", "location", "skills_required", "language_requirements", "preferred_nationality"
+    )
+    for job in jobs.iterator():
+        job.match_features = build_job_features(job)
+        batch.append(job)
+        if len(batch) >= 500:
+            Job.objects.using(db_alias).bulk_update(batch, ["match_features"])
+            batch = []
+    if batch:
+        Job.objects.using(db_alias).bulk_update(batch, ["match_features"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0020_job_match_features"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_job_match_features, migrations.RunPython.noop),
+    ]
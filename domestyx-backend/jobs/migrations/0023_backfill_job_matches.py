@@ -0,0 +1,86 @@
+from django.db import migrations
+
+
+# Frozen copy of the jobs.matching scorer as of this migration, over the stored match_features.
+def job_features(job):
+    features = job.match_features
+    return {
+        "text": features["text"],
+        "location": features["location"],
+        "skills": frozenset(features["skills"]),
+        "languages": frozenset(features["languages"]),
+        "nationality": features["nationality"],
+    }
+
+
+def worker_features(profile):
+    features = profile.match_features
+    return {
+        "services": frozenset(features["services"]),
+        "languages": frozenset(features["languages"]),
+        "nationality": features["nationality"],
+        "locations": features["locations"],
+    }
+
+
+def score_features(job, worker):
+    text = job["text"]
+    score = sum(1 for service in worker["services"] if service in text)
+    score += min(sum(1 for language in worker["languages"] if language in text), 2)
+    score += 2 * len(worker["services"] & job["skills"])
+    score += len(worker["languages"] & job["languages"])
+    if job["nationality"] and job["nationality"] == worker["nationality"]:
+        score += 2
+    if any(part in job["location"] for part in worker["locations"]):
+        score += 2
+    return score
+
+
+def backfill_job_matches(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    JobMatch = apps.get_model("jobs", "JobMatch")
+    WorkerProfile = apps.get_model("users", "WorkerProfile")
+    db_alias = schema_editor.connection.alias
+
+    jobs = list(
+        Job.objects.using(db_alias)
+        .filter(status="active", review_status="approved")
+        .only("id", "posted_at", "match_features")
+    )
+    if not jobs:
+        return
+    features = [job_features(job) for job in jobs]
+    profiles = WorkerProfile.objects.using(db_alias).filter(user__role="worker").only("id", "user_id", "match_features")
+
+    JobMatch.objects.using(db_alias).all().delete()
+    chunk = []
+    for profile in profiles.iterator(chunk_size=500):
+        chunk.append(profile)
+        if len(chunk) >= 500:
+            _store(JobMatch, db_alias, jobs, features, chunk)
+            chunk = []
+    if chunk:
+        _store(JobMatch, db_alias, jobs, features, chunk)
+
+
+def _store(JobMatch, db_alias, jobs, features, profiles):
+    workers = [worker_features(profile) for profile in profiles]
+    rows = []
+    for job, job_feature in zip(jobs, features):
+        for profile, worker in zip(profiles, workers):
+            score = score_features(job_feature, worker)
+            if score > 0:
+                rows.append(JobMatch(worker_id=profile.user_id, job_id=job.id, score=score, posted_at=job.posted_at))
+    JobMatch.objects.using(db_alias).bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0022_jobmatch"),
+        ("users", "0017_backfill_workerprofile_match_features"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_job_matches, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0023_backfill_job_matches'),
+        ('users', '0021_backfill_workerprofile_search_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('applications_count', models.PositiveIntegerField(default=0)),
+                ('hires_count', models.PositiveIntegerField(default=0)),
+                ('offers_received_count', models.PositiveIntegerField(default=0)),
+                ('offers_accepted_count', models.PositiveIntegerField(default=0)),
+                ('offer_responses_count', models.PositiveIntegerField(default=0)),
+                ('offer_response_seconds', models.PositiveBigIntegerField(default=0)),
+                ('worker_reviews_count', models.PositiveIntegerField(default=0)),
+                ('worker_rating_sum', models.PositiveIntegerField(default=0)),
+                ('applications_received_count', models.PositiveIntegerField(default=0)),
+                ('hires_made_count', models.PositiveIntegerField(default=0)),
+                ('offers_sent_count', models.PositiveIntegerField(default=0)),
+                ('employer_reviews_count', models.PositiveIntegerField(default=0)),
+                ('employer_rating_sum', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
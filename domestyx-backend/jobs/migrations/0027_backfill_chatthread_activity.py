@@ -0,0 +1,41 @@
+from django.db import migrations
+from django.db.models import Count, F, OuterRef, Q, Subquery
+
+FIELDS = ["last_message", "last_activity_at", "employer_unread_count", "worker_unread_count"]
+
+
+def backfill_chatthread_activity(apps, schema_editor):
+    ChatThread = apps.get_model("jobs", "ChatThread")
+    ChatMessage = apps.get_model("jobs", "ChatMessage")
+    db_alias = schema_editor.connection.alias
+    latest = ChatMessage.objects.using(db_alias).filter(thread=OuterRef("pk")).order_by("-created_at", "-id")
+    unread = Q(messages__is_read=False)
+    threads = ChatThread.objects.using(db_alias).order_by("id").annotate(
+        latest_id=Subquery(latest.values("id")[:1]),
+        latest_at=Subquery(latest.values("created_at")[:1]),
+        employer_unread=Count("messages", filter=unread & ~Q(messages__sender=F("employer"))),
+        worker_unread=Count("messages", filter=unread & ~Q(messages__sender=F("worker"))),
+    )
+    batch = []
+    for thread in threads.iterator(chunk_size=500):
+        thread.last_message_id = thread.latest_id
+        thread.last_activity_at = thread.latest_at or thread.created_at
+        thread.employer_unread_count = thread.employer_unread
+        thread.worker_unread_count = thread.worker_unread
+        batch.append(thread)
+        if len(batch) == 500:
+            ChatThread.objects.using(db_alias).bulk_update(batch, FIELDS)
+            batch = []
+    if batch:
+        ChatThread.objects.using(db_alias).bulk_update(batch, FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0026_chatthread_activity"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_chatthread_activity, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0027_backfill_chatthread_activity'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatmessage',
+            index=models.Index(fields=['thread', 'created_at', 'id'], name='jobs_chatme_thread__05f619_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0028_chatmessage_thread_created_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('service', 'Service'), ('language', 'Language'), ('nationality', 'Nationality'), ('location', 'Location')], max_length=20)),
+                ('token', models.CharField(max_length=128)),
+            ],
+            options={
+                'unique_together': {('kind', 'token')},
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+# Frozen copy of jobs.matching.VOCABULARY_KINDS as of this migration.
+VOCABULARY_KINDS = ("service", "language", "location")
+
+
+def backfill_match_terms(apps, schema_editor):
+    WorkerMatchToken = apps.get_model("jobs", "WorkerMatchToken")
+    MatchTerm = apps.get_model("jobs", "MatchTerm")
+    db_alias = schema_editor.connection.alias
+    terms = (
+        WorkerMatchToken.objects.using(db_alias)
+        .filter(kind__in=VOCABULARY_KINDS)
+        .values_list("kind", "token")
+        .distinct()
+    )
+    batch = []
+    for kind, token in terms.iterator():
+        batch.append(MatchTerm(kind=kind, token=token))
+        if len(batch) >= 1000:
+            MatchTerm.objects.using(db_alias).bulk_create(batch)
+            batch = []
+    if batch:
+        MatchTerm.objects.using(db_alias).bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0029_matchterm"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_match_terms, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,12 @@
 # jobs/models.py
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
 from django.conf import settings
+from django.utils import timezone
+
+from .matching import JOB_MATCH_FIELDS, MATCH_TOKEN_KINDS, build_job_features
+from .salary import SALARY_DERIVED_FIELDS, SALARY_INPUT_FIELDS, derive_salary_bounds
 
 class Job(models.Model):
     JOB_TYPES = [
@@ -28,6 +34,12 @@ class Job(models.Model):
     full_time_salary = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
     part_time_salary = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
     hourly_wage = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
+    # Derived from the salary inputs above on every save; see jobs.salary.
+    salary_min = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True, editable=False)
+    salary_max = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True, editable=False)
+    salary_monthly = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True, editable=False)
+    # Normalized matching inputs, rebuilt on save; see jobs.matching.
+    match_features = models.JSONField(default=dict, blank=True, editable=False)
     additional_benefits = models.JSONField(default=list, blank=True)
     contract_type = models.CharField(max_length=80, blank=True)
     recruitment_method = models.CharField(max_length=80, blank=True)
@@ -47,11 +59,109 @@ class Job(models.Model):
     review_notes = models.TextField(blank=True)
     reviewed_at = models.DateTimeField(blank=True, null=True)
     posted_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     applications = models.IntegerField(default=0)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'review_status', 'posted_at', 'id']),
+            models.Index(fields=['employer', 'posted_at', 'id']),
+            models.Index(fields=['status', 'review_status', 'salary_max']),
+            models.Index(fields=['status', 'review_status', 'salary_min']),
+        ]
+
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or SALARY_INPUT_FIELDS.intersection(update_fields):
+            self.salary_min, self.salary_max, self.salary_monthly = derive_salary_bounds(self)
+            if update_fields is not None:
+                update_fields = set(update_fields) | SALARY_DERIVED_FIELDS
+        if update_fields is None or JOB_MATCH_FIELDS.intersection(update_fields):
+            self.match_features = build_job_features(self)
+            if update_fields is not None:
+                update_fields = set(update_fields) | {'match_features'}
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'updated_at'}
+        super().save(*args, **kwargs)
+
+
+class JobSearchToken(models.Model):
+    """Inverted index row used for job search on databases without native full-text search."""
+
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='search_tokens')
+    token = models.CharField(max_length=64)
+    weight = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('job', 'token')
+        indexes = [
+            models.Index(fields=['token', 'job']),
+        ]
+
+    def __str__(self):
+        return f'{self.token} -> job {self.job_id}'
+
+
+class WorkerMatchToken(models.Model):
+    """Inverted index row used to find the workers worth scoring for a job."""
+
+    KIND_CHOICES = [(kind, kind.title()) for kind in MATCH_TOKEN_KINDS]
+
+    profile = models.ForeignKey('users.WorkerProfile', on_delete=models.CASCADE, related_name='match_tokens')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    token = models.CharField(max_length=128)
+
+    class Meta:
+        unique_together = ('profile', 'kind', 'token')
+        indexes = [
+            models.Index(fields=['kind', 'token', 'profile']),
+        ]
+
+    def __str__(self):
+        return f'{self.kind}:{self.token} -> profile {self.profile_id}'
+
+
+class MatchTerm(models.Model):
+    """One distinct service, language or location token of ``WorkerMatchToken``.
+
+    This is the vocabulary candidate generation resolves job text against
+    (see jobs.matching.match_vocabulary). Terms are added when a worker is
+    indexed and never removed, so it can hold terms no worker has any more,
+    which only costs a lookup that finds nobody.
+    """
+
+    KIND_CHOICES = WorkerMatchToken.KIND_CHOICES
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    token = models.CharField(max_length=128)
+
+    class Meta:
+        unique_together = ('kind', 'token')
+
+    def __str__(self):
+        return f'{self.kind}:{self.token}'
+
+class JobMatch(models.Model):
+    """Materialized match score between a worker and a listable job; see jobs.recommendations."""
+
+    worker = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='job_matches')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='worker_matches')
+    score = models.PositiveIntegerField()
+    # Copied from the job so a worker's matches can be read in rank order from one index.
+    posted_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ('worker', 'job')
+        indexes = [
+            models.Index(fields=['worker', '-score', '-posted_at']),
+        ]
+
+    def __str__(self):
+        return f'worker {self.worker_id} -> job {self.job_id} ({self.score})'
+
 # 💡 New model to track job applications
 class Application(models.Model):
     APPLICATION_STATUS = [
@@ -67,6 +177,7 @@ class Application(models.Model):
     supporting_document = models.FileField(upload_to="application_documents/", blank=True, null=True)
     status = models.CharField(max_length=20, choices=APPLICATION_STATUS, default='applied')
     applied_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         unique_together = ('job', 'worker',) # A worker can only apply once per job
@@ -74,6 +185,11 @@ class Application(models.Model):
     def __str__(self):
         return f'{self.worker.first_name} applied for {self.job.title}'
 
+    def save(self, *args, **kwargs):
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = set(kwargs['update_fields']) | {'updated_at'}
+        super().save(*args, **kwargs)
+
 
 class SavedJob(models.Model):
     worker = models.ForeignKey(
@@ -131,10 +247,16 @@ class JobOffer(models.Model):
     worker_signed_at = models.DateTimeField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     responded_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Offer {self.id} ({self.status})"
 
+    def save(self, *args, **kwargs):
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = set(kwargs["update_fields"]) | {"updated_at"}
+        super().save(*args, **kwargs)
+
 
 class ShortlistedWorker(models.Model):
     employer = models.ForeignKey(
@@ -241,13 +363,57 @@ class ChatThread(models.Model):
         blank=True,
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    # Maintained by ChatMessage.save() and mark_read() so thread lists need no per-thread queries.
+    last_message = models.ForeignKey(
+        "ChatMessage",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    last_activity_at = models.DateTimeField(default=timezone.now, editable=False)
+    employer_unread_count = models.PositiveIntegerField(default=0, editable=False)
+    worker_unread_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         unique_together = ("employer", "worker", "job")
+        indexes = [
+            models.Index(fields=["employer", "-last_activity_at", "-id"]),
+            models.Index(fields=["worker", "-last_activity_at", "-id"]),
+        ]
 
     def __str__(self):
         return f"Thread {self.id}: {self.employer.email} <-> {self.worker.email}"
 
+    def unread_count_for(self, user):
+        if user.id == self.employer_id:
+            return self.employer_unread_count
+        if user.id == self.worker_id:
+            return self.worker_unread_count
+        return 0
+
+    def mark_read(self, user, up_to=None):
+        """Mark the other participant's messages read for ``user`` and return how many changed.
+
+        With ``up_to`` (a message), only messages no newer than it in
+        ``(created_at, id)`` order are marked.
+        """
+        counter = "employer_unread_count" if user.id == self.employer_id else "worker_unread_count"
+        unread = self.messages.exclude(sender=user).filter(is_read=False)
+        if up_to is not None:
+            unread = unread.filter(
+                Q(created_at__lt=up_to.created_at) | Q(created_at=up_to.created_at, id__lte=up_to.id)
+            )
+        with transaction.atomic(using=self._state.db):
+            marked = unread.update(is_read=True)
+            if marked:
+                # Subtract rather than zero, so messages arriving concurrently keep their count.
+                ChatThread.objects.using(self._state.db).filter(pk=self.pk).update(
+                    **{counter: Greatest(F(counter) - marked, 0)}
+                )
+        return marked
+
 
 class ChatMessage(models.Model):
     thread = models.ForeignKey(
@@ -264,9 +430,28 @@ class ChatMessage(models.Model):
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["thread", "created_at", "id"]),
+        ]
+
     def __str__(self):
         return f"Thread {self.thread_id} message by {self.sender.email}"
 
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+        using = kwargs.get("using") or router.db_for_write(ChatMessage, instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+            thread = self.thread
+            updates = {"last_message": self, "last_activity_at": self.created_at}
+            if self.sender_id != thread.employer_id:
+                updates["employer_unread_count"] = F("employer_unread_count") + 1
+            if self.sender_id != thread.worker_id:
+                updates["worker_unread_count"] = F("worker_unread_count") + 1
+            ChatThread.objects.using(using).filter(pk=thread.pk).update(**updates)
+
 
 class CallSession(models.Model):
     STATUS_CHOICES = (
@@ -298,3 +483,127 @@ class CallSession(models.Model):
 
     def __str__(self):
         return f"Call {self.id} ({self.status})"
+
+
+class UserStats(models.Model):
+    """Denormalized activity and reputation counters for one user; see jobs.stats."""
+
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name="stats")
+    applications_count = models.PositiveIntegerField(default=0)
+    hires_count = models.PositiveIntegerField(default=0)
+    offers_received_count = models.PositiveIntegerField(default=0)
+    offers_accepted_count = models.PositiveIntegerField(default=0)
+    offer_responses_count = models.PositiveIntegerField(default=0)
+    offer_response_seconds = models.PositiveBigIntegerField(default=0)
+    worker_reviews_count = models.PositiveIntegerField(default=0)
+    worker_rating_sum = models.PositiveIntegerField(default=0)
+    applications_received_count = models.PositiveIntegerField(default=0)
+    hires_made_count = models.PositiveIntegerField(default=0)
+    offers_sent_count = models.PositiveIntegerField(default=0)
+    employer_reviews_count = models.PositiveIntegerField(default=0)
+    employer_rating_sum = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Stats for user {self.user_id}"
+
+    @property
+    def worker_average_rating(self):
+        if not self.worker_reviews_count:
+            return None
+        return round(self.worker_rating_sum / self.worker_reviews_count, 2)
+
+    @property
+    def employer_average_rating(self):
+        if not self.employer_reviews_count:
+            return None
+        return round(self.employer_rating_sum / self.employer_reviews_count, 2)
+
+    @property
+    def average_offer_response_seconds(self):
+        if not self.offer_responses_count:
+            return None
+        return round(self.offer_response_seconds / self.offer_responses_count)
+
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from realtime import events as realtime_events
+
+from .cache import invalidate_job_feed
+from .matching import WORKER_MATCH_FIELDS, index_worker_profile
+from .recommendations import JOB_MATCH_STATE_FIELDS, rescore_job, rescore_worker
+from .search import SEARCH_FIELDS, index_job
+from .stats import schedule_user_stats_refresh
+
+
+@receiver(post_save, sender=Job)
+def update_job_search_index(sender, instance, update_fields=None, using="default", **kwargs):
+    if update_fields and not SEARCH_FIELDS.intersection(update_fields):
+        return
+    index_job(instance, using=using)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_public_job_feed(sender, instance, using="default", **kwargs):
+    invalidate_job_feed(using=using)
+
+
+@receiver(post_save, sender='users.WorkerProfile')
+def update_worker_match_index(sender, instance, update_fields=None, using="default", **kwargs):
+    if update_fields and not WORKER_MATCH_FIELDS.intersection(update_fields):
+        return
+    # Tokens and scores derive only from match_features (see WorkerProfile.save).
+    if not getattr(instance, "match_features_changed", True):
+        return
+    index_worker_profile(instance, using=using)
+    rescore_worker(instance, using=using)
+
+
+@receiver(post_save, sender=Job)
+def update_job_matches(sender, instance, update_fields=None, using="default", **kwargs):
+    if update_fields and not JOB_MATCH_STATE_FIELDS.intersection(update_fields):
+        return
+    rescore_job(instance, using=using)
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def update_application_stats(sender, instance, using="default", **kwargs):
+    try:
+        employer_id = instance.job.employer_id
+    except Job.DoesNotExist:
+        employer_id = None
+    schedule_user_stats_refresh([instance.worker_id, employer_id], using=using)
+
+
+@receiver(post_save, sender=JobOffer)
+@receiver(post_delete, sender=JobOffer)
+def update_offer_stats(sender, instance, using="default", **kwargs):
+    schedule_user_stats_refresh([instance.worker_id, instance.employer_id], using=using)
+
+
+@receiver(post_save, sender=WorkerReview)
+@receiver(post_delete, sender=WorkerReview)
+def update_worker_review_stats(sender, instance, using="default", **kwargs):
+    schedule_user_stats_refresh([instance.worker_id], using=using)
+
+
+@receiver(post_save, sender=EmployerReview)
+@receiver(post_delete, sender=EmployerReview)
+def update_employer_review_stats(sender, instance, using="default", **kwargs):
+    schedule_user_stats_refresh([instance.employer_id], using=using)
+
+
+@receiver(post_save, sender=ChatMessage)
+def push_chat_message(sender, instance, created, using="default", **kwargs):
+    if created:
+        realtime_events.chat_message_created(instance, using=using)
+
+
+@receiver(post_save, sender=CallSession)
+def push_call_session(sender, instance, created, update_fields=None, using="default", **kwargs):
+    if created or not update_fields or "status" in update_fields:
+        realtime_events.call_session_saved(instance, using=using)
@@ -0,0 +1,236 @@
+# jobs/pagination.py
+import base64
+import binascii
+import json
+
+from django.db.models import BigIntegerField, F, Q
+from django.db.models.functions import Cast, Round
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Opt-in keyset pagination ordered by ``key_fields``, the last of which must be unique.
+
+    Every page costs the same regardless of depth. Listings stay unpaginated
+    unless the client sends ``cursor`` or ``limit``. Subclasses choose the key
+    (``key_fields`` or ``get_key_fields``), its direction (``descending``) and
+    how non-integer key values round-trip through the cursor
+    (``encode_key`` / ``decode_key``).
+    """
+
+    cursor_query_param = "cursor"
+    limit_query_param = "limit"
+    default_limit = 20
+    max_limit = 100
+    invalid_cursor_message = "Invalid cursor."
+    key_fields = ("id",)
+    descending = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.limit_query_param not in params:
+            return None
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.key_fields = self.get_key_fields(queryset)
+        prefix = "-" if self.descending else ""
+        queryset = queryset.order_by(*[f"{prefix}{field}" for field in self.key_fields])
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            queryset = queryset.filter(self.after(cursor))
+
+        page = list(queryset[: self.limit + 1])
+        self.has_next = len(page) > self.limit
+        page = page[: self.limit]
+        self.next_cursor = self.encode_cursor(page[-1]) if self.has_next else None
+        return page
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get(self.limit_query_param) or self.default_limit)
+        except ValueError:
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get_key_fields(self, queryset):
+        return list(self.key_fields)
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor)
+
+    def encode_key(self, field, value):
+        return value
+
+    def decode_key(self, field, value):
+        """Parse one cursor value; raise ``TypeError`` or ``ValueError`` when it is malformed."""
+        return int(value)
+
+    def encode_cursor(self, obj):
+        values = [self.encode_key(field, getattr(obj, field)) for field in self.key_fields]
+        raw = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.key_fields):
+                raise ValueError
+            return {field: self.decode_key(field, value) for field, value in zip(self.key_fields, values)}
+        except (binascii.Error, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def after(self, cursor):
+        lookup = "lt" if self.descending else "gt"
+        condition = Q()
+        for index, field in enumerate(self.key_fields):
+            clause = Q(**{f"{field}__{lookup}": cursor[field]})
+            for previous in self.key_fields[:index]:
+                clause &= Q(**{previous: cursor[previous]})
+            condition |= clause
+        return condition
+
+
+class JobCursorPagination(KeysetPagination):
+    """Keyset pagination for job listings, newest first.
+
+    Pages are keyed on ``(posted_at, id)``, prefixed for ranked search results
+    by ``search_rank`` scaled to an integer: PostgreSQL's ``ts_rank`` is a
+    float4, which does not compare equal to its own value after a round trip
+    through a JSON cursor, so keying on the float would repeat or skip rows at
+    page boundaries.
+    """
+
+    descending = True
+    rank_scale = 1_000_000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if "search_rank" in queryset.query.annotations:
+            queryset = queryset.annotate(
+                search_rank_key=Cast(Round(F("search_rank") * self.rank_scale), BigIntegerField())
+            )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_key_fields(self, queryset):
+        if "search_rank_key" in queryset.query.annotations:
+            return ["search_rank_key", "posted_at", "id"]
+        return ["posted_at", "id"]
+
+    def encode_key(self, field, value):
+        return value.isoformat() if field == "posted_at" else value
+
+    def decode_key(self, field, value):
+        if field == "posted_at":
+            posted_at = parse_datetime(value)
+            if posted_at is None:
+                raise ValueError(value)
+            return posted_at
+        return int(value)
+
+
+class ChatMessageCursorPagination(BasePagination):
+    """Opt-in keyset pagination for a chat thread's history, keyed on ``(created_at, id)``.
+
+    Without a cursor the most recent page is returned; ``before`` walks back
+    through older messages and ``after`` returns only messages newer than the
+    cursor, which is what polling clients follow. Each page is in
+    chronological order. ``next`` always links to messages after the page (or
+    after the given cursor when the page is empty), and ``previous`` links to
+    older messages when there are any. History stays unpaginated unless the
+    client sends ``before``, ``after`` or ``limit``.
+    """
+
+    before_query_param = "before"
+    after_query_param = "after"
+    limit_query_param = "limit"
+    default_limit = 50
+    max_limit = 200
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if not any(param in params for param in (self.before_query_param, self.after_query_param, self.limit_query_param)):
+            return None
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        before = self.decode_cursor(request, self.before_query_param)
+        after = self.decode_cursor(request, self.after_query_param)
+        if before is not None and after is not None:
+            raise NotFound("Send either before or after, not both.")
+
+        if after is not None:
+            queryset = queryset.filter(
+                Q(created_at__gt=after[0]) | Q(created_at=after[0], id__gt=after[1])
+            ).order_by("created_at", "id")
+            page = list(queryset[: self.limit])
+            self.has_previous = False
+        else:
+            if before is not None:
+                queryset = queryset.filter(Q(created_at__lt=before[0]) | Q(created_at=before[0], id__lt=before[1]))
+            page = list(queryset.order_by("-created_at", "-id")[: self.limit + 1])
+            self.has_previous = len(page) > self.limit
+            page = page[: self.limit][::-1]
+
+        self.previous_cursor = self.encode_cursor(page[0]) if self.has_previous else None
+        if page:
+            self.next_cursor = self.encode_cursor(page[-1])
+        else:
+            self.next_cursor = params.get(self.after_query_param) or params.get(self.before_query_param)
+        return page
+
+    def get_paginated_response(self, data):
+        return Response({"previous": self.get_previous_link(), "next": self.get_next_link(), "results": data})
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get(self.limit_query_param) or self.default_limit)
+        except ValueError:
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.before_query_param)
+        return replace_query_param(url, self.after_query_param, self.next_cursor)
+
+    def get_previous_link(self):
+        if not self.previous_cursor:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.after_query_param)
+        return replace_query_param(url, self.before_query_param, self.previous_cursor)
+
+    def encode_cursor(self, message):
+        raw = json.dumps([message.created_at.isoformat(), message.id], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, request, param):
+        token = request.query_params.get(param)
+        if not token:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != 2:
+                raise ValueError
+            created_at, message_id = parse_datetime(values[0]), int(values[1])
+        except (binascii.Error, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, message_id
@@ -0,0 +1,61 @@
+# jobs/recommendations.py
+"""Materialized job recommendations.
+
+``JobMatch`` holds every positive (worker, job, score) pair for listable jobs
+(active and approved). It is maintained incrementally: saving a job rescores
+only that job's column, saving a worker profile rescores only that worker's
+row. ``recommended_jobs`` then reads a worker's best matches with one indexed
+query.
+"""
+from .matching import JOB_MATCH_FIELDS, candidate_profile_ids, job_features, score_matrix, worker_features
+
+JOB_MATCH_STATE_FIELDS = JOB_MATCH_FIELDS | {"status", "review_status"}
+
+
+def is_listable(job):
+    return job.status == "active" and job.review_status == "approved"
+
+
+def match_rows(jobs, profiles):
+    """Unsaved ``JobMatch`` rows for every positive-scoring pair of ``jobs`` x worker ``profiles``."""
+    from .models import JobMatch
+
+    scores = score_matrix([job_features(job) for job in jobs], [worker_features(profile) for profile in profiles])
+    return [
+        JobMatch(worker_id=profile.user_id, job_id=job.id, score=int(scores[row][column]), posted_at=job.posted_at)
+        for row, job in enumerate(jobs)
+        for column, profile in enumerate(profiles)
+        if scores[row][column] > 0
+    ]
+
+
+def rescore_job(job, using="default"):
+    """Replace the stored matches for ``job``."""
+    from users.models import WorkerProfile
+
+    from .models import JobMatch
+
+    JobMatch.objects.using(using).filter(job_id=job.pk).delete()
+    if not is_listable(job):
+        return
+    profiles = list(
+        WorkerProfile.objects.using(using)
+        .filter(pk__in=candidate_profile_ids(job, using=using), user__role="worker")
+        .only("id", "user_id", "match_features")
+    )
+    JobMatch.objects.using(using).bulk_create(match_rows([job], profiles), batch_size=1000)
+
+
+def rescore_worker(profile, using="default"):
+    """Replace the stored matches for the worker owning ``profile``."""
+    from .models import Job, JobMatch
+
+    JobMatch.objects.using(using).filter(worker_id=profile.user_id).delete()
+    if (getattr(profile.user, "role", "") or "").strip().lower() != "worker":
+        return
+    jobs = list(
+        Job.objects.using(using)
+        .filter(status="active", review_status="approved")
+        .only("id", "posted_at", "match_features")
+    )
+    JobMatch.objects.using(using).bulk_create(match_rows(jobs, [profile]), batch_size=1000)
@@ -0,0 +1,130 @@
+# jobs/salary.py
+"""Normalized salary bounds derived from a job's salary inputs.
+
+Jobs carry pay as up to three structured amounts plus the free-text
+``salary`` field. These helpers fold the structured amounts, or failing
+those the amounts stated in the text, into ``salary_min`` / ``salary_max``
+(raw amounts, used by the listing range filters) and ``salary_monthly``
+(the best monthly-equivalent pay).
+"""
+import re
+from decimal import Decimal, InvalidOperation
+
+SALARY_INPUT_FIELDS = frozenset({"salary", "full_time_salary", "part_time_salary", "hourly_wage"})
+SALARY_DERIVED_FIELDS = frozenset({"salary_min", "salary_max", "salary_monthly"})
+
+# 8 hours a day, 26 working days a month.
+HOURS_PER_MONTH = Decimal("208")
+DAYS_PER_MONTH = Decimal("26")
+WEEKS_PER_MONTH = Decimal("52") / Decimal("12")
+MAX_AMOUNT = Decimal("1000000000")
+CENTS = Decimal("0.01")
+
+# Monthly-equivalent pay outside this range is a phone number, a count or a typo, not a salary.
+MIN_MONTHLY_AMOUNT = Decimal("100")
+MAX_MONTHLY_AMOUNT = Decimal("250000")
+
+CURRENCY = r"(?:(?<![a-z])(?:aed|dhs?|dirhams?|usd|sar|qar|kwd|omr|bhd|inr|php|rs\.?)|\$)"
+# One amount or range ("2,500 - 3,000", "2500 to AED 3000") with its own currency and period tokens.
+SALARY_RE = re.compile(
+    rf"(?P<currency_before>{CURRENCY}\s*)?"
+    r"(?P<low>\d[\d,]*(?:\.\d+)?)(?:\s*(?P<low_k>k)\b)?"
+    rf"(?:\s*(?:-|\u2013|to)\s*(?:{CURRENCY}\s*)?(?P<high>\d[\d,]*(?:\.\d+)?)(?:\s*(?P<high_k>k)\b)?)?"
+    rf"(?P<currency_after>\s*{CURRENCY}(?![a-z]))?"
+    r"(?P<period>\s*(?:/|\bper\b|\ba\b|\ban\b|\beach\b|\bevery\b)\s*(?P<unit>[a-z]+)"
+    r"|\s*(?P<adjective>monthly|hourly|daily|weekly|yearly|annually)\b)?"
+)
+PERIOD_FACTORS = {
+    "hour": HOURS_PER_MONTH, "hourly": HOURS_PER_MONTH, "hr": HOURS_PER_MONTH, "hrs": HOURS_PER_MONTH,
+    "h": HOURS_PER_MONTH,
+    "day": DAYS_PER_MONTH, "daily": DAYS_PER_MONTH,
+    "week": WEEKS_PER_MONTH, "weekly": WEEKS_PER_MONTH, "wk": WEEKS_PER_MONTH,
+    "month": Decimal("1"), "monthly": Decimal("1"), "mo": Decimal("1"), "mon": Decimal("1"), "mth": Decimal("1"),
+    "year": Decimal("1") / Decimal("12"), "yearly": Decimal("1") / Decimal("12"), "yr": Decimal("1") / Decimal("12"),
+    "annum": Decimal("1") / Decimal("12"), "annually": Decimal("1") / Decimal("12"),
+}
+
+
+def _to_decimal(value):
+    if value is None or value == "":
+        return None
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation:
+        return None
+    if amount <= 0 or amount >= MAX_AMOUNT:
+        return None
+    return amount
+
+
+def _amount(number, thousands):
+    amount = _to_decimal(number.replace(",", ""))
+    if amount is not None and thousands:
+        amount = _to_decimal(amount * 1000)
+    return amount
+
+
+def _period_factor(match):
+    unit = match.group("adjective") or match.group("unit")
+    if unit is None:
+        return Decimal("1")
+    if unit not in PERIOD_FACTORS and unit.endswith("s"):
+        unit = unit[:-1]
+    return PERIOD_FACTORS.get(unit)
+
+
+def parse_salary_text(text):
+    """Return ``(amount, monthly_factor)`` pairs for the pay stated in a free-text salary.
+
+    Only numbers written next to a currency ("AED 2,500") or a pay period
+    ("3000/month", "25 per hour") count, each with its own period, so counts
+    such as "1 day off" or "8 hours shift" and phone numbers are ignored.
+    Amounts default to monthly and are dropped when their monthly equivalent
+    is implausible.
+    """
+    text = (text or "").lower()
+    pairs = []
+    for match in SALARY_RE.finditer(text):
+        has_currency = match.group("currency_before") or match.group("currency_after")
+        if not has_currency and not match.group("period"):
+            continue
+        factor = _period_factor(match)
+        if factor is None:
+            # "per person", "/7": the trailing word is not a pay period.
+            if not has_currency:
+                continue
+            factor = Decimal("1")
+        for number, thousands in ((match.group("low"), match.group("low_k")), (match.group("high"), match.group("high_k"))):
+            amount = number and _amount(number, thousands)
+            if amount and MIN_MONTHLY_AMOUNT <= amount * factor <= MAX_MONTHLY_AMOUNT:
+                pairs.append((amount, factor))
+    return pairs
+
+
+def derive_salary_bounds(job):
+    """Return ``(salary_min, salary_max, salary_monthly)`` for ``job``, all None when it states no pay."""
+    amounts = []
+    monthly = []
+    for field, factor in (
+        ("full_time_salary", Decimal("1")),
+        ("part_time_salary", Decimal("1")),
+        ("hourly_wage", HOURS_PER_MONTH),
+    ):
+        amount = _to_decimal(getattr(job, field, None))
+        if amount is not None:
+            amounts.append(amount)
+            monthly.append(amount * factor)
+
+    # The free text usually restates the structured amounts less precisely; it only fills in when they are missing.
+    if not amounts:
+        for amount, factor in parse_salary_text(getattr(job, "salary", "")):
+            amounts.append(amount)
+            monthly.append(amount * factor)
+
+    if not amounts:
+        return None, None, None
+    return (
+        min(amounts).quantize(CENTS),
+        max(amounts).quantize(CENTS),
+        min(max(monthly), MAX_AMOUNT - CENTS).quantize(CENTS),
+    )
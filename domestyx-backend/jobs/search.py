@@ -0,0 +1,133 @@
+# jobs/search.py
+"""Full-text search for job listings.
+
+PostgreSQL deployments use the native full-text engine backed by the GIN
+index created in the jobs migrations. Other backends (MySQL, SQLite) fall
+back to ``JobSearchToken``, an inverted index of normalized tokens that is
+rebuilt whenever a job's searchable fields change.
+
+On the token-index path, tokens are folded (accents stripped, case-folded)
+before indexing and querying. MySQL's default accent-insensitive collations
+compare "cafe" and "café" as equal, so unfolded variants of one word would
+collide on the index's unique key; folding merges them first and lets either
+spelling find both. PostgreSQL's ``simple`` configuration only lowercases,
+so native queries are only lowercased too and accents must match there.
+"""
+import re
+import unicodedata
+
+from django.db import connections
+from django.db.models import Case, F, FloatField, IntegerField, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+MAX_TOKEN_LENGTH = 64
+
+# (field, token weight, PostgreSQL weight class)
+SEARCH_FIELD_WEIGHTS = (
+    ("title", 3, "A"),
+    ("location", 2, "B"),
+    ("description", 1, "C"),
+)
+SEARCH_FIELDS = frozenset(field for field, _, _ in SEARCH_FIELD_WEIGHTS)
+POSTGRES_SEARCH_CONFIG = "simple"
+
+
+def fold(text):
+    """Strip accents and case-fold ``text`` so collation-equivalent spellings compare equal in Python."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def tokenize(text, folded=True):
+    text = fold(text) if folded else (text or "").lower()
+    return [token[:MAX_TOKEN_LENGTH] for token in TOKEN_RE.findall(text)]
+
+
+def build_job_tokens(job):
+    weights = {}
+    for field, weight, _ in SEARCH_FIELD_WEIGHTS:
+        for token in tokenize(getattr(job, field, "")):
+            weights[token] = weights.get(token, 0) + weight
+    return weights
+
+
+def uses_native_search(using="default"):
+    return connections[using].vendor == "postgresql"
+
+
+def index_job(job, using="default"):
+    from .models import JobSearchToken
+
+    if uses_native_search(using):
+        return
+    JobSearchToken.objects.using(using).filter(job_id=job.pk).delete()
+    JobSearchToken.objects.using(using).bulk_create(
+        [JobSearchToken(job_id=job.pk, token=token, weight=weight) for token, weight in build_job_tokens(job).items()]
+    )
+
+
+def search_jobs(queryset, query):
+    """Filter ``queryset`` to jobs matching every term of ``query`` and annotate ``search_rank``.
+
+    Each term is matched as a prefix, so partially typed words still hit.
+    Results are ordered by rank, newest first within equal ranks.
+    """
+    native = uses_native_search(queryset.db)
+    # The native index is built on unfolded text (see POSTGRES_SEARCH_CONFIG), so only its query is left unfolded.
+    terms = list(dict.fromkeys(tokenize(query, folded=not native)))
+    if not terms:
+        return queryset.none()
+    if native:
+        queryset = _search_postgres(queryset, terms)
+    else:
+        queryset = _search_token_index(queryset, terms)
+    return queryset.order_by("-search_rank", "-posted_at")
+
+
+def _search_token_index(queryset, terms):
+    from .models import JobSearchToken
+
+    any_term = Q()
+    for term in terms:
+        queryset = queryset.filter(pk__in=JobSearchToken.objects.filter(token__istartswith=term).values("job_id"))
+        any_term |= Q(token__istartswith=term)
+
+    # Whole-word hits count double so "cook" ranks a cook above a cookery teacher.
+    rank = (
+        JobSearchToken.objects.filter(any_term, job_id=OuterRef("pk"))
+        .values("job_id")
+        .annotate(
+            total=Sum(
+                Case(When(token__in=terms, then=F("weight") * 2), default=F("weight"), output_field=IntegerField())
+            )
+        )
+        .values("total")
+    )
+    return queryset.annotate(
+        search_rank=Coalesce(Subquery(rank, output_field=FloatField()), Value(0.0), output_field=FloatField())
+    )
+
+
+def job_search_vector():
+    from django.contrib.postgres.search import SearchVector
+
+    vector = None
+    for field, _, pg_weight in SEARCH_FIELD_WEIGHTS:
+        part = SearchVector(field, weight=pg_weight, config=POSTGRES_SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def _search_postgres(queryset, terms):
+    from django.contrib.postgres.search import SearchQuery, SearchRank
+
+    vector = job_search_vector()
+    query = SearchQuery(
+        " & ".join(f"{term}:*" for term in terms),
+        search_type="raw",
+        config=POSTGRES_SEARCH_CONFIG,
+    )
+    return queryset.annotate(search_document=vector).filter(search_document=query).annotate(
+        search_rank=SearchRank(vector, query)
+    )
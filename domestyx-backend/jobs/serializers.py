@@ -1,4 +1,7 @@
+from django.db import models
 from rest_framework import serializers
+
+from domestyx_backend.serializers import SparseFieldsMixin
 from .models import (
     Application,
     CallSession,
@@ -12,7 +15,7 @@ from .models import (
     WorkerReview,
 )
 
-class ApplicationSerializer(serializers.ModelSerializer):
+class ApplicationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     job_details = serializers.SerializerMethodField()
     worker_details = serializers.SerializerMethodField()
 
@@ -21,6 +24,7 @@ class ApplicationSerializer(serializers.ModelSerializer):
         # ✅ Include applied_at so the frontend can show the date
         fields = ['id', 'worker', 'job', 'cover_note', 'supporting_document', 'status', 'applied_at', 'job_details', 'worker_details']
         read_only_fields = ('worker', 'job', 'applied_at')
+        deferrable_fields = ('cover_note',)
 
     def get_job_details(self, obj):
         return {
@@ -47,37 +51,99 @@ class ApplicationSerializer(serializers.ModelSerializer):
             "experience": profile.experience if profile else "N/A",
         }
 
-class JobSerializer(serializers.ModelSerializer):
+def _applied_job_ids(request, job_ids):
+    if not (request and hasattr(request, 'user') and request.user.is_authenticated):
+        return set()
+    return set(
+        Application.objects.filter(worker=request.user, job_id__in=job_ids).values_list('job_id', flat=True)
+    )
+
+
+class AppliedJobsListSerializer(serializers.ListSerializer):
+    """Looks up the requesting user's applications for the whole page in one query.
+
+    ``JobSummarySerializer.get_has_applied`` answers from the resulting set instead of
+    querying once per job. ``job_id_attr`` names the job id on each item.
+    """
+
+    job_id_attr = 'id'
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        self.context['applied_job_ids'] = _applied_job_ids(
+            self.context.get('request'),
+            [getattr(item, self.job_id_attr) for item in items],
+        )
+        return super().to_representation(items)
+
+
+class SavedJobsListSerializer(AppliedJobsListSerializer):
+    job_id_attr = 'job_id'
+
+
+class JobSummarySerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """Compact job representation for listings; see JobSerializer for the full record."""
+
     has_applied = serializers.SerializerMethodField()
     employer_name = serializers.CharField(source='employer.first_name', read_only=True)
-    applicants = ApplicationSerializer(source='job_applications', many=True, read_only=True)
+    applicant_count = serializers.IntegerField(source='applications', read_only=True)
+    rank = serializers.FloatField(source='search_rank', read_only=True, default=None)
 
     class Meta:
         model = Job
+        fields = [
+            'id', 'title', 'description', 'salary', 'location', 'job_type',
+            'language_requirements', 'experience_required', 'skills_required',
+            'workplace_type', 'accommodation_provided', 'food_provided', 'work_schedule',
+            'full_time_salary', 'part_time_salary', 'hourly_wage', 'salary_min', 'salary_max',
+            'salary_monthly', 'preferred_nationality', 'status', 'review_status', 'posted_at', 'employer', 'employer_name',
+            'has_applied', 'applicant_count', 'rank',
+        ]
+        read_only_fields = fields
+        list_serializer_class = AppliedJobsListSerializer
+        deferrable_fields = (
+            'description', 'specific_expectations', 'work_environment_description',
+            'application_instructions', 'review_notes',
+        )
+
+    def get_has_applied(self, obj):
+        applied_job_ids = self.context.get('applied_job_ids')
+        if applied_job_ids is not None:
+            return obj.id in applied_job_ids
+        request = self.context.get('request')
+        if request and hasattr(request, 'user') and request.user.is_authenticated:
+            return Application.objects.filter(worker=request.user, job=obj).exists()
+        return False
+
+
+class JobSerializer(JobSummarySerializer):
+    class Meta(JobSummarySerializer.Meta):
         fields = [
             'id', 'title', 'description', 'salary', 'location',
             'job_type', 'preferred_gender', 'preferred_age_range',
             'language_requirements', 'experience_required', 'skills_required',
             'workplace_type', 'accommodation_provided', 'food_provided', 'work_schedule',
-            'full_time_salary', 'part_time_salary', 'hourly_wage', 'additional_benefits',
+            'full_time_salary', 'part_time_salary', 'hourly_wage', 'salary_min', 'salary_max',
+            'salary_monthly', 'additional_benefits',
             'contract_type', 'recruitment_method', 'work_permit_sponsorship',
             'background_verification_required', 'preferred_nationality',
             'police_clearance_required', 'specific_expectations',
             'work_environment_description', 'emergency_contact_name_number',
             'application_instructions', 'contact_person_name', 'contact_phone', 'contact_email',
             'status', 'review_status', 'review_notes', 'reviewed_at',
-            'posted_at', 'employer_name', 'has_applied', 'applicants'
+            'posted_at', 'employer_name', 'has_applied', 'applicant_count', 'rank'
         ]
         read_only_fields = ('status', 'review_status', 'review_notes', 'reviewed_at', 'posted_at')
 
-    def get_has_applied(self, obj):
-        request = self.context.get('request')
-        if request and hasattr(request, 'user') and request.user.is_authenticated:
-            return Application.objects.filter(worker=request.user, job=obj).exists()
-        return False
+
+class EmployerJobDetailSerializer(JobSerializer):
+    applicants = ApplicationSerializer(source='job_applications', many=True, read_only=True)
+
+    class Meta(JobSerializer.Meta):
+        fields = JobSerializer.Meta.fields + ['applicants']
 
 
-class ShortlistedWorkerSerializer(serializers.ModelSerializer):
+class ShortlistedWorkerSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     worker_details = serializers.SerializerMethodField()
     job_details = serializers.SerializerMethodField()
 
@@ -121,7 +187,7 @@ class ShortlistedWorkerSerializer(serializers.ModelSerializer):
         }
 
 
-class WorkerReviewSerializer(serializers.ModelSerializer):
+class WorkerReviewSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     reviewer_name = serializers.CharField(source="reviewer.first_name", read_only=True)
     worker_name = serializers.CharField(source="worker.first_name", read_only=True)
     job_title = serializers.CharField(source="job.title", read_only=True)
@@ -133,9 +199,10 @@ class WorkerReviewSerializer(serializers.ModelSerializer):
             "job", "job_title", "rating", "comment", "created_at",
         ]
         read_only_fields = ["reviewer", "created_at"]
+        deferrable_fields = ("comment",)
 
 
-class EmployerReviewSerializer(serializers.ModelSerializer):
+class EmployerReviewSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     reviewer_name = serializers.CharField(source="reviewer.first_name", read_only=True)
     employer_name = serializers.CharField(source="employer.first_name", read_only=True)
     job_title = serializers.CharField(source="job.title", read_only=True)
@@ -147,9 +214,10 @@ class EmployerReviewSerializer(serializers.ModelSerializer):
             "job", "job_title", "rating", "comment", "created_at",
         ]
         read_only_fields = ["reviewer", "created_at"]
+        deferrable_fields = ("comment",)
 
 
-class ChatThreadSerializer(serializers.ModelSerializer):
+class ChatThreadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     employer_name = serializers.CharField(source="employer.first_name", read_only=True)
     worker_name = serializers.CharField(source="worker.first_name", read_only=True)
     job_title = serializers.CharField(source="job.title", read_only=True)
@@ -160,12 +228,12 @@ class ChatThreadSerializer(serializers.ModelSerializer):
         model = ChatThread
         fields = [
             "id", "employer", "employer_name", "worker", "worker_name",
-            "job", "job_title", "created_at", "last_message", "unread_count",
+            "job", "job_title", "created_at", "last_activity_at", "last_message", "unread_count",
         ]
-        read_only_fields = ["created_at"]
+        read_only_fields = ["created_at", "last_activity_at"]
 
     def get_last_message(self, obj):
-        msg = obj.messages.order_by("-created_at").first()
+        msg = obj.last_message
         if not msg:
             return None
         return {
@@ -178,10 +246,10 @@ class ChatThreadSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         if not request or not request.user.is_authenticated:
             return 0
-        return obj.messages.exclude(sender=request.user).filter(is_read=False).count()
+        return obj.unread_count_for(request.user)
 
 
-class ChatMessageSerializer(serializers.ModelSerializer):
+class ChatMessageSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     sender_name = serializers.CharField(source="sender.first_name", read_only=True)
 
     class Meta:
@@ -190,7 +258,7 @@ class ChatMessageSerializer(serializers.ModelSerializer):
         read_only_fields = ["sender", "is_read", "created_at"]
 
 
-class CallSessionSerializer(serializers.ModelSerializer):
+class CallSessionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     requester_name = serializers.CharField(source="requester.first_name", read_only=True)
     receiver_name = serializers.CharField(source="receiver.first_name", read_only=True)
 
@@ -203,16 +271,17 @@ class CallSessionSerializer(serializers.ModelSerializer):
         read_only_fields = ["requester", "receiver", "started_at", "ended_at"]
 
 
-class SavedJobSerializer(serializers.ModelSerializer):
-    job_details = JobSerializer(source="job", read_only=True)
+class SavedJobSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    job_details = JobSummarySerializer(source="job", read_only=True)
 
     class Meta:
         model = SavedJob
         fields = ["id", "worker", "job", "created_at", "job_details"]
         read_only_fields = ["worker", "created_at"]
+        list_serializer_class = SavedJobsListSerializer
 
 
-class JobOfferSerializer(serializers.ModelSerializer):
+class JobOfferSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     job_title = serializers.CharField(source="job.title", read_only=True)
     worker_name = serializers.CharField(source="worker.first_name", read_only=True)
     employer_name = serializers.CharField(source="employer.first_name", read_only=True)
@@ -227,3 +296,4 @@ class JobOfferSerializer(serializers.ModelSerializer):
             "created_at", "responded_at",
         ]
         read_only_fields = ["employer", "worker", "job", "created_at", "responded_at"]
+        deferrable_fields = ("message", "contract_text")
@@ -0,0 +1,118 @@
+# jobs/stats.py
+"""Per-user reputation and activity counters.
+
+``UserStats`` keeps one row per user with the application, hire, offer and
+review counts, rating totals and offer response times that profile
+comparisons display, so those endpoints read a row instead of aggregating
+history. Saving or deleting an application, offer or review refreshes the
+rows of the users it involves once the transaction commits, and the
+``reconcile_user_stats`` command recomputes every row in bulk.
+"""
+from functools import partial
+
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Q, Sum
+
+STAT_FIELDS = (
+    # As a worker.
+    "applications_count",
+    "hires_count",
+    "offers_received_count",
+    "offers_accepted_count",
+    "offer_responses_count",
+    "offer_response_seconds",
+    "worker_reviews_count",
+    "worker_rating_sum",
+    # As an employer.
+    "applications_received_count",
+    "hires_made_count",
+    "offers_sent_count",
+    "employer_reviews_count",
+    "employer_rating_sum",
+)
+
+
+def compute_user_stats(user_ids, using="default", apps=global_apps):
+    """Return ``{user_id: {field: value}}`` for ``user_ids``, aggregated from history."""
+    Application = apps.get_model("jobs", "Application")
+    JobOffer = apps.get_model("jobs", "JobOffer")
+    WorkerReview = apps.get_model("jobs", "WorkerReview")
+    EmployerReview = apps.get_model("jobs", "EmployerReview")
+
+    user_ids = list(user_ids)
+    stats = {user_id: dict.fromkeys(STAT_FIELDS, 0) for user_id in user_ids}
+    response_time = ExpressionWrapper(F("responded_at") - F("created_at"), output_field=DurationField())
+    aggregates = (
+        (
+            Application.objects.filter(worker_id__in=user_ids),
+            "worker_id",
+            {"applications_count": Count("id"), "hires_count": Count("id", filter=Q(status="hired"))},
+        ),
+        (
+            Application.objects.filter(job__employer_id__in=user_ids),
+            "job__employer_id",
+            {"applications_received_count": Count("id"), "hires_made_count": Count("id", filter=Q(status="hired"))},
+        ),
+        (
+            JobOffer.objects.filter(worker_id__in=user_ids),
+            "worker_id",
+            {
+                "offers_received_count": Count("id"),
+                "offers_accepted_count": Count("id", filter=Q(status="accepted")),
+                "offer_responses_count": Count("id", filter=Q(responded_at__isnull=False)),
+                "offer_response_seconds": Sum(response_time, filter=Q(responded_at__isnull=False)),
+            },
+        ),
+        (
+            JobOffer.objects.filter(employer_id__in=user_ids),
+            "employer_id",
+            {"offers_sent_count": Count("id")},
+        ),
+        (
+            WorkerReview.objects.filter(worker_id__in=user_ids),
+            "worker_id",
+            {"worker_reviews_count": Count("id"), "worker_rating_sum": Sum("rating")},
+        ),
+        (
+            EmployerReview.objects.filter(employer_id__in=user_ids),
+            "employer_id",
+            {"employer_reviews_count": Count("id"), "employer_rating_sum": Sum("rating")},
+        ),
+    )
+    for queryset, key, annotations in aggregates:
+        for row in queryset.using(using).order_by().values(key).annotate(**annotations):
+            target = stats[row.pop(key)]
+            for field, value in row.items():
+                if field == "offer_response_seconds":
+                    value = max(int(value.total_seconds()), 0) if value is not None else 0
+                target[field] = value or 0
+    return stats
+
+
+def save_user_stats(stats, using="default", apps=global_apps):
+    """Upsert ``compute_user_stats`` results for users that still exist."""
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    UserStats = apps.get_model("jobs", "UserStats")
+
+    existing = set(User.objects.using(using).filter(id__in=list(stats)).values_list("id", flat=True))
+    rows = [UserStats(user_id=user_id, **values) for user_id, values in stats.items() if user_id in existing]
+    if not rows:
+        return
+    kwargs = {}
+    if connections[using].features.supports_update_conflicts_with_target:
+        kwargs["unique_fields"] = ["user"]
+    UserStats.objects.using(using).bulk_create(
+        rows, update_conflicts=True, update_fields=[*STAT_FIELDS, "updated_at"], **kwargs
+    )
+
+
+def refresh_user_stats(user_ids, using="default"):
+    save_user_stats(compute_user_stats(user_ids, using=using), using=using)
+
+
+def schedule_user_stats_refresh(user_ids, using="default"):
+    user_ids = {user_id for user_id in user_ids if user_id}
+    if user_ids:
+        transaction.on_commit(partial(refresh_user_stats, user_ids, using), using=using)
@@ -1,3 +1,841 @@
-from django.test import TestCase
+import base64
+import json
+import random
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock, skipUnless
+from urllib.parse import parse_qs, urlsplit
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import AgencyWorkerSubmission
+
+from . import matching
+from .automaton import TermMatcher
+from .facets import job_facets
+from .matching import LOCATION, SERVICE, candidate_profile_ids, match_vocabulary
+from .management.commands import rebuild_recommendations
+from .models import (
+    Application,
+    ChatMessage,
+    ChatThread,
+    Job,
+    JobMatch,
+    JobOffer,
+    JobSearchToken,
+    SavedJob,
+    UserStats,
+    WorkerMatchToken,
+)
+from .pagination import ChatMessageCursorPagination
+from .salary import derive_salary_bounds, parse_salary_text
+from .search import build_job_tokens, search_jobs, tokenize
+
+
+def _salary_job(salary="", full_time_salary=None, part_time_salary=None, hourly_wage=None):
+    return SimpleNamespace(
+        salary=salary,
+        full_time_salary=full_time_salary,
+        part_time_salary=part_time_salary,
+        hourly_wage=hourly_wage,
+    )
+
+
+def _employer(email="employer@example.com"):
+    return get_user_model().objects.create_user(email=email, password="pass12345", role="employer")
+
+
+def _worker(email="worker@example.com", **profile_fields):
+    user = get_user_model().objects.create_user(email=email, password="pass12345", role="worker")
+    profile = user.worker_profile
+    for field, value in profile_fields.items():
+        setattr(profile, field, value)
+    profile.save()
+    return profile
+
+
+def _job(employer, **fields):
+    values = {"title": "Housekeeper", "description": "", "location": "Dubai", "salary": "", "job_type": "full-time"}
+    values.update(fields)
+    return Job.objects.create(employer=employer, **values)
+
+
+class SalaryBoundsTests(SimpleTestCase):
+    def test_period_binds_to_its_own_amount(self):
+        self.assertEqual(
+            derive_salary_bounds(_salary_job("AED 2000/month, 1 day off per week")),
+            (Decimal("2000.00"), Decimal("2000.00"), Decimal("2000.00")),
+        )
+
+    def test_counts_without_currency_or_period_are_ignored(self):
+        self.assertEqual(
+            derive_salary_bounds(_salary_job("1500 AED, 8 hours shift, 24/7 live-in")),
+            (Decimal("1500.00"), Decimal("1500.00"), Decimal("1500.00")),
+        )
+
+    def test_phone_numbers_are_ignored(self):
+        self.assertEqual(derive_salary_bounds(_salary_job("Call 0501234567")), (None, None, None))
+        self.assertEqual(parse_salary_text("AED 0501234567"), [])
+
+    def test_ranges_share_currency_and_period(self):
+        self.assertEqual(
+            parse_salary_text("AED 2,500 - 3,000 / month"),
+            [(Decimal("2500"), Decimal("1")), (Decimal("3000"), Decimal("1"))],
+        )
+        self.assertEqual(parse_salary_text("3k per month"), [(Decimal("3000"), Decimal("1"))])
+
+    def test_period_factors(self):
+        self.assertEqual(
+            derive_salary_bounds(_salary_job("25 AED per hour")),
+            (Decimal("25.00"), Decimal("25.00"), Decimal("5200.00")),
+        )
+        self.assertEqual(derive_salary_bounds(_salary_job("AED 60,000 per year"))[2], Decimal("5000.00"))
+
+    def test_structured_amounts_take_precedence_over_text(self):
+        job = _salary_job("AED 99 per day, up to AED 9000", full_time_salary=3000, hourly_wage=20)
+        self.assertEqual(
+            derive_salary_bounds(job),
+            (Decimal("20.00"), Decimal("3000.00"), Decimal("4160.00")),
+        )
+
+
+class JobFacetTests(TestCase):
+    def test_each_facet_is_counted_in_one_query(self):
+        employer = _employer()
+        _job(employer, location="Dubai", salary="AED 1500 per month")
+        _job(employer, location=" Dubai ", job_type="part-time", salary="AED 6000/month")
+        _job(employer, location="Sharjah", workplace_type="live-in")
+
+        with self.assertNumQueries(1):
+            payload = job_facets(Job.objects.select_related("employer").order_by("-posted_at"))
+
+        self.assertEqual(payload["total"], 3)
+        facets = payload["facets"]
+        self.assertEqual(facets["location"], [{"value": "Dubai", "count": 2}, {"value": "Sharjah", "count": 1}])
+        self.assertEqual(facets["job_type"], [{"value": "full-time", "count": 2}, {"value": "part-time", "count": 1}])
+        self.assertEqual(facets["workplace_type"], [{"value": "live-in", "count": 1}])
+        self.assertEqual(facets["accommodation_provided"], [])
+        self.assertEqual(
+            [(bucket["value"], bucket["count"]) for bucket in facets["salary"]],
+            [("1000-2000", 1), ("5000+", 1), ("unspecified", 1)],
+        )
+
+
+class TermMatcherTests(SimpleTestCase):
+    def test_finds_the_same_terms_as_substring_checks(self):
+        rng = random.Random(5)
+        alphabet = "abc "
+        terms = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))) for _ in range(60)}
+        terms |= {"he", "she", "his", "hers", "café", "ab", "b", "abcab"}
+        matcher = TermMatcher(terms)
+        texts = ["ushers", "café au lait", "", "zzz"] + [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(200)
+        ]
+        for text in texts:
+            self.assertEqual(matcher.find(text), {term for term in terms if term in text}, text)
+
+    def test_empty_terms_and_cache_eviction(self):
+        matcher = TermMatcher(["", "cook"], cache_size=2)
+        for text in ("cook", "cooking", "nanny", "cook"):
+            self.assertEqual(matcher.find(text), {"cook"} if "cook" in text else set())
+        self.assertEqual(list(matcher._cache), ["nanny", "cook"])
+        self.assertEqual(TermMatcher([]).find("anything"), frozenset())
+
+
+class ScoreMatrixTests(SimpleTestCase):
+    # Overlapping terms ("cook" in "cooking", "al ain" in "al ainsworth") and more services than
+    # AUTOMATON_MIN_TERMS, so both the substring checks and the automaton path are exercised.
+    SERVICES = ["cook", "cooking", "nanny", "driver", "elderly care", "baby", "babysitter"] + [
+        f"skill{index}" for index in range(40)
+    ]
+    LANGUAGES = ["english", "arabic", "tagalog", "hindi", "eng", ""]
+    PLACES = ["dubai", "al ain", "al ainsworth", "sharjah", "uae", "Dubai Marina"]
+    NATIONALITIES = ["", "filipino", "indian", "kenyan"]
+
+    def _pick(self, rng, pool, most):
+        return rng.sample(pool, rng.randint(0, most))
+
+    def _features(self, seed, job_count=25, worker_count=40):
+        rng = random.Random(seed)
+        jobs = []
+        for _ in range(job_count):
+            words = self._pick(rng, self.SERVICES + self.LANGUAGES, 6)
+            jobs.append(SimpleNamespace(
+                title=" ".join(words[:2]),
+                description=" and ".join(words[2:]),
+                location=" ".join(self._pick(rng, self.PLACES, 2)),
+                skills_required=rng.choice([self._pick(rng, self.SERVICES, 4), ", ".join(self._pick(rng, self.SERVICES, 3))]),
+                language_requirements=self._pick(rng, self.LANGUAGES, 2),
+                preferred_nationality=rng.choice(self.NATIONALITIES),
+            ))
+        workers = []
+        for _ in range(worker_count):
+            place = self._pick(rng, self.PLACES, 3) + [None] * 3
+            workers.append(SimpleNamespace(
+                services=self._pick(rng, self.SERVICES, 5),
+                languages=", ".join(self._pick(rng, self.LANGUAGES, 3)),
+                nationality=rng.choice(self.NATIONALITIES),
+                city=place[0],
+                state=place[1],
+                country=place[2],
+            ))
+        return [matching.job_features(job) for job in jobs], [matching.worker_features(worker) for worker in workers]
+
+    def _assert_matches_pairwise(self, jobs, workers):
+        scores = matching.score_matrix(jobs, workers)
+        for row, job in enumerate(jobs):
+            for column, worker in enumerate(workers):
+                self.assertEqual(int(scores[row][column]), matching.score_features(job, worker), (row, column))
+        return scores
+
+    def test_matches_score_features(self):
+        for seed in range(5):
+            jobs, workers = self._features(seed)
+            scores = self._assert_matches_pairwise(jobs, workers)
+            self.assertTrue(any(scores[row][column] for row in range(len(jobs)) for column in range(len(workers))))
+
+    def test_matches_score_features_without_numpy(self):
+        jobs, workers = self._features(11)
+        with mock.patch.object(matching, "np", None):
+            scores = self._assert_matches_pairwise(jobs, workers)
+        self.assertIsInstance(scores, list)
+
+    def test_empty_inputs(self):
+        jobs, workers = self._features(3, job_count=2, worker_count=2)
+        self.assertEqual(len(matching.score_matrix([], workers)), 0)
+        self.assertEqual([len(row) for row in matching.score_matrix(jobs, [])], [0, 0])
+
+
+class JobSearchTokenTests(TestCase):
+    def test_accent_and_case_variants_fold_to_one_token(self):
+        job = Job(title="Café cook", location="", description="Cafe CAFÉ résumé resume Straße")
+        tokens = build_job_tokens(job)
+        self.assertEqual(tokens["cafe"], 3 + 1 + 1)
+        self.assertEqual(tokens["resume"], 2)
+        self.assertIn("strasse", tokens)
+        self.assertNotIn("café", tokens)
+        self.assertEqual(tokenize("Café CRÈME", folded=False), ["café", "crème"])
+
+    def test_index_accepts_variants_and_search_finds_either_spelling(self):
+        job = _job(_employer(), title="Café helper", description="Cafe duties, résumé and resume required")
+        self.assertEqual(JobSearchToken.objects.filter(job=job, token="cafe").count(), 1)
+        for query in ("cafe", "Café", "RESUMÉ"):
+            self.assertEqual(list(search_jobs(Job.objects.all(), query)), [job], query)
+
+    @skipUnless(connection.vendor == "postgresql", "native full-text search is PostgreSQL-only")
+    def test_native_search_finds_accented_words(self):
+        job = _job(_employer(), title="Café helper", description="Résumé required")
+        for query in ("Café", "café help", "RÉSUMÉ"):
+            self.assertEqual(list(search_jobs(Job.objects.all(), query)), [job], query)
+
+
+class WorkerMatchTokenTests(TestCase):
+    def test_collation_equivalent_parts_share_one_token(self):
+        profile = _worker(city="São Paulo", state="Sao Paulo", services=["Café barista", "cafe barista"])
+        self.assertEqual(
+            set(WorkerMatchToken.objects.filter(profile=profile).values_list("kind", "token")),
+            {("location", "sao paulo"), ("service", "cafe barista")},
+        )
+
+    def test_folded_tokens_still_find_accented_jobs(self):
+        profile = _worker(city="Montréal", services=["Crèche assistant"])
+        job = _job(_employer(), title="Crèche assistant wanted", location="Montreal")
+        self.assertIn(profile.pk, set(candidate_profile_ids(job).values_list("profile_id", flat=True)))
+
+
+class MatchVocabularyTests(TestCase):
+    def test_terms_are_recorded_once(self):
+        _worker(city="Dubai", services=["cooking"], nationality="Kenyan")
+        _worker("other@example.com", city="DUBAI", services=["Cooking", "driving"])
+        self.assertEqual(
+            match_vocabulary(),
+            {(SERVICE, "cooking"), (SERVICE, "driving"), (LOCATION, "dubai")},
+        )
+
+    def test_new_term_reaches_jobs_saved_after_it_without_any_commit_hook(self):
+        employer = _employer()
+        _worker(city="Dubai", services=["cleaning"])
+        _job(employer, title="Cleaning needed")
+        self.assertNotIn((SERVICE, "cooking"), match_vocabulary())
+
+        # Another process indexes a worker with a term the vocabulary has never seen; this
+        # process must pick it up from the database, not wait for a cache it cannot see.
+        with self.captureOnCommitCallbacks(execute=False):
+            cook = _worker("cook@example.com", city="Sharjah", services=["cooking"])
+        job = _job(employer, title="Cooking needed", location="Sharjah")
+        self.assertTrue(JobMatch.objects.filter(job=job, worker_id=cook.user_id).exists())
+        self.assertIn(cook.pk, set(candidate_profile_ids(job).values_list("profile_id", flat=True)))
+
+
+class JobMatchMaintenanceTests(TestCase):
+    def setUp(self):
+        self.employer = _employer()
+        self.cook = _worker("cook@example.com", services=["cooking"])
+        self.driver = _worker("driver@example.com", services=["driving"])
+        self.cooking = _job(self.employer, title="Cooking needed")
+        self.driving = _job(self.employer, title="Driving needed")
+
+    def _pairs(self):
+        return set(JobMatch.objects.values_list("worker_id", "job_id"))
+
+    def test_closing_a_job_drops_its_rows(self):
+        self.assertIn((self.cook.user_id, self.cooking.id), self._pairs())
+        self.cooking.status = "closed"
+        self.cooking.save(update_fields=["status"])
+        self.assertEqual(self._pairs(), {(self.driver.user_id, self.driving.id)})
+
+    def test_profile_edit_rescores_the_worker(self):
+        self.cook.services = ["cooking", "driving"]
+        self.cook.save()
+        self.assertEqual(
+            self._pairs(),
+            {
+                (self.cook.user_id, self.cooking.id),
+                (self.cook.user_id, self.driving.id),
+                (self.driver.user_id, self.driving.id),
+            },
+        )
+
+    def test_job_edit_rescores_only_that_column(self):
+        untouched = set(JobMatch.objects.filter(job=self.driving).values_list("pk", flat=True))
+        self.cooking.title = "Cooking and driving needed"
+        self.cooking.save()
+        self.assertEqual(set(JobMatch.objects.filter(job=self.driving).values_list("pk", flat=True)), untouched)
+        self.assertEqual(
+            set(JobMatch.objects.filter(job=self.cooking).values_list("worker_id", flat=True)),
+            {self.cook.user_id, self.driver.user_id},
+        )
+
+    def test_user_saves_that_leave_match_inputs_alone_do_not_rescore(self):
+        matches = set(JobMatch.objects.values_list("pk", flat=True))
+        tokens = set(WorkerMatchToken.objects.values_list("pk", flat=True))
+        user = self.cook.user
+        user.first_name = "Renamed"
+        with mock.patch("jobs.models.rescore_worker") as rescore:
+            user.save()
+            self.cook.refresh_from_db()
+            self.cook.save(update_fields=["services"])
+        rescore.assert_not_called()
+        self.assertEqual(set(JobMatch.objects.values_list("pk", flat=True)), matches)
+        self.assertEqual(set(WorkerMatchToken.objects.values_list("pk", flat=True)), tokens)
+
+
+class RebuildRecommendationsTests(TestCase):
+    def test_jobs_changed_during_the_run_keep_their_matches(self):
+        employer = _employer()
+        workers = [_worker(f"worker{index}@example.com", services=["cooking"]) for index in range(3)]
+        _job(employer, title="Cooking needed")
+        gone = _job(employer, title="Cooking help")
+        created = []
+        snapshot = rebuild_recommendations._init_process
+
+        def snapshot_then_change_jobs():
+            snapshot()
+            # Saved after the snapshot: the signal writes matches the chunks must not wipe.
+            created.append(_job(employer, title="Cooking and cleaning"))
+            gone.delete()
+
+        with mock.patch.object(rebuild_recommendations, "_init_process", snapshot_then_change_jobs):
+            call_command("rebuild_recommendations", "--chunk-size", "1", stdout=StringIO())
+
+        for profile in workers:
+            self.assertTrue(JobMatch.objects.filter(worker_id=profile.user_id, job=created[0]).exists())
+        self.assertFalse(JobMatch.objects.filter(job_id=gone.pk).exists())
+        self.assertEqual(JobMatch.objects.count(), 2 * len(workers))
+
+
+class JobCursorPaginationTests(TestCase):
+    def setUp(self):
+        employer = _employer()
+        self.jobs = [_job(employer, title=f"Cook {index}") for index in range(7)]
+        # Equal timestamps (and equal search ranks): pages must still split on id.
+        Job.objects.update(posted_at=timezone.now())
+        self.client = APIClient()
+        self.client.force_authenticate(_worker().user)
+        self.url = reverse("available_jobs")
+
+    def _walk(self, params):
+        page = self.client.get(self.url, params).data
+        seen = [job["id"] for job in page["results"]]
+        while page["next"]:
+            page = self.client.get(page["next"]).data
+            seen += [job["id"] for job in page["results"]]
+        return seen
+
+    def test_pages_cover_equal_timestamps_once(self):
+        expected = sorted((job.id for job in self.jobs), reverse=True)
+        self.assertEqual(self._walk({"limit": 3}), expected)
+        self.assertEqual(self._walk({"limit": 2, "search": "cook"}), expected)
+
+    def test_search_cursor_keys_on_an_integer_rank(self):
+        page = self.client.get(self.url, {"limit": 2, "search": "cook"}).data
+        token = parse_qs(urlsplit(page["next"]).query)["cursor"][0]
+        rank, _, job_id = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        self.assertIsInstance(rank, int)
+        self.assertEqual(job_id, max(job.id for job in self.jobs) - 1)
+
+    def test_unpaginated_without_cursor_or_limit(self):
+        self.assertEqual(len(self.client.get(self.url).data), len(self.jobs))
+
+    def test_bad_cursors_are_not_found(self):
+        for cursor in ("garbage", "W10", "WyJ4IiwxXQ", "WyIyMDI2LTAxLTAxVDAwOjAwOjAwWiJd"):
+            self.assertEqual(self.client.get(self.url, {"cursor": cursor}).status_code, 404, cursor)
+
+
+class ChatMessagePaginationTests(TestCase):
+    def setUp(self):
+        self.employer = _employer()
+        self.worker = _worker().user
+        self.thread = ChatThread.objects.create(employer=self.employer, worker=self.worker)
+        self.messages = [
+            ChatMessage.objects.create(thread=self.thread, sender=self.worker, message=f"message {index}")
+            for index in range(7)
+        ]
+        # Equal timestamps: pages must still split on id without skipping or repeating messages.
+        self.created_at = timezone.now()
+        ChatMessage.objects.update(created_at=self.created_at)
+        self.client = APIClient()
+        self.client.force_authenticate(self.employer)
+        self.url = reverse("chat-messages", args=[self.thread.id])
+
+    def _follow(self, link):
+        return self.client.get(link).data
+
+    def _unread(self):
+        return set(ChatMessage.objects.filter(is_read=False).values_list("id", flat=True))
+
+    def test_pages_walk_back_through_equal_timestamps(self):
+        page = self.client.get(self.url, {"limit": 3}).data
+        seen = [message["id"] for message in page["results"]]
+        while page["previous"]:
+            page = self._follow(page["previous"])
+            seen = [message["id"] for message in page["results"]] + seen
+        self.assertEqual(seen, [message.id for message in self.messages])
+
+    def test_after_returns_only_newer_messages(self):
+        page = self.client.get(self.url, {"limit": 3}).data
+        self.assertEqual(self._follow(page["next"])["results"], [])
+        newer = ChatMessage.objects.create(thread=self.thread, sender=self.worker, message="newer")
+        ChatMessage.objects.filter(pk=newer.pk).update(created_at=self.created_at)
+        self.assertEqual([message["id"] for message in self._follow(page["next"])["results"]], [newer.id])
+
+    def test_bad_cursors_are_not_found(self):
+        page = self.client.get(self.url, {"limit": 3}).data
+        cursor = page["next"].split("after=")[1]
+        for params in ({"after": "garbage"}, {"before": "W10"}, {"after": cursor, "before": cursor}):
+            self.assertEqual(self.client.get(self.url, params).status_code, 404, params)
+
+    def test_messages_up_to_the_newest_returned_are_marked_read(self):
+        self.messages[4].refresh_from_db()
+        before = ChatMessageCursorPagination().encode_cursor(self.messages[4])
+        older = self.client.get(self.url, {"before": before, "limit": 3}).data
+        self.assertEqual([message["id"] for message in older["results"]], [message.id for message in self.messages[1:4]])
+        self.assertTrue(all(message["is_read"] for message in older["results"]))
+        # messages[0] was never returned but is older than the page, so it is read too.
+        self.assertEqual(self._unread(), {message.id for message in self.messages[4:]})
+        self.thread.refresh_from_db()
+        self.assertEqual(self.thread.employer_unread_count, 3)
+
+        latest = self.client.get(self.url, {"limit": 3}).data
+        self.assertEqual(self._unread(), set())
+        newer = ChatMessage.objects.create(thread=self.thread, sender=self.worker, message="newer")
+        self.assertEqual(self._unread(), {newer.id})
+        self._follow(latest["next"])
+        self.assertEqual(self._unread(), set())
+        self.thread.refresh_from_db()
+        self.assertEqual(self.thread.employer_unread_count, 0)
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        self.employer = _employer()
+        self.worker = _worker().user
+        self.job = _job(self.employer)
+        self.client = APIClient()
+
+    def _get(self, user, url, **headers):
+        self.client.force_authenticate(user)
+        return self.client.get(url, headers=headers)
+
+    def _revalidate(self, user, url, response):
+        return self._get(user, url, if_none_match=response["ETag"]).status_code
+
+    def test_public_feed_answers_304_until_the_user_applies(self):
+        url = reverse("public-jobs")
+        first = self._get(self.worker, url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("Authorization", first["Vary"])
+        self.assertIn("private", first["Cache-Control"])
+        self.assertEqual(self._revalidate(self.worker, url, first), 304)
+
+        other = _worker("other@example.com").user
+        self.assertEqual(self._revalidate(other, url, first), 304)
+        Application.objects.create(job=self.job, worker=self.worker)
+        self.assertEqual(self._revalidate(self.worker, url, first), 200)
+        # has_applied is per user: another worker's copy is still current.
+        self.assertEqual(self._revalidate(other, url, first), 304)
+
+    def test_deleting_a_job_changes_the_etag_and_sends_no_last_modified(self):
+        url = reverse("employer-jobs")
+        _job(self.employer, title="Cook")
+        first = self._get(self.employer, url)
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn("Last-Modified", first)
+        self.assertEqual(self._revalidate(self.employer, url, first), 304)
+
+        self.job.delete()
+        second = self._get(self.employer, url, if_none_match=first["ETag"])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(len(second.data), 1)
+        # A date-only client cannot be told "unchanged" without a Last-Modified to compare.
+        since = self._get(self.employer, url, if_modified_since="Fri, 01 Jan 2100 00:00:00 GMT")
+        self.assertEqual(since.status_code, 200)
+
+    def test_reading_a_thread_changes_the_thread_list_etag(self):
+        url = reverse("chat-threads")
+        thread = ChatThread.objects.create(employer=self.employer, worker=self.worker, job=self.job)
+        ChatMessage.objects.create(thread=thread, sender=self.worker, message="Hello")
+        first = self._get(self.employer, url)
+        self.assertEqual(first.data[0]["unread_count"], 1)
+        self.assertEqual(self._revalidate(self.employer, url, first), 304)
+
+        self._get(self.employer, reverse("chat-messages", args=[thread.id]))
+        second = self._get(self.employer, url, if_none_match=first["ETag"])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data[0]["unread_count"], 0)
+
+
+class PublicJobFeedCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.employer = _employer()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job = _job(self.employer, title="Nanny")
+        self.client = APIClient()
+        self.url = reverse("public-jobs")
+
+    def _titles(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("public", response["Cache-Control"])
+        return [job["title"] for job in response.data]
+
+    def test_anonymous_feed_is_served_from_the_cache(self):
+        self.assertEqual(self._titles(), ["Nanny"])
+        # Bypasses the signals, so only the cached copy can still say "Nanny".
+        Job.objects.filter(pk=self.job.pk).update(title="Driver")
+        self.assertEqual(self._titles(), ["Nanny"])
+
+    def test_creating_a_job_invalidates_the_feed(self):
+        self.assertEqual(self._titles(), ["Nanny"])
+        with self.captureOnCommitCallbacks(execute=True):
+            _job(self.employer, title="Cook")
+        self.assertEqual(self._titles(), ["Cook", "Nanny"])
+
+    def test_updating_a_job_invalidates_the_feed(self):
+        self.assertEqual(self._titles(), ["Nanny"])
+        self.job.title = "Driver"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.save()
+        self.assertEqual(self._titles(), ["Driver"])
+
+    def test_deleting_a_job_invalidates_the_feed(self):
+        self.assertEqual(self._titles(), ["Nanny"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.delete()
+        self.assertEqual(self._titles(), [])
+
+    def test_the_feed_is_invalidated_only_on_commit(self):
+        self.assertEqual(self._titles(), ["Nanny"])
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.job.delete()
+        self.assertEqual(self._titles(), ["Nanny"])
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self._titles(), [])
+
+
+class ChatUnreadCounterTests(TestCase):
+    def setUp(self):
+        self.employer = _employer()
+        self.worker = _worker().user
+        self.thread = ChatThread.objects.create(employer=self.employer, worker=self.worker)
+        self.client = APIClient()
+
+    def _send(self, sender, count=1):
+        for index in range(count):
+            ChatMessage.objects.create(thread=self.thread, sender=sender, message=f"message {index}")
+
+    def _counts(self):
+        self.thread.refresh_from_db()
+        return self.thread.employer_unread_count, self.thread.worker_unread_count
+
+    def _read(self, user):
+        self.client.force_authenticate(user)
+        self.assertEqual(self.client.get(reverse("chat-messages", args=[self.thread.id])).status_code, 200)
+
+    def test_sending_counts_only_for_the_recipient(self):
+        self._send(self.worker, 2)
+        self.assertEqual(self._counts(), (2, 0))
+        self._send(self.employer)
+        self.assertEqual(self._counts(), (2, 1))
+        self.assertEqual(self.thread.unread_count_for(self.employer), 2)
+        self.assertEqual(self.thread.unread_count_for(self.worker), 1)
+
+    def test_reading_resets_only_the_readers_counter(self):
+        self._send(self.worker, 2)
+        self._send(self.employer)
+        self._read(self.employer)
+        self.assertEqual(self._counts(), (0, 1))
+        self.assertFalse(ChatMessage.objects.filter(sender=self.worker, is_read=False).exists())
+        self.assertTrue(ChatMessage.objects.filter(sender=self.employer, is_read=False).exists())
+
+        self._read(self.worker)
+        self.assertEqual(self._counts(), (0, 0))
+        self._send(self.worker)
+        self.assertEqual(self._counts(), (1, 0))
+
+    def test_mark_read_returns_the_number_marked_and_is_idempotent(self):
+        self._send(self.worker, 3)
+        self.assertEqual(self.thread.mark_read(self.employer), 3)
+        self.assertEqual(self.thread.mark_read(self.employer), 0)
+        self.assertEqual(self._counts(), (0, 0))
+
+
+class UserStatsTests(TestCase):
+    def setUp(self):
+        self.employer = _employer()
+        self.worker = _worker().user
+        self.job = _job(self.employer)
+
+    def _stats(self, user):
+        return UserStats.objects.get(user=user)
+
+    def _apply(self, job=None, worker=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Application.objects.create(job=job or self.job, worker=worker or self.worker)
+
+    def test_applications_count_on_create_and_delete(self):
+        application = self._apply()
+        self.assertEqual(self._stats(self.worker).applications_count, 1)
+        self.assertEqual(self._stats(self.employer).applications_received_count, 1)
+
+        application.status = "hired"
+        with self.captureOnCommitCallbacks(execute=True):
+            application.save()
+        self.assertEqual(self._stats(self.worker).hires_count, 1)
+        self.assertEqual(self._stats(self.employer).hires_made_count, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            application.delete()
+        self.assertEqual(self._stats(self.worker).applications_count, 0)
+        self.assertEqual(self._stats(self.worker).hires_count, 0)
+        self.assertEqual(self._stats(self.employer).applications_received_count, 0)
+
+    def test_deleting_a_job_refreshes_both_sides(self):
+        self._apply()
+        self._apply(job=_job(self.employer, title="Cook"))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.delete()
+        self.assertEqual(self._stats(self.worker).applications_count, 1)
+        self.assertEqual(self._stats(self.employer).applications_received_count, 1)
+
+    def test_offer_response_time(self):
+        application = self._apply()
+        with self.captureOnCommitCallbacks(execute=True):
+            offer = JobOffer.objects.create(
+                application=application, job=self.job, employer=self.employer, worker=self.worker
+            )
+        stats = self._stats(self.worker)
+        self.assertEqual((stats.offers_received_count, stats.offer_responses_count), (1, 0))
+        self.assertIsNone(stats.average_offer_response_seconds)
+        self.assertEqual(self._stats(self.employer).offers_sent_count, 1)
+
+        offer.status = "accepted"
+        offer.responded_at = offer.created_at + timedelta(hours=2)
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.save(update_fields=["status", "responded_at"])
+        stats = self._stats(self.worker)
+        self.assertEqual((stats.offers_accepted_count, stats.offer_responses_count), (1, 1))
+        self.assertEqual(stats.offer_response_seconds, 7200)
+        self.assertEqual(stats.average_offer_response_seconds, 7200)
+
+    def test_reconcile_restores_missing_and_stale_rows(self):
+        self._apply()
+        idle = _worker("idle@example.com").user
+        UserStats.objects.filter(user=self.worker).delete()
+        UserStats.objects.filter(user=self.employer).update(applications_received_count=5)
+
+        out = StringIO()
+        call_command("reconcile_user_stats", "--dry-run", stdout=out)
+        self.assertIn("1 rows missing, 1 rows out of date", out.getvalue())
+        self.assertFalse(UserStats.objects.filter(user=self.worker).exists())
+
+        out = StringIO()
+        call_command("reconcile_user_stats", "--chunk-size", "1", stdout=out)
+        self.assertIn("1 rows missing, 1 rows out of date", out.getvalue())
+        self.assertEqual(self._stats(self.worker).applications_count, 1)
+        self.assertEqual(self._stats(self.employer).applications_received_count, 1)
+        # All-zero users keep no row; readers treat that as zeros.
+        self.assertFalse(UserStats.objects.filter(user=idle).exists())
+
+        out = StringIO()
+        call_command("reconcile_user_stats", stdout=out)
+        self.assertIn("0 rows missing, 0 rows out of date", out.getvalue())
+
+
+class AgencyMatchMatrixTests(TestCase):
+    def setUp(self):
+        self.agency = get_user_model().objects.create_user(
+            email="agency@example.com", password="pass12345", role="agency"
+        )
+        employer = _employer()
+        self.nanny_job = _job(employer, title="Nanny needed", skills_required=["nanny"], location="Dubai")
+        self.cook_job = _job(employer, title="Cook", skills_required=["cooking"], location="Sharjah")
+        self.nanny = _worker("nanny@example.com", services=["nanny"], city="Dubai").user
+        self.cook = _worker("cook@example.com", services=["cooking"], city="Sharjah").user
+        self.rejected = _worker("rejected@example.com", services=["nanny"]).user
+        for worker, status in ((self.cook, "verified"), (self.nanny, "submitted"), (self.rejected, "rejected")):
+            AgencyWorkerSubmission.objects.create(agency=self.agency, worker=worker, status=status)
+        self.client = APIClient()
+        self.client.force_authenticate(self.agency)
+        self.url = reverse("agency-match-matrix")
+
+    def _matrix(self, payload):
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, 200, payload)
+        return json.loads(b"".join(response.streaming_content))
+
+    def _expected_scores(self, job, worker):
+        profile = get_user_model().objects.get(pk=worker).worker_profile
+        job = Job.objects.get(pk=job)
+        return matching.score_features(matching.job_features(job), matching.worker_features(profile))
+
+    def test_default_pool_is_the_agencys_non_rejected_submissions(self):
+        matrix = self._matrix({"job_ids": [self.cook_job.id, self.nanny_job.id]})
+        self.assertEqual(matrix["worker_ids"], sorted([self.nanny.id, self.cook.id]))
+        self.assertEqual([row["job_id"] for row in matrix["rows"]], [self.cook_job.id, self.nanny_job.id])
+
+    def test_scores_match_score_features(self):
+        matrix = self._matrix(
+            {"job_ids": [self.nanny_job.id, self.cook_job.id], "worker_ids": [self.cook.id, self.nanny.id]}
+        )
+        for row in matrix["rows"]:
+            expected = [self._expected_scores(row["job_id"], worker) for worker in matrix["worker_ids"]]
+            self.assertEqual(row["scores"], expected)
+        nanny_row = matrix["rows"][0]["scores"]
+        self.assertGreater(nanny_row[1], nanny_row[0])
+
+    def test_ids_parse_from_lists_and_comma_strings(self):
+        as_list = self._matrix({"job_ids": [self.nanny_job.id, self.nanny_job.id], "worker_ids": [self.cook.id]})
+        as_string = self._matrix(
+            {"job_ids": f"{self.nanny_job.id}, {self.nanny_job.id},", "worker_ids": str(self.cook.id)}
+        )
+        self.assertEqual(as_list, as_string)
+        self.assertEqual([row["job_id"] for row in as_list["rows"]], [self.nanny_job.id])
+
+        for payload in ({"job_ids": "1,x"}, {"job_ids": {"id": 1}}, {"job_ids": []}):
+            self.assertEqual(self.client.post(self.url, payload, format="json").status_code, 400, payload)
+
+    def test_unlisted_jobs_and_non_workers_are_left_out(self):
+        self.cook_job.review_status = "pending"
+        self.cook_job.save()
+        matrix = self._matrix(
+            {"job_ids": [self.cook_job.id, self.nanny_job.id], "worker_ids": [self.agency.id, self.nanny.id]}
+        )
+        self.assertEqual([row["job_id"] for row in matrix["rows"]], [self.nanny_job.id])
+        self.assertEqual(matrix["worker_ids"], [self.nanny.id])
+
+    def test_request_size_caps(self):
+        matrix = self._matrix({"job_ids": list(range(1, 201)), "worker_ids": [self.nanny.id]})
+        self.assertEqual(matrix["worker_ids"], [self.nanny.id])
+        self._matrix({"job_ids": [self.nanny_job.id], "worker_ids": list(range(1, 5001))})
+        for payload in (
+            {"job_ids": list(range(1, 202)), "worker_ids": [self.nanny.id]},
+            {"job_ids": [self.nanny_job.id], "worker_ids": list(range(1, 5002))},
+        ):
+            self.assertEqual(self.client.post(self.url, payload, format="json").status_code, 400)
+
+    def test_only_agencies(self):
+        self.client.force_authenticate(self.nanny)
+        self.assertEqual(self.client.post(self.url, {"job_ids": [self.nanny_job.id]}, format="json").status_code, 403)
+
+
+class ListQueryCountTests(TestCase):
+    """List endpoints issue a fixed number of queries however many rows they return."""
+
+    def setUp(self):
+        self.employer = _employer()
+        self.worker = _worker().user
+        self.client = APIClient()
+        self.client.force_authenticate(self.worker)
+
+    def _add_rows(self, count):
+        for index in range(count):
+            job = _job(self.employer, title=f"Job {index}")
+            application = Application.objects.create(job=job, worker=self.worker, status="interview")
+            JobOffer.objects.create(application=application, job=job, employer=self.employer, worker=self.worker)
+            SavedJob.objects.create(worker=self.worker, job=job)
+
+    def _assert_queries(self, expected, url, params=None):
+        for count in (1, 5):
+            self._add_rows(count)
+            with self.assertNumQueries(expected):
+                response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+
+    def test_available_jobs(self):
+        # The jobs, then the worker's applied job ids for has_applied.
+        self._assert_queries(2, reverse("available_jobs"))
+
+    def test_available_jobs_search_page(self):
+        self._assert_queries(2, reverse("available_jobs"), {"search": "job", "limit": 3})
+
+    def test_public_jobs(self):
+        # Plus the two ETag validator aggregates.
+        self._assert_queries(4, reverse("public-jobs"))
+
+    def test_saved_jobs(self):
+        self._assert_queries(2, reverse("worker-saved-jobs"))
+
+    def test_notifications(self):
+        # One validator aggregate and one list each for applications and offers.
+        self._assert_queries(4, reverse("worker-notifications"))
+
+
+class SparseFieldsTests(TestCase):
+    def setUp(self):
+        _job(_employer(), title="Nanny", description="Long description")
+        self.client = APIClient()
+        self.client.force_authenticate(_worker().user)
+        self.url = reverse("available_jobs")
+
+    def _keys(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return set(response.data[0])
+
+    def test_fields_trims_output_and_defers_unrequested_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self._keys({"fields": "id,title"}), {"id", "title"})
+        job_queries = [query["sql"] for query in queries.captured_queries if "jobs_job" in query["sql"]]
+        self.assertTrue(job_queries)
+        self.assertFalse([sql for sql in job_queries if "description" in sql])
+        self.assertIn("description", self._keys({}))
+
+    def test_unknown_fields_are_ignored(self):
+        self.assertEqual(self._keys({"fields": "id, title ,bogus"}), {"id", "title"})
+        self.assertEqual(self._keys({"fields": "bogus"}), set())
+        self.assertEqual(self._keys({"exclude": "bogus"}), self._keys({}))
+        self.assertEqual(self._keys({"exclude": "description,bogus"}), self._keys({}) - {"description"})
@@ -4,6 +4,7 @@ from . import views
 urlpatterns = [
     # Worker Endpoints
     path('jobs/public/', views.public_jobs, name='public-jobs'),
+    path('jobs/facets/', views.job_facet_counts, name='job-facets'),
     path('worker/available-jobs/', views.available_jobs, name='available_jobs'),
     path('worker/my-applications/', views.my_applications, name='my_applications'),
     path('worker/notifications/', views.worker_notifications, name='worker-notifications'),
@@ -13,6 +14,7 @@ urlpatterns = [
     
     # Employer Endpoints
     path('employer/jobs/', views.EmployerJobListView.as_view(), name='employer-jobs'),
+    path('employer/jobs/<int:job_id>/', views.employer_job_detail, name='employer-job-detail'),
     path('employer/jobs/<int:job_id>/applications/', views.employer_job_applications, name='employer-job-applications'),
     path('employer/jobs/<int:job_id>/status/', views.employer_job_status, name='employer-job-status'),
     path('employer/jobs/<int:job_id>/delete/', views.employer_delete_job, name='employer-delete-job'),
@@ -27,6 +29,7 @@ urlpatterns = [
     path('employer/application-history/', views.employer_application_history, name='employer-history'),
     path('agency/employers/', views.agency_employers, name='agency-employers'),
     path('agency/jobs/create-for-employer/', views.agency_post_job_for_employer, name='agency-job-create-for-employer'),
+    path('agency/match-matrix/', views.agency_match_matrix, name='agency-match-matrix'),
     path('reports/job-reviews/', views.government_job_reviews, name='government-job-reviews'),
     path('reports/job-reviews/<int:job_id>/', views.government_update_job_review, name='government-update-job-review'),
     path('reviews/', views.worker_reviews, name='worker-reviews'),
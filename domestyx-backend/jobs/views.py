@@ -1,5 +1,10 @@
+import heapq
+import json
+from functools import partial
+
 from django.contrib.auth import get_user_model
-from django.db.models import Avg, Count, F, Q
+from django.db.models import Count, F, Max, Sum
+from django.http import StreamingHttpResponse
 from rest_framework import generics, status
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
@@ -16,18 +21,30 @@ from .models import (
     ChatThread,
     EmployerReview,
     Job,
+    JobMatch,
     JobOffer,
     SavedJob,
     ShortlistedWorker,
+    UserStats,
     WorkerReview,
 )
+from domestyx_backend.conditional import conditional_get
+from users.models import AgencyWorkerSubmission, WorkerProfile
+
+from .cache import get_cached_job_feed, invalidate_job_feed, job_feed_cache_key, set_cached_job_feed
+from .facets import job_facets
+from .matching import candidate_profile_ids, job_features, score_matrix, worker_features
+from .pagination import ChatMessageCursorPagination, JobCursorPagination
+from .search import search_jobs
 from .serializers import (
     ApplicationSerializer,
     CallSessionSerializer,
     ChatMessageSerializer,
     ChatThreadSerializer,
+    EmployerJobDetailSerializer,
     EmployerReviewSerializer,
     JobSerializer,
+    JobSummarySerializer,
     JobOfferSerializer,
     SavedJobSerializer,
     ShortlistedWorkerSerializer,
@@ -36,51 +53,22 @@ from .serializers import (
 
 User = get_user_model()
 
+RECOMMENDED_JOBS_LIMIT = 20
+RECOMMENDED_WORKERS_LIMIT = 30
+MATCH_MATRIX_MAX_JOBS = 200
+MATCH_MATRIX_MAX_WORKERS = 5000
+
 
 def _user_role(user):
     return (getattr(user, "role", "") or "").strip().lower()
 
 
-def _normalize_list(value):
-    if isinstance(value, list):
-        return [str(item).strip().lower() for item in value if str(item).strip()]
-    if isinstance(value, str):
-        return [item.strip().lower() for item in value.split(",") if item.strip()]
-    return []
-
-
-def _score_worker_for_job(job, worker_profile):
-    score = 0
-    job_text = f"{job.title} {job.description}".lower()
-    worker_services = set(_normalize_list(worker_profile.services))
-    worker_languages = set(_normalize_list(worker_profile.languages))
-    required_skills = set(_normalize_list(getattr(job, "skills_required", [])))
-    required_languages = set(_normalize_list(getattr(job, "language_requirements", [])))
-
-    score += sum(1 for service in worker_services if service in job_text)
-    score += min(sum(1 for language in worker_languages if language in job_text), 2)
-    score += sum(2 for skill in worker_services if skill in required_skills)
-    score += sum(1 for language in worker_languages if language in required_languages)
-
-    preferred_nationality = (getattr(job, "preferred_nationality", "") or "").strip().lower()
-    worker_nationality = (getattr(worker_profile, "nationality", "") or "").strip().lower()
-    if preferred_nationality and worker_nationality and preferred_nationality == worker_nationality:
-        score += 2
-
-    job_location = (job.location or "").lower()
-    location_parts = {
-        (worker_profile.city or "").lower(),
-        (worker_profile.state or "").lower(),
-        (worker_profile.country or "").lower(),
-    }
-    if any(part and part in job_location for part in location_parts):
-        score += 2
-
-    return score
-
-
-def _score_job_for_worker(job, worker_profile):
-    return _score_worker_for_job(job, worker_profile)
+def _user_stats(user):
+    try:
+        return user.stats
+    except UserStats.DoesNotExist:
+        # Users with no applications, offers or reviews yet have no row.
+        return UserStats(user=user)
 
 
 def _worker_snapshot(worker):
@@ -125,99 +113,139 @@ def _worker_snapshot(worker):
     }
 
 
-# 1. Browse Jobs (for Workers)
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def available_jobs(request):
-    search_query = request.query_params.get('search', '') or request.query_params.get('q', '')
-    category = request.query_params.get('category', '') or request.query_params.get('job_type', '')
-    location = request.query_params.get('location', '')
-    min_salary = request.query_params.get('min_salary', '')
-    max_salary = request.query_params.get('max_salary', '')
-    jobs = Job.objects.filter(status='active', review_status='approved').order_by('-posted_at')
-    
+def _listing_jobs(params):
+    """Active, approved jobs narrowed by the shared listing filters.
+
+    Raises ValueError when the salary bounds are not numeric.
+    """
+    search_query = params.get('search', '') or params.get('q', '')
+    category = params.get('category', '') or params.get('job_type', '')
+    location = params.get('location', '')
+    min_salary = params.get('min_salary', '')
+    max_salary = params.get('max_salary', '')
+    jobs = Job.objects.filter(status='active', review_status='approved').select_related('employer').order_by('-posted_at')
+
     if search_query:
-        jobs = jobs.filter(
-            Q(title__icontains=search_query) | 
-            Q(location__icontains=search_query) |
-            Q(description__icontains=search_query)
-        )
+        jobs = search_jobs(jobs, search_query)
     if category and category != 'all':
         jobs = jobs.filter(job_type__icontains=category)
     if location:
         jobs = jobs.filter(location__icontains=location)
+    # A job matches when any of its stated amounts falls within the bounds.
+    if min_salary != "":
+        jobs = jobs.filter(salary_max__gte=float(min_salary))
+    if max_salary != "":
+        jobs = jobs.filter(salary_min__lte=float(max_salary))
+    return jobs
+
+
+def _queryset_validator(queryset, *timestamp_fields, **aggregates):
+    """Summarize ``queryset`` as an ETag validator for conditional GETs.
+
+    The validator combines the row count, the latest value of each of
+    ``timestamp_fields`` and any extra ``aggregates`` in a single query.
+    No Last-Modified is derived from it: deleting a row or resetting an
+    unread counter changes the body without advancing any timestamp, so an
+    If-Modified-Since check would answer 304 with stale data.
+    """
+    summary = queryset.order_by().aggregate(
+        _count=Count('id', distinct=True),
+        **{f'_latest_{index}': Max(field) for index, field in enumerate(timestamp_fields)},
+        **aggregates,
+    )
+    return tuple(sorted(summary.items()))
+
+
+def _job_list_response(request, jobs, serializer_class=JobSummarySerializer):
+    context = {'request': request}
+    jobs = serializer_class.defer_unrequested_fields(jobs, request)
+    paginator = JobCursorPagination()
+    page = paginator.paginate_queryset(jobs, request)
+    if page is None:
+        return Response(serializer_class(jobs, many=True, context=context).data)
+    return paginator.get_paginated_response(serializer_class(page, many=True, context=context).data)
+
+
+# 1. Browse Jobs (for Workers)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def available_jobs(request):
     try:
-        if min_salary != "":
-            min_val = float(min_salary)
-            jobs = jobs.filter(
-                Q(full_time_salary__gte=min_val) |
-                Q(part_time_salary__gte=min_val) |
-                Q(hourly_wage__gte=min_val)
-            )
-        if max_salary != "":
-            max_val = float(max_salary)
-            jobs = jobs.filter(
-                Q(full_time_salary__lte=max_val) |
-                Q(part_time_salary__lte=max_val) |
-                Q(hourly_wage__lte=max_val)
-            )
+        jobs = _listing_jobs(request.query_params)
     except ValueError:
         return Response({"error": "min_salary/max_salary must be numeric."}, status=status.HTTP_400_BAD_REQUEST)
-        
-    serializer = JobSerializer(jobs, many=True, context={'request': request})
-    return Response(serializer.data)
+
+    return _job_list_response(request, jobs)
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def public_jobs(request):
-    search_query = request.query_params.get('search', '') or request.query_params.get('q', '')
-    category = request.query_params.get('category', '') or request.query_params.get('job_type', '')
-    location = request.query_params.get('location', '')
-    min_salary = request.query_params.get('min_salary', '')
-    max_salary = request.query_params.get('max_salary', '')
-    jobs = Job.objects.filter(status='active', review_status='approved').order_by('-posted_at')
-    
-    if search_query:
-        jobs = jobs.filter(
-            Q(title__icontains=search_query) | 
-            Q(location__icontains=search_query) |
-            Q(description__icontains=search_query)
-        )
-    if category and category != 'all':
-        jobs = jobs.filter(job_type__icontains=category)
-    if location:
-        jobs = jobs.filter(location__icontains=location)
-    try:
-        if min_salary != "":
-            min_val = float(min_salary)
-            jobs = jobs.filter(
-                Q(full_time_salary__gte=min_val) |
-                Q(part_time_salary__gte=min_val) |
-                Q(hourly_wage__gte=min_val)
-            )
-        if max_salary != "":
-            max_val = float(max_salary)
-            jobs = jobs.filter(
-                Q(full_time_salary__lte=max_val) |
-                Q(part_time_salary__lte=max_val) |
-                Q(hourly_wage__lte=max_val)
+    # Anonymous responses carry no per-user state, so they are shared via the feed cache.
+    cache_key = None
+    if not request.user.is_authenticated:
+        cache_key = job_feed_cache_key(request)
+        cached = get_cached_job_feed(cache_key)
+        if cached is not None:
+            return conditional_get(
+                request, cached["validator"], lambda: Response(cached["data"]), private=False
             )
+
+    try:
+        jobs = _listing_jobs(request.query_params)
     except ValueError:
         return Response({"error": "min_salary/max_salary must be numeric."}, status=status.HTTP_400_BAD_REQUEST)
-        
-    serializer = JobSerializer(jobs, many=True)
-    return Response(serializer.data)
+
+    validator = _queryset_validator(jobs, 'updated_at')
+    if cache_key is None:
+        # has_applied flags change with the worker's own applications.
+        validator += _queryset_validator(Application.objects.filter(worker=request.user), 'applied_at')
+    response = conditional_get(
+        request, validator, partial(_job_list_response, request, jobs), private=cache_key is None
+    )
+    if cache_key is not None and response.status_code == 200:
+        set_cached_job_feed(cache_key, {"validator": validator, "data": response.data})
+    return response
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def job_facet_counts(request):
+    cache_key = job_feed_cache_key(request, namespace="facets")
+    cached = get_cached_job_feed(cache_key)
+    if cached is not None:
+        return Response(cached)
+
+    try:
+        jobs = _listing_jobs(request.query_params)
+    except ValueError:
+        return Response({"error": "min_salary/max_salary must be numeric."}, status=status.HTTP_400_BAD_REQUEST)
+
+    payload = job_facets(jobs)
+    set_cached_job_feed(cache_key, payload)
+    return Response(payload)
 
 # 2. Employer's Posted Jobs (The missing class that caused the Build Error)
 class EmployerJobListView(generics.ListCreateAPIView):
     serializer_class = JobSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = JobCursorPagination
+
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return JobSummarySerializer
+        return JobSerializer
 
     def get_queryset(self):
         if _user_role(self.request.user) != 'employer':
             return Job.objects.none()
-        return Job.objects.filter(employer=self.request.user).order_by('-posted_at')
+        queryset = Job.objects.filter(employer=self.request.user).select_related('employer').order_by('-posted_at')
+        if self.request.method == 'GET':
+            queryset = JobSummarySerializer.defer_unrequested_fields(queryset, self.request)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        validator = _queryset_validator(self.get_queryset(), 'updated_at')
+        return conditional_get(request, validator, partial(super().list, request, *args, **kwargs))
         
     def perform_create(self, serializer):
         if _user_role(self.request.user) != 'employer':
@@ -225,6 +253,22 @@ class EmployerJobListView(generics.ListCreateAPIView):
         serializer.save(employer=self.request.user, review_status="pending")
 
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def employer_job_detail(request, job_id):
+    if _user_role(request.user) != "employer":
+        return Response({"message": "Only employers can view job details."}, status=status.HTTP_403_FORBIDDEN)
+    try:
+        job = (
+            Job.objects.select_related("employer")
+            .prefetch_related("job_applications__worker__worker_profile")
+            .get(id=job_id, employer=request.user)
+        )
+    except Job.DoesNotExist:
+        return Response({"error": "Job not found."}, status=status.HTTP_404_NOT_FOUND)
+    return Response(EmployerJobDetailSerializer(job, context={"request": request}).data)
+
+
 @api_view(["PATCH"])
 @permission_classes([IsAuthenticated])
 def employer_job_status(request, job_id):
@@ -301,6 +345,67 @@ def agency_post_job_for_employer(request):
     return Response(JobSerializer(job, context={"request": request}).data, status=status.HTTP_201_CREATED)
 
 
+def _id_list(value):
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, (list, tuple)):
+        raise ValueError
+    return list(dict.fromkeys(int(pk) for pk in value if str(pk).strip()))
+
+
+def _match_matrix_rows(jobs, workers, scores):
+    yield f'{{"worker_ids": {json.dumps([worker.user_id for worker in workers])}, "rows": ['
+    for row, job in enumerate(jobs):
+        line = json.dumps({"job_id": job.id, "scores": [int(score) for score in scores[row]]})
+        yield f'{"," if row else ""}\n{line}'
+    yield "\n]}\n"
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def agency_match_matrix(request):
+    """Score a set of jobs against a set of workers in one pass.
+
+    ``job_ids`` is required; ``worker_ids`` defaults to the agency's submitted
+    worker pool. The response streams one row per job, with scores aligned to
+    ``worker_ids``.
+    """
+    if _user_role(request.user) != "agency":
+        return Response({"message": "Only agencies can compute match matrices."}, status=status.HTTP_403_FORBIDDEN)
+
+    try:
+        job_ids = _id_list(request.data.get("job_ids") or [])
+        worker_ids = _id_list(request.data.get("worker_ids") or [])
+    except (TypeError, ValueError):
+        return Response({"error": "job_ids and worker_ids must be lists of integers."}, status=status.HTTP_400_BAD_REQUEST)
+    if not job_ids:
+        return Response({"error": "job_ids is required."}, status=status.HTTP_400_BAD_REQUEST)
+    if not worker_ids:
+        worker_ids = list(
+            AgencyWorkerSubmission.objects.filter(agency=request.user)
+            .exclude(status="rejected")
+            .order_by("worker_id")
+            .values_list("worker_id", flat=True)
+        )
+    if len(job_ids) > MATCH_MATRIX_MAX_JOBS or len(worker_ids) > MATCH_MATRIX_MAX_WORKERS:
+        return Response(
+            {"error": f"At most {MATCH_MATRIX_MAX_JOBS} jobs and {MATCH_MATRIX_MAX_WORKERS} workers per request."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    jobs = Job.objects.filter(id__in=job_ids, status="active", review_status="approved").only("id", "match_features")
+    jobs_map = {job.id: job for job in jobs}
+    jobs = [jobs_map[job_id] for job_id in job_ids if job_id in jobs_map]
+    profiles = WorkerProfile.objects.filter(user_id__in=worker_ids, user__role="worker").only(
+        "id", "user_id", "match_features"
+    )
+    profiles_map = {profile.user_id: profile for profile in profiles}
+    workers = [profiles_map[worker_id] for worker_id in worker_ids if worker_id in profiles_map]
+
+    scores = score_matrix([job_features(job) for job in jobs], [worker_features(profile) for profile in workers])
+    return StreamingHttpResponse(_match_matrix_rows(jobs, workers, scores), content_type="application/json")
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def government_job_reviews(request):
@@ -311,7 +416,7 @@ def government_job_reviews(request):
     queryset = Job.objects.select_related("employer").order_by("-posted_at")
     if status_filter:
         queryset = queryset.filter(review_status=status_filter)
-    return Response(JobSerializer(queryset, many=True).data)
+    return _job_list_response(request, queryset)
 
 
 @api_view(["PATCH"])
@@ -342,8 +447,9 @@ def my_applications(request):
     if _user_role(request.user) != 'worker':
         return Response({'message': 'Only workers can view applications.'}, status=status.HTTP_403_FORBIDDEN)
 
-    applications = Application.objects.filter(worker=request.user).order_by('-applied_at')
-    serializer = ApplicationSerializer(applications, many=True)
+    applications = Application.objects.filter(worker=request.user).select_related('job', 'job__employer', 'worker', 'worker__worker_profile').order_by('-applied_at')
+    applications = ApplicationSerializer.defer_unrequested_fields(applications, request)
+    serializer = ApplicationSerializer(applications, many=True, context={'request': request})
     return Response(serializer.data)
 
 
@@ -353,40 +459,43 @@ def worker_notifications(request):
     if _user_role(request.user) != "worker":
         return Response({"message": "Only workers can view notifications."}, status=status.HTTP_403_FORBIDDEN)
 
-    applications = (
-        Application.objects.filter(worker=request.user)
-        .exclude(status="applied")
-        .select_related("job", "job__employer")
-        .order_by("-applied_at")[:50]
-    )
-    payload = [
-        {
-            "id": app.id,
-            "job_id": app.job_id,
-            "job_title": app.job.title,
-            "employer_name": f"{app.job.employer.first_name} {app.job.employer.last_name}".strip() or app.job.employer.email,
-            "status": app.status,
-            "updated_at": app.applied_at,
-            "message": f"Your application for {app.job.title} is now {app.status}.",
-        }
-        for app in applications
-    ]
-    offers = JobOffer.objects.filter(worker=request.user).select_related("job", "employer").order_by("-created_at")[:50]
-    payload.extend(
-        [
+    applications = Application.objects.filter(worker=request.user).exclude(status="applied")
+    offers = JobOffer.objects.filter(worker=request.user)
+    application_validator = _queryset_validator(applications, "updated_at", "job__updated_at")
+    offer_validator = _queryset_validator(offers, "updated_at", "job__updated_at")
+
+    def render():
+        recent_applications = applications.select_related("job", "job__employer").order_by("-applied_at")[:50]
+        payload = [
             {
-                "id": 100000 + offer.id,
-                "job_id": offer.job_id,
-                "job_title": offer.job.title,
-                "employer_name": f"{offer.employer.first_name} {offer.employer.last_name}".strip() or offer.employer.email,
-                "status": offer.status,
-                "updated_at": offer.responded_at or offer.created_at,
-                "message": f"Offer for {offer.job.title}: {offer.status}.",
+                "id": app.id,
+                "job_id": app.job_id,
+                "job_title": app.job.title,
+                "employer_name": f"{app.job.employer.first_name} {app.job.employer.last_name}".strip() or app.job.employer.email,
+                "status": app.status,
+                "updated_at": app.applied_at,
+                "message": f"Your application for {app.job.title} is now {app.status}.",
             }
-            for offer in offers
+            for app in recent_applications
         ]
-    )
-    return Response(payload)
+        recent_offers = offers.select_related("job", "employer").order_by("-created_at")[:50]
+        payload.extend(
+            [
+                {
+                    "id": 100000 + offer.id,
+                    "job_id": offer.job_id,
+                    "job_title": offer.job.title,
+                    "employer_name": f"{offer.employer.first_name} {offer.employer.last_name}".strip() or offer.employer.email,
+                    "status": offer.status,
+                    "updated_at": offer.responded_at or offer.created_at,
+                    "message": f"Offer for {offer.job.title}: {offer.status}.",
+                }
+                for offer in recent_offers
+            ]
+        )
+        return Response(payload)
+
+    return conditional_get(request, (application_validator, offer_validator), render)
 
 
 @api_view(["GET", "POST", "DELETE"])
@@ -435,6 +544,9 @@ def compare_jobs(request):
         return Response({"error": "job_ids must be comma-separated integers."}, status=status.HTTP_400_BAD_REQUEST)
 
     jobs = Job.objects.filter(id__in=id_list, status="active", review_status="approved").select_related("employer")
+    jobs = JobSerializer.defer_unrequested_fields(jobs, request)
+    if "cursor" in request.query_params or "limit" in request.query_params:
+        return _job_list_response(request, jobs, serializer_class=JobSerializer)
     jobs_map = {job.id: job for job in jobs}
     ordered_jobs = [jobs_map[job_id] for job_id in id_list if job_id in jobs_map]
     serializer = JobSerializer(ordered_jobs, many=True, context={"request": request})
@@ -470,7 +582,8 @@ def apply_to_job(request, job_id):
         supporting_document=request.FILES.get("supporting_document"),
         status='applied'
     )
-    Job.objects.filter(id=job.id).update(applications=F('applications') + 1)
+    Job.objects.filter(id=job.id).update(applications=F('applications') + 1, updated_at=timezone.now())
+    invalidate_job_feed()
     
     return Response(ApplicationSerializer(application).data, status=status.HTTP_201_CREATED)
 
@@ -518,9 +631,10 @@ def employer_application_history(request):
 
     history = Application.objects.filter(
         job__employer=request.user
-    ).select_related('job', 'worker').exclude(status='applied').order_by('-applied_at')
-    
-    serializer = ApplicationSerializer(history, many=True)
+    ).select_related('job', 'job__employer', 'worker', 'worker__worker_profile').exclude(status='applied').order_by('-applied_at')
+    history = ApplicationSerializer.defer_unrequested_fields(history, request)
+
+    serializer = ApplicationSerializer(history, many=True, context={'request': request})
     return Response(serializer.data)
 
 
@@ -536,11 +650,12 @@ def employer_job_applications(request, job_id):
         return Response({'message': 'Job not found.'}, status=status.HTTP_404_NOT_FOUND)
 
     status_filter = (request.query_params.get('status') or '').strip().lower()
-    applications = Application.objects.filter(job=job).order_by('-applied_at')
+    applications = Application.objects.filter(job=job).select_related('job', 'job__employer', 'worker', 'worker__worker_profile').order_by('-applied_at')
     if status_filter:
         applications = applications.filter(status=status_filter)
+    applications = ApplicationSerializer.defer_unrequested_fields(applications, request)
 
-    serializer = ApplicationSerializer(applications, many=True)
+    serializer = ApplicationSerializer(applications, many=True, context={'request': request})
     return Response(serializer.data)
 
 
@@ -554,23 +669,42 @@ def recommended_jobs(request):
     if not profile:
         return Response([], status=status.HTTP_200_OK)
 
-    scored_jobs = []
-    for job in Job.objects.filter(status='active', review_status='approved').order_by('-posted_at'):
-        score = _score_job_for_worker(job, profile)
-        if score > 0:
-            scored_jobs.append((score, job))
-
-    scored_jobs.sort(key=lambda item: (item[0], item[1].posted_at), reverse=True)
-    jobs = [job for _, job in scored_jobs[:20]]
-    scores = {job.id: score for score, job in scored_jobs[:20]}
+    # JobMatch is indexed per worker in rank order, so the top K is a LIMIT on one index.
+    matches = (
+        JobMatch.objects.filter(worker=request.user, job__status='active', job__review_status='approved')
+        .select_related('job', 'job__employer')
+        .order_by('-score', '-posted_at')[:RECOMMENDED_JOBS_LIMIT]
+    )
+    jobs = [match.job for match in matches]
+    scores = {match.job_id: match.score for match in matches}
 
-    serializer = JobSerializer(jobs, many=True, context={'request': request})
+    serializer = JobSummarySerializer(jobs, many=True, context={'request': request})
     data = serializer.data
     for item in data:
         item['match_score'] = scores.get(item['id'], 0)
     return Response(data)
 
 
+def _worker_recommendation(worker, score):
+    profile = worker.worker_profile
+    return {
+        'worker_id': worker.id,
+        'name': f'{worker.first_name} {worker.last_name}'.strip(),
+        'email': worker.email,
+        'phone': profile.phone,
+        'experience': profile.experience,
+        'services': profile.services,
+        'languages': profile.languages,
+        'location': {
+            'city': profile.city,
+            'state': profile.state,
+            'country': profile.country,
+        },
+        'profile_image': profile.profile_image.url if profile.profile_image else None,
+        'match_score': score,
+    }
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def recommended_workers(request, job_id):
@@ -582,34 +716,23 @@ def recommended_workers(request, job_id):
     except Job.DoesNotExist:
         return Response({'message': 'Job not found.'}, status=status.HTTP_404_NOT_FOUND)
 
-    workers = User.objects.filter(role='worker').select_related('worker_profile')
-    recommendations = []
-    for worker in workers:
-        profile = getattr(worker, 'worker_profile', None)
-        if not profile:
-            continue
-        score = _score_worker_for_job(job, profile)
-        if score <= 0:
-            continue
-        recommendations.append({
-            'worker_id': worker.id,
-            'name': f'{worker.first_name} {worker.last_name}'.strip(),
-            'email': worker.email,
-            'phone': profile.phone,
-            'experience': profile.experience,
-            'services': profile.services,
-            'languages': profile.languages,
-            'location': {
-                'city': profile.city,
-                'state': profile.state,
-                'country': profile.country,
-            },
-            'profile_image': profile.profile_image.url if profile.profile_image else None,
-            'match_score': score,
-        })
-
-    recommendations.sort(key=lambda item: item['match_score'], reverse=True)
-    return Response(recommendations[:30])
+    # Score lightweight feature rows, then load full records for the winners only.
+    profiles = list(
+        WorkerProfile.objects.filter(pk__in=candidate_profile_ids(job), user__role='worker')
+        .only('id', 'user_id', 'match_features')
+        .order_by('user_id')
+    )
+    scores = score_matrix([job_features(job)], [worker_features(profile) for profile in profiles])[0]
+    top = heapq.nlargest(
+        RECOMMENDED_WORKERS_LIMIT,
+        (index for index in range(len(profiles)) if scores[index] > 0),
+        key=lambda index: scores[index],
+    )
+    workers = User.objects.select_related('worker_profile').in_bulk([profiles[index].user_id for index in top])
+    return Response([
+        _worker_recommendation(workers[profiles[index].user_id], int(scores[index]))
+        for index in top
+    ])
 
 
 @api_view(['POST', 'DELETE'])
@@ -665,7 +788,7 @@ def shortlisted_workers(request):
     if job_id:
         queryset = queryset.filter(job_id=job_id)
 
-    serializer = ShortlistedWorkerSerializer(queryset.order_by('-created_at'), many=True)
+    serializer = ShortlistedWorkerSerializer(queryset.order_by('-created_at'), many=True, context={'request': request})
     return Response(serializer.data)
 
 
@@ -687,19 +810,19 @@ def compare_workers(request):
     if not id_list:
         return Response({'error': 'No valid worker IDs provided.'}, status=status.HTTP_400_BAD_REQUEST)
 
-    workers = User.objects.filter(id__in=id_list, role='worker').select_related('worker_profile')
+    workers = User.objects.filter(id__in=id_list, role='worker').select_related('worker_profile', 'stats')
     worker_map = {worker.id: worker for worker in workers}
     comparison = []
     for worker_id in id_list:
         worker = worker_map.get(worker_id)
         if not worker:
             continue
+        stats = _user_stats(worker)
         item = _worker_snapshot(worker)
-        item['total_applications'] = Application.objects.filter(worker=worker).count()
-        item['total_hired'] = Application.objects.filter(worker=worker, status='hired').count()
-        review_agg = WorkerReview.objects.filter(worker=worker).aggregate(avg=Avg("rating"), count=Count("id"))
-        item['average_rating'] = round(float(review_agg["avg"]), 2) if review_agg["avg"] is not None else None
-        item['total_reviews'] = review_agg["count"] or 0
+        item['total_applications'] = stats.applications_count
+        item['total_hired'] = stats.hires_count
+        item['average_rating'] = stats.worker_average_rating
+        item['total_reviews'] = stats.worker_reviews_count
         comparison.append(item)
 
     return Response(comparison)
@@ -716,7 +839,8 @@ def worker_reviews(request):
             queryset = WorkerReview.objects.filter(worker=request.user).select_related("reviewer", "job")
         else:
             queryset = WorkerReview.objects.none()
-        serializer = WorkerReviewSerializer(queryset.order_by("-created_at"), many=True)
+        queryset = WorkerReviewSerializer.defer_unrequested_fields(queryset, request)
+        serializer = WorkerReviewSerializer(queryset.order_by("-created_at"), many=True, context={"request": request})
         return Response(serializer.data)
 
     if role != "employer":
@@ -777,7 +901,8 @@ def employer_reviews(request):
             queryset = EmployerReview.objects.filter(employer=request.user).select_related("reviewer", "job")
         else:
             queryset = EmployerReview.objects.none()
-        serializer = EmployerReviewSerializer(queryset.order_by("-created_at"), many=True)
+        queryset = EmployerReviewSerializer.defer_unrequested_fields(queryset, request)
+        serializer = EmployerReviewSerializer(queryset.order_by("-created_at"), many=True, context={"request": request})
         return Response(serializer.data)
 
     if role != "worker":
@@ -840,9 +965,24 @@ def _thread_queryset_for_user(user):
 def chat_threads(request):
     role = _user_role(request.user)
     if request.method == "GET":
-        queryset = _thread_queryset_for_user(request.user).select_related("employer", "worker", "job").order_by("-created_at")
-        serializer = ChatThreadSerializer(queryset, many=True, context={"request": request})
-        return Response(serializer.data)
+        threads = _thread_queryset_for_user(request.user)
+        unread_field = "employer_unread_count" if role == "employer" else "worker_unread_count"
+        validator = _queryset_validator(
+            threads,
+            "created_at",
+            "last_activity_at",
+            "job__updated_at",
+            last_messages=Sum("last_message_id"),
+            unread_count=Sum(unread_field),
+        )
+
+        def render():
+            queryset = threads.select_related("employer", "worker", "job", "last_message").order_by(
+                "-last_activity_at", "-id"
+            )
+            return Response(ChatThreadSerializer(queryset, many=True, context={"request": request}).data)
+
+        return conditional_get(request, validator, render)
 
     job = None
     job_id = request.data.get("job_id")
@@ -890,10 +1030,21 @@ def chat_messages(request, thread_id):
         return Response({"message": "Not allowed to access this thread."}, status=status.HTTP_403_FORBIDDEN)
 
     if request.method == "GET":
-        messages = thread.messages.select_related("sender").order_by("created_at")
-        thread.messages.exclude(sender=request.user).filter(is_read=False).update(is_read=True)
-        serializer = ChatMessageSerializer(messages, many=True)
-        return Response(serializer.data)
+        messages = thread.messages.select_related("sender").order_by("created_at", "id")
+        paginator = ChatMessageCursorPagination()
+        page = paginator.paginate_queryset(messages, request)
+        shown = list(messages) if page is None else page
+        if shown:
+            # Everything up to the newest message shown becomes read, including older pages the
+            # client has not fetched yet; a ``before`` page leaves newer messages unread.
+            thread.mark_read(request.user, up_to=shown[-1])
+            for message in shown:
+                if message.sender_id != request.user.id:
+                    message.is_read = True
+        data = ChatMessageSerializer(shown, many=True, context={"request": request}).data
+        if page is None:
+            return Response(data)
+        return paginator.get_paginated_response(data)
 
     text = (request.data.get("message") or "").strip()
     if not text:
@@ -921,7 +1072,7 @@ def chat_calls(request, thread_id):
 
     if request.method == "GET":
         queryset = thread.call_sessions.order_by("-started_at")
-        return Response(CallSessionSerializer(queryset, many=True).data)
+        return Response(CallSessionSerializer(queryset, many=True, context={"request": request}).data)
 
     if request.method == "POST":
         receiver_id = thread.worker_id if request.user.id == thread.employer_id else thread.employer_id
@@ -970,8 +1121,9 @@ def employer_offers(request):
         return Response({"message": "Only employers can manage offers."}, status=status.HTTP_403_FORBIDDEN)
 
     if request.method == "GET":
-        queryset = JobOffer.objects.filter(employer=request.user).select_related("job", "worker", "application").order_by("-created_at")
-        return Response(JobOfferSerializer(queryset, many=True).data)
+        queryset = JobOffer.objects.filter(employer=request.user).select_related("job", "worker", "employer", "application").order_by("-created_at")
+        queryset = JobOfferSerializer.defer_unrequested_fields(queryset, request)
+        return Response(JobOfferSerializer(queryset, many=True, context={"request": request}).data)
 
     application_id = request.data.get("application_id")
     if not application_id:
@@ -997,8 +1149,9 @@ def employer_offers(request):
 def worker_offers(request):
     if _user_role(request.user) != "worker":
         return Response({"message": "Only workers can view offers."}, status=status.HTTP_403_FORBIDDEN)
-    queryset = JobOffer.objects.filter(worker=request.user).select_related("job", "employer", "application").order_by("-created_at")
-    return Response(JobOfferSerializer(queryset, many=True).data)
+    queryset = JobOffer.objects.filter(worker=request.user).select_related("job", "employer", "worker", "application").order_by("-created_at")
+    queryset = JobOfferSerializer.defer_unrequested_fields(queryset, request)
+    return Response(JobOfferSerializer(queryset, many=True, context={"request": request}).data)
 
 
 @api_view(["PATCH"])
@@ -0,0 +1,37 @@
+# realtime/__init__.py
+"""Server push for chat, call signalling and support conversations.
+
+Clients open a WebSocket on ``/ws/`` with their SimpleJWT access token (see
+``realtime.gateway``) and receive every event addressed to their account as
+``{"type": ..., "data": ...}`` JSON, so they no longer poll the chat, call and
+support message endpoints. Events are published per user on the broker named
+by ``REALTIME_BROKER`` once the transaction that produced them commits
+(``realtime.events``).
+"""
+import json
+from functools import lru_cache, partial
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+from rest_framework.utils.encoders import JSONEncoder
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    return import_string(settings.REALTIME_BROKER)()
+
+
+def user_channel(user_id):
+    return f"user.{user_id}"
+
+
+def publish(user_ids, event_type, data):
+    message = json.dumps({"type": event_type, "data": data}, cls=JSONEncoder)
+    broker = get_broker()
+    for user_id in sorted({user_id for user_id in user_ids if user_id}):
+        broker.publish(user_channel(user_id), message)
+
+
+def schedule_publish(user_ids, event_type, data, using="default"):
+    transaction.on_commit(partial(publish, user_ids, event_type, data), using=using)
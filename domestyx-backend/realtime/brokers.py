@@ -0,0 +1,83 @@
+# realtime/brokers.py
+"""Pub/sub backends that carry events from Django code to WebSocket connections.
+
+A broker moves JSON strings between named channels. ``publish`` is called
+synchronously from request and signal code; ``subscribe`` is awaited by the
+gateway on the event loop serving the socket. ``InMemoryBroker`` only reaches
+sockets served by the same process; deployments that run several server
+processes point ``REALTIME_BROKER`` at a broker backed by shared
+infrastructure implementing the same two methods.
+"""
+import asyncio
+import threading
+
+
+class SubscriptionOverflow(Exception):
+    """The subscriber fell too far behind and missed events."""
+
+
+class BaseBroker:
+    def publish(self, channel, message):
+        raise NotImplementedError
+
+    async def subscribe(self, channel):
+        """Return a subscription with ``async get()`` and ``close()``."""
+        raise NotImplementedError
+
+
+class InMemorySubscription:
+    def __init__(self, broker, channel, max_pending):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        self.overflowed = False
+
+    def deliver(self, message):
+        # Runs on the subscriber's loop, scheduled by publish().
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self):
+        if self.overflowed:
+            raise SubscriptionOverflow(self.channel)
+        return await self.queue.get()
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InMemoryBroker(BaseBroker):
+    """Process-local broker; also the stand-in for external brokers in tests."""
+
+    max_pending = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = {}
+
+    def publish(self, channel, message):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, message)
+            except RuntimeError:
+                # The subscriber's loop has shut down.
+                self.unsubscribe(subscription)
+
+    async def subscribe(self, channel):
+        subscription = InMemorySubscription(self, channel, self.max_pending)
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.channel]
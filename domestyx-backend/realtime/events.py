@@ -0,0 +1,37 @@
+# realtime/events.py
+"""Events pushed to conversation participants; called from model signal receivers.
+
+Payloads use the same serializers as the REST endpoints, so a pushed item
+matches what the next poll would have returned. Serializers are imported
+lazily because they import the models whose receivers call in here.
+"""
+from realtime import schedule_publish
+
+
+def chat_message_created(message, using="default"):
+    from jobs.serializers import ChatMessageSerializer
+
+    thread = message.thread
+    schedule_publish(
+        [thread.employer_id, thread.worker_id], "chat.message", ChatMessageSerializer(message).data, using=using
+    )
+
+
+def call_session_saved(call, using="default"):
+    from jobs.serializers import CallSessionSerializer
+
+    schedule_publish(
+        [call.requester_id, call.receiver_id], "call.session", CallSessionSerializer(call).data, using=using
+    )
+
+
+def support_message_created(message, using="default"):
+    from users.serializers import SupportServiceMessageSerializer
+
+    support_request = message.request
+    schedule_publish(
+        [support_request.requester_id, support_request.provider_id],
+        "support.message",
+        SupportServiceMessageSerializer(message).data,
+        using=using,
+    )
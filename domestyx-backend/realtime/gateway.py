@@ -0,0 +1,105 @@
+# realtime/gateway.py
+"""ASGI WebSocket endpoint delivering realtime events to authenticated users.
+
+Clients connect to ``/ws/?token=<access token>`` (or send an
+``Authorization: Bearer`` header where their client allows it) using the
+same SimpleJWT access tokens as the REST API. Unauthenticated handshakes are
+refused with close code 4401, and open sockets are closed with 4401 when the
+token expires so the client reconnects with a refreshed one. A client that
+falls too far behind is closed with 1013 and should catch up through the REST
+endpoints (``after`` cursors) before reconnecting. Clients may send
+``{"type": "ping"}`` to receive ``{"type": "pong"}``.
+"""
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+
+from realtime import get_broker, user_channel
+from realtime.brokers import SubscriptionOverflow
+
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_TRY_AGAIN_LATER = 1013
+
+
+def _raw_token(scope):
+    header = dict(scope.get("headers") or ()).get(b"authorization", b"").decode("latin-1")
+    scheme, _, credentials = header.partition(" ")
+    if scheme.lower() == "bearer" and credentials.strip():
+        return credentials.strip()
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return (query.get("token") or [""])[0]
+
+
+@sync_to_async
+def _authenticate(raw_token):
+    """Return ``(user, expires_at)`` for a valid access token, else ``(None, None)``."""
+    if not raw_token:
+        return None, None
+    close_old_connections()
+    try:
+        authentication = JWTAuthentication()
+        token = authentication.get_validated_token(raw_token)
+        user = authentication.get_user(token)
+    except (AuthenticationFailed, InvalidToken, TokenError):
+        return None, None
+    finally:
+        close_old_connections()
+    if not user.is_active:
+        return None, None
+    return user, token.get("exp")
+
+
+async def _forward(subscription, send):
+    while True:
+        message = await subscription.get()
+        await send({"type": "websocket.send", "text": message})
+
+
+async def _read(receive, send):
+    while True:
+        event = await receive()
+        if event["type"] == "websocket.disconnect":
+            return
+        try:
+            payload = json.loads(event.get("text") or "")
+        except ValueError:
+            continue
+        if isinstance(payload, dict) and payload.get("type") == "ping":
+            await send({"type": "websocket.send", "text": json.dumps({"type": "pong"})})
+
+
+async def websocket_application(scope, receive, send):
+    event = await receive()
+    if event["type"] != "websocket.connect":
+        return
+    user, expires_at = await _authenticate(_raw_token(scope))
+    if user is None:
+        await send({"type": "websocket.close", "code": CLOSE_UNAUTHORIZED})
+        return
+
+    subscription = await get_broker().subscribe(user_channel(user.id))
+    await send({"type": "websocket.accept"})
+    forward = asyncio.ensure_future(_forward(subscription, send))
+    read = asyncio.ensure_future(_read(receive, send))
+    timeout = max(expires_at - time.time(), 0) if expires_at else None
+    try:
+        done, _ = await asyncio.wait({forward, read}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        if read in done:
+            return
+        if forward in done and isinstance(forward.exception(), SubscriptionOverflow):
+            await send({"type": "websocket.close", "code": CLOSE_TRY_AGAIN_LATER})
+        elif forward in done:
+            forward.result()
+        else:
+            await send({"type": "websocket.close", "code": CLOSE_UNAUTHORIZED})
+    finally:
+        subscription.close()
+        for task in (forward, read):
+            task.cancel()
+        await asyncio.gather(forward, read, return_exceptions=True)
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import threading
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TransactionTestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from jobs.models import ChatMessage, ChatThread
+from realtime import get_broker, user_channel
+from realtime.brokers import InMemoryBroker, SubscriptionOverflow
+from realtime.gateway import CLOSE_TRY_AGAIN_LATER, CLOSE_UNAUTHORIZED, websocket_application
+
+
+class InMemoryBrokerTests(SimpleTestCase):
+    async def test_publish_from_another_thread_reaches_subscribers_of_the_channel(self):
+        broker = InMemoryBroker()
+        subscription = await broker.subscribe("user.1")
+        other = await broker.subscribe("user.2")
+        thread = threading.Thread(target=broker.publish, args=("user.1", "hello"))
+        thread.start()
+        thread.join()
+        self.assertEqual(await asyncio.wait_for(subscription.get(), 1), "hello")
+        self.assertTrue(other.queue.empty())
+
+    async def test_overflow_and_close(self):
+        broker = InMemoryBroker()
+        broker.max_pending = 1
+        subscription = await broker.subscribe("user.1")
+        broker.publish("user.1", "first")
+        broker.publish("user.1", "second")
+        await asyncio.sleep(0)
+        with self.assertRaises(SubscriptionOverflow):
+            await subscription.get()
+
+        subscription.close()
+        self.assertEqual(broker._subscriptions, {})
+        broker.publish("user.1", "nobody listens")
+
+
+class GatewayTests(TransactionTestCase):
+    def setUp(self):
+        get_broker.cache_clear()
+        self.addCleanup(get_broker.cache_clear)
+        users = get_user_model().objects
+        self.employer = users.create_user(email="employer@example.com", password="pass12345", role="employer")
+        self.worker = users.create_user(email="worker@example.com", password="pass12345", role="worker")
+        self.thread = ChatThread.objects.create(employer=self.employer, worker=self.worker)
+
+    def _connect(self, token=None, headers=()):
+        query = f"token={token}" if token is not None else ""
+        scope = {"type": "websocket", "path": "/ws/", "query_string": query.encode(), "headers": list(headers)}
+        return ApplicationCommunicator(websocket_application, scope)
+
+    async def _open(self, token):
+        communicator = self._connect(token)
+        await communicator.send_input({"type": "websocket.connect"})
+        self.assertEqual(await communicator.receive_output(2), {"type": "websocket.accept"})
+        return communicator
+
+    async def test_rejects_missing_and_invalid_tokens(self):
+        for communicator in (self._connect(), self._connect("garbage")):
+            await communicator.send_input({"type": "websocket.connect"})
+            self.assertEqual(
+                await communicator.receive_output(2), {"type": "websocket.close", "code": CLOSE_UNAUTHORIZED}
+            )
+
+    async def test_bearer_header_ping_and_chat_event(self):
+        token = str(AccessToken.for_user(self.worker))
+        communicator = self._connect(headers=[(b"authorization", f"Bearer {token}".encode())])
+        await communicator.send_input({"type": "websocket.connect"})
+        self.assertEqual(await communicator.receive_output(2), {"type": "websocket.accept"})
+
+        await communicator.send_input({"type": "websocket.receive", "text": '{"type": "ping"}'})
+        self.assertEqual(json.loads((await communicator.receive_output(2))["text"]), {"type": "pong"})
+
+        await sync_to_async(ChatMessage.objects.create)(thread=self.thread, sender=self.employer, message="Hello")
+        event = json.loads((await communicator.receive_output(2))["text"])
+        self.assertEqual(event["type"], "chat.message")
+        self.assertEqual(event["data"]["message"], "Hello")
+
+        await communicator.send_input({"type": "websocket.disconnect", "code": 1000})
+        await communicator.wait(2)
+        self.assertEqual(get_broker()._subscriptions, {})
+
+    async def test_closes_when_the_token_expires(self):
+        token = AccessToken.for_user(self.worker)
+        token.set_exp(lifetime=timedelta(seconds=1))
+        communicator = await self._open(token)
+        self.assertEqual(await communicator.receive_output(3), {"type": "websocket.close", "code": CLOSE_UNAUTHORIZED})
+        await communicator.wait(2)
+
+    async def test_closes_a_subscriber_that_falls_behind(self):
+        broker = get_broker()
+        broker.max_pending = 1
+        communicator = await self._open(AccessToken.for_user(self.worker))
+        for index in range(3):
+            broker.publish(user_channel(self.worker.id), json.dumps({"type": "test", "data": index}))
+
+        self.assertEqual(json.loads((await communicator.receive_output(2))["text"])["data"], 0)
+        self.assertEqual(
+            await communicator.receive_output(2), {"type": "websocket.close", "code": CLOSE_TRY_AGAIN_LATER}
+        )
+        await communicator.wait(2)
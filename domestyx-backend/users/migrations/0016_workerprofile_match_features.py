@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0015_customuser_deactivated_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workerprofile',
+            name='match_features',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,47 @@
+from django.db import migrations
+
+
+# Frozen copy of jobs.matching as of this migration.
+def normalize_list(value):
+    if isinstance(value, list):
+        return [str(item).strip().lower() for item in value if str(item).strip()]
+    if isinstance(value, str):
+        return [item.strip().lower() for item in value.split(",") if item.strip()]
+    return []
+
+
+def build_worker_features(profile):
+    return {
+        "services": sorted(set(normalize_list(profile.services))),
+        "languages": sorted(set(normalize_list(profile.languages))),
+        "nationality": (profile.nationality or "").strip().lower(),
+        "locations": sorted({part.lower() for part in (profile.city, profile.state, profile.country) if part}),
+    }
+
+
+def backfill_worker_match_features(apps, schema_editor):
+    WorkerProfile = apps.get_model("users", "WorkerProfile")
+    db_alias = schema_editor.connection.alias
+    batch = []
+    profiles = WorkerProfile.objects.using(db_alias).only(
+        "id", "services", "languages", "nationality", "city", "state", "country"
+    )
+    for profile in profiles.iterator():
+        profile.match_features = build_worker_features(profile)
+        batch.append(profile)
+        if len(batch) >= 500:
+            WorkerProfile.objects.using(db_alias).bulk_update(batch, ["match_features"])
+            batch = []
+    if batch:
+        WorkerProfile.objects.using(db_alias).bulk_update(batch, ["match_features"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0016_workerprofile_match_features"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_worker_match_features, migrations.RunPython.noop),
+    ]
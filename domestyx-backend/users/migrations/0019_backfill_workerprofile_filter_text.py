@@ -0,0 +1,68 @@
+from django.db import migrations
+
+# (index name, indexed expression); each must match the SQL of its users.search.filter_workers lookup.
+POSTGRES_FILTER_INDEXES = (
+    ("users_workerprofile_services_trgm", "services_text"),
+    ("users_workerprofile_availability_trgm", "availability_text"),
+    ("users_workerprofile_location_trgm", "location_text"),
+    # experience__icontains compiles to UPPER(experience::text) LIKE UPPER(...).
+    ("users_workerprofile_experience_trgm", "UPPER(experience::text)"),
+)
+
+# Frozen copy of users.search as of this migration.
+LIST_SEPARATOR = "\n"
+
+
+def list_text(value):
+    items = [value] if isinstance(value, str) else (value or [])
+    return LIST_SEPARATOR.join(str(item).lower() for item in items)
+
+
+def build_worker_filter_fields(profile):
+    return {
+        "services_text": list_text(profile.services),
+        "availability_text": list_text(profile.availability),
+        "location_text": f"{profile.city} {profile.state} {profile.country}".lower(),
+    }
+
+
+def backfill_worker_filter_text(apps, schema_editor):
+    WorkerProfile = apps.get_model("users", "WorkerProfile")
+    db_alias = schema_editor.connection.alias
+    fields = ["services_text", "availability_text", "location_text"]
+    batch = []
+    profiles = WorkerProfile.objects.using(db_alias).only("id", "services", "availability", "city", "state", "country")
+    for profile in profiles.iterator():
+        for field, value in build_worker_filter_fields(profile).items():
+            setattr(profile, field, value)
+        batch.append(profile)
+        if len(batch) >= 500:
+            WorkerProfile.objects.using(db_alias).bulk_update(batch, fields)
+            batch = []
+    if batch:
+        WorkerProfile.objects.using(db_alias).bulk_update(batch, fields)
+
+    if schema_editor.connection.vendor == "postgresql":
+        # Trigram GIN indexes serve LIKE '%term%', which users.search.filter_workers issues.
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, expression in POSTGRES_FILTER_INDEXES:
+            schema_editor.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON users_workerprofile USING GIN (({expression}) gin_trgm_ops)"
+            )
+
+
+def drop_worker_filter_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for name, _ in POSTGRES_FILTER_INDEXES:
+            schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0018_workerprofile_filter_text"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_worker_filter_text, drop_worker_filter_indexes),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0019_backfill_workerprofile_filter_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workerprofile',
+            name='search_document',
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
@@ -0,0 +1,72 @@
+from django.db import migrations
+
+POSTGRES_SEARCH_INDEX = "users_workerprofile_search_trgm"
+
+# Frozen copy of users.search as of this migration.
+LIST_SEPARATOR = "\n"
+
+
+def list_text(value):
+    items = [value] if isinstance(value, str) else (value or [])
+    return LIST_SEPARATOR.join(str(item).lower() for item in items)
+
+
+def build_search_document(profile):
+    name = f"{profile.user.first_name} {profile.user.last_name}".strip() or "Worker"
+    return " ".join(
+        [
+            name.lower(),
+            profile.bio.lower(),
+            f"{profile.city} {profile.state} {profile.country}".lower(),
+            list_text(profile.services).replace(LIST_SEPARATOR, " "),
+            list_text(profile.availability).replace(LIST_SEPARATOR, " "),
+            (profile.experience or "").lower(),
+        ]
+    )
+
+
+def build_worker_search_document(apps, schema_editor):
+    WorkerProfile = apps.get_model("users", "WorkerProfile")
+    connection = schema_editor.connection
+    db_alias = connection.alias
+    batch = []
+    profiles = (
+        WorkerProfile.objects.using(db_alias)
+        .select_related("user")
+        .only(
+            "id", "services", "availability", "city", "state", "country", "bio", "experience",
+            "user__first_name", "user__last_name",
+        )
+    )
+    for profile in profiles.iterator():
+        profile.search_document = build_search_document(profile)
+        batch.append(profile)
+        if len(batch) >= 500:
+            WorkerProfile.objects.using(db_alias).bulk_update(batch, ["search_document"])
+            batch = []
+    if batch:
+        WorkerProfile.objects.using(db_alias).bulk_update(batch, ["search_document"])
+
+    if connection.vendor == "postgresql":
+        # Trigram GIN indexes serve LIKE '%term%', which users.search.filter_workers issues.
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {POSTGRES_SEARCH_INDEX} ON users_workerprofile "
+            "USING GIN (search_document gin_trgm_ops)"
+        )
+
+
+def drop_worker_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {POSTGRES_SEARCH_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0020_workerprofile_search_document"),
+    ]
+
+    operations = [
+        migrations.RunPython(build_worker_search_document, drop_worker_search_index),
+    ]
@@ -4,6 +4,10 @@ from django.db import models
 from django.conf import settings
 from django.utils import timezone
 
+from jobs.matching import WORKER_MATCH_FIELDS, build_worker_features
+
+from .search import WORKER_FILTER_FIELDS, build_worker_filter_fields
+
 
 class EmployerProfile(models.Model):
     EMPLOYER_TYPE_CHOICES = (
@@ -185,10 +189,37 @@ class WorkerProfile(models.Model):
     medical_fitness_certificate = models.FileField(upload_to="worker_documents/", blank=True, null=True)
     police_verification_certificate = models.FileField(upload_to="worker_documents/", blank=True, null=True)
     profile_image = models.ImageField(upload_to='worker_profiles/', blank=True, null=True)
+    # Normalized matching inputs, rebuilt on save; see jobs.matching.
+    match_features = models.JSONField(default=dict, blank=True, editable=False)
+    # Lowercased copies of the public directory filter inputs; see users.search.
+    services_text = models.TextField(blank=True, editable=False)
+    availability_text = models.TextField(blank=True, editable=False)
+    location_text = models.TextField(blank=True, editable=False)
+    # Includes the user's name; save_user_profile re-saves the profile whenever its user is saved.
+    search_document = models.TextField(blank=True, editable=False)
 
     def __str__(self):
         return f"{self.user.email} Profile"
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        self.match_features_changed = False
+        if update_fields is None or WORKER_MATCH_FIELDS.intersection(update_fields):
+            features = build_worker_features(self)
+            # Read by the jobs post_save receiver: saves that leave the match inputs alone (every
+            # user save re-saves the profile) need no reindex or rescore.
+            self.match_features_changed = self._state.adding or features != self.match_features
+            self.match_features = features
+            if update_fields is not None:
+                kwargs["update_fields"] = set(kwargs["update_fields"]) | {"match_features"}
+        if update_fields is None or WORKER_FILTER_FIELDS.intersection(update_fields):
+            filter_fields = build_worker_filter_fields(self)
+            for field, value in filter_fields.items():
+                setattr(self, field, value)
+            if update_fields is not None:
+                kwargs["update_fields"] = set(kwargs["update_fields"]) | set(filter_fields)
+        super().save(*args, **kwargs)
+
 
 class AgencyWorkerSubmission(models.Model):
     STATUS_CHOICES = (
@@ -341,6 +372,8 @@ class OTPVerification(models.Model):
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from realtime import events as realtime_events
+
 @receiver(post_save, sender=CustomUser)
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
@@ -367,3 +400,9 @@ def save_user_profile(sender, instance, **kwargs):
         instance.government_profile.save()
     elif instance.role == 'support_provider' and hasattr(instance, 'support_provider_profile'):
         instance.support_provider_profile.save()
+
+
+@receiver(post_save, sender=SupportServiceMessage)
+def push_support_message(sender, instance, created, using="default", **kwargs):
+    if created:
+        realtime_events.support_message_created(instance, using=using)
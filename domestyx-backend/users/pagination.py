@@ -0,0 +1,8 @@
+# users/pagination.py
+from jobs.pagination import KeysetPagination
+
+
+class WorkerCursorPagination(KeysetPagination):
+    """Keyset pagination for the public worker directory, in user id order."""
+
+    key_fields = ("user_id",)
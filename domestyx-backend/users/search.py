@@ -0,0 +1,73 @@
+# users/search.py
+"""Filtering and search for the public worker directory.
+
+``public_workers`` filters workers by substring over their services,
+availability and location, and searches a blob of their name, bio, location,
+services, availability and experience. Services and availability are JSON
+lists, which SQL cannot search portably, so every profile stores lowercased
+copies of those inputs in plain text columns, plus the whole blob as
+``search_document``, rebuilt on save. The filters then run as database
+predicates on single columns.
+
+PostgreSQL deployments index every filtered column (and ``search_document``)
+with a pg_trgm GIN index created in the users migrations, which serves the
+substring ``LIKE`` directly; other backends scan the precomputed columns.
+"""
+# Joins list items in the text columns; filters never contain it, so a
+# ``contains`` match always falls inside a single item.
+LIST_SEPARATOR = "\n"
+WORKER_FILTER_FIELDS = frozenset({"services", "availability", "city", "state", "country", "bio", "experience"})
+
+
+def list_text(value):
+    items = [value] if isinstance(value, str) else (value or [])
+    return LIST_SEPARATOR.join(str(item).lower() for item in items)
+
+
+def display_name(user):
+    return f"{user.first_name} {user.last_name}".strip() or "Worker"
+
+
+def build_worker_filter_fields(profile):
+    """Values for the denormalized filter and search columns of ``profile``."""
+    services_text = list_text(profile.services)
+    availability_text = list_text(profile.availability)
+    location_text = f"{profile.city} {profile.state} {profile.country}".lower()
+    search_document = " ".join(
+        [
+            display_name(profile.user).lower(),
+            profile.bio.lower(),
+            location_text,
+            services_text.replace(LIST_SEPARATOR, " "),
+            availability_text.replace(LIST_SEPARATOR, " "),
+            (profile.experience or "").lower(),
+        ]
+    )
+    return {
+        "services_text": services_text,
+        "availability_text": availability_text,
+        "location_text": location_text,
+        "search_document": search_document,
+    }
+
+
+def _clean(value):
+    return (value or "").replace(LIST_SEPARATOR, " ").strip().lower()
+
+
+def filter_workers(queryset, search="", job_role="", location="", experience="", availability=""):
+    """Apply the public directory filters to a ``WorkerProfile`` queryset; all are case-insensitive substrings."""
+    search, job_role, location, experience, availability = map(
+        _clean, (search, job_role, location, experience, availability)
+    )
+    if job_role:
+        queryset = queryset.filter(services_text__contains=job_role)
+    if location:
+        queryset = queryset.filter(location_text__contains=location)
+    if experience:
+        queryset = queryset.filter(experience__icontains=experience)
+    if availability:
+        queryset = queryset.filter(availability_text__contains=availability)
+    if search:
+        queryset = queryset.filter(search_document__contains=search)
+    return queryset
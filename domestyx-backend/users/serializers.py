@@ -4,6 +4,8 @@ import re
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from domestyx_backend.serializers import SparseFieldsMixin
+
 from .models import (
     AgencyWorkerSubmission,
     ComplianceReport,
@@ -24,7 +26,7 @@ User = get_user_model()
 
 # users/serializers.py
 
-class WorkerProfileSerializer(serializers.ModelSerializer):
+class WorkerProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = WorkerProfile
         fields = [
@@ -42,6 +44,7 @@ class WorkerProfileSerializer(serializers.ModelSerializer):
             "medical_fitness_certificate", "police_verification_certificate", "profile_image"
         ]
         read_only_fields = ["user"]
+        deferrable_fields = ["bio", "criminal_record_details", "health_conditions"]
 # Register Serializer
 # -----------------------------
 # users/serializers.py
@@ -155,7 +158,7 @@ class RegisterSerializer(serializers.ModelSerializer):
 # -----------------------------
 # Profile Serializer
 # -----------------------------
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = (
@@ -229,7 +232,7 @@ class OTPVerifySerializer(serializers.Serializer):
         return attrs
 
 
-class ConsentSerializer(serializers.ModelSerializer):
+class ConsentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = [
@@ -242,28 +245,28 @@ class ConsentSerializer(serializers.ModelSerializer):
         read_only_fields = ["terms_accepted_at", "privacy_accepted_at"]
 
 
-class RecruitmentAgencyProfileSerializer(serializers.ModelSerializer):
+class RecruitmentAgencyProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = RecruitmentAgencyProfile
         fields = ["agency_name", "mohre_approval_number", "contact_information", "verification_document", "is_verified"]
         read_only_fields = ["is_verified"]
 
 
-class GovernmentProfileSerializer(serializers.ModelSerializer):
+class GovernmentProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = GovernmentProfile
         fields = ["authority_name", "credential_reference", "verification_document", "is_verified"]
         read_only_fields = ["is_verified"]
 
 
-class SupportServiceProviderProfileSerializer(serializers.ModelSerializer):
+class SupportServiceProviderProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = SupportServiceProviderProfile
         fields = ["company_name", "service_categories", "contact_information", "is_verified"]
         read_only_fields = ["is_verified"]
 
 
-class AgencyWorkerSubmissionSerializer(serializers.ModelSerializer):
+class AgencyWorkerSubmissionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     worker_name = serializers.CharField(source="worker.first_name", read_only=True)
 
     class Meta:
@@ -273,9 +276,10 @@ class AgencyWorkerSubmissionSerializer(serializers.ModelSerializer):
             "verification_document", "notes", "status", "created_at",
         ]
         read_only_fields = ["agency", "status", "created_at"]
+        deferrable_fields = ["notes"]
 
 
-class ComplianceReportSerializer(serializers.ModelSerializer):
+class ComplianceReportSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     reporter_name = serializers.CharField(source="reporter.first_name", read_only=True)
     reported_user_name = serializers.CharField(source="reported_user.first_name", read_only=True)
 
@@ -286,9 +290,10 @@ class ComplianceReportSerializer(serializers.ModelSerializer):
             "category", "description", "status", "resolution_notes", "created_at", "updated_at",
         ]
         read_only_fields = ["reporter", "created_at", "updated_at"]
+        deferrable_fields = ["description", "resolution_notes"]
 
 
-class SupportServiceRequestSerializer(serializers.ModelSerializer):
+class SupportServiceRequestSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     requester_name = serializers.CharField(source="requester.first_name", read_only=True)
     provider_name = serializers.CharField(source="provider.first_name", read_only=True)
 
@@ -299,9 +304,10 @@ class SupportServiceRequestSerializer(serializers.ModelSerializer):
             "service_type", "details", "status", "created_at", "updated_at",
         ]
         read_only_fields = ["requester", "created_at", "updated_at"]
+        deferrable_fields = ["details"]
 
 
-class SupportServiceMessageSerializer(serializers.ModelSerializer):
+class SupportServiceMessageSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     sender_name = serializers.CharField(source="sender.first_name", read_only=True)
 
     class Meta:
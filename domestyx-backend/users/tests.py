@@ -1,3 +1,111 @@
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .models import CustomUser
+
+
+def _worker(email, first_name="", is_active=True, **profile_fields):
+    user = CustomUser.objects.create_user(
+        email=email, password="pass12345", role="worker", first_name=first_name, is_active=is_active
+    )
+    profile = user.worker_profile
+    for field, value in profile_fields.items():
+        setattr(profile, field, value)
+    profile.save()
+    return user
+
+
+class PublicWorkersTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("public-workers")
+        self.nanny = _worker(
+            "nanny@example.com",
+            first_name="Maria",
+            services=["Nanny", "Baby Care"],
+            availability=["Full-time", "Live-in"],
+            experience="5 years",
+            city="Dubai",
+            country="UAE",
+            bio="Loves children",
+        )
+        # Legacy rows store a comma-separated string instead of a list.
+        self.driver = _worker(
+            "driver@example.com",
+            first_name="Ahmed",
+            services="Driver, Cook",
+            availability="Part-time",
+            experience="2 years",
+            city="Abu Dhabi",
+            country="UAE",
+        )
+        self.cleaner = _worker(
+            "cleaner@example.com",
+            services=["Cleaning"],
+            availability=["Part-time"],
+            experience="10 years",
+            city="Sharjah",
+            state="Sharjah",
+        )
+        _worker("inactive@example.com", is_active=False, services=["Nanny"], city="Dubai")
+        CustomUser.objects.create_user(email="employer@example.com", password="pass12345", role="employer")
+
+    def _ids(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200, params)
+        return [worker["id"] for worker in response.data]
+
+    def test_lists_active_workers_in_id_order(self):
+        self.assertEqual(self._ids(), [self.nanny.id, self.driver.id, self.cleaner.id])
+        nanny = self.client.get(self.url).data[0]
+        self.assertEqual(nanny["name"], "Maria")
+        self.assertEqual(nanny["services"], ["Nanny", "Baby Care"])
+
+    def test_job_role_matches_within_one_service(self):
+        self.assertEqual(self._ids(job_role="baby"), [self.nanny.id])
+        self.assertEqual(self._ids(job_role=" NANNY "), [self.nanny.id])
+        self.assertEqual(self._ids(job_role="cook"), [self.driver.id])
+        self.assertEqual(self._ids(job_role="driver, cook"), [self.driver.id])
+        # List items never run together, so a filter cannot span two services.
+        self.assertEqual(self._ids(job_role="nanny baby"), [])
+        self.assertEqual(self._ids(job_role="nanny\nbaby"), [])
+
+    def test_location_matches_city_state_or_country(self):
+        self.assertEqual(self._ids(location="uae"), [self.nanny.id, self.driver.id])
+        self.assertEqual(self._ids(location="abu"), [self.driver.id])
+        self.assertEqual(self._ids(location="sharjah"), [self.cleaner.id])
+
+    def test_experience(self):
+        self.assertEqual(self._ids(experience="5 YEARS"), [self.nanny.id])
+        self.assertEqual(self._ids(experience="years"), [self.nanny.id, self.driver.id, self.cleaner.id])
+
+    def test_availability(self):
+        self.assertEqual(self._ids(availability="part"), [self.driver.id, self.cleaner.id])
+        self.assertEqual(self._ids(availability="live-in"), [self.nanny.id])
+
+    def test_search_covers_name_bio_location_services_availability_and_experience(self):
+        self.assertEqual(self._ids(search="maria"), [self.nanny.id])
+        self.assertEqual(self._ids(search="children"), [self.nanny.id])
+        self.assertEqual(self._ids(search="nanny baby care"), [self.nanny.id])
+        self.assertEqual(self._ids(search="10 years"), [self.cleaner.id])
+        self.assertEqual(self._ids(search="worker"), [self.cleaner.id])
+
+    def test_filters_combine(self):
+        self.assertEqual(self._ids(location="uae", availability="part"), [self.driver.id])
+        self.assertEqual(self._ids(location="uae", job_role="cleaning"), [])
+
+    def test_limit_and_cursor_page_in_id_order(self):
+        page = self.client.get(self.url, {"limit": 2}).data
+        self.assertEqual([worker["id"] for worker in page["results"]], [self.nanny.id, self.driver.id])
+        page = self.client.get(page["next"]).data
+        self.assertEqual([worker["id"] for worker in page["results"]], [self.cleaner.id])
+        self.assertIsNone(page["next"])
+
+        page = self.client.get(self.url, {"limit": 1, "location": "uae"}).data
+        page = self.client.get(page["next"]).data
+        self.assertEqual([worker["id"] for worker in page["results"]], [self.driver.id])
+        self.assertIsNone(page["next"])
+
+    def test_bad_cursor_is_not_found(self):
+        self.assertEqual(self.client.get(self.url, {"cursor": "garbage"}).status_code, 404)
@@ -20,6 +20,8 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView
 import phonenumbers
 
+from .pagination import WorkerCursorPagination
+from .search import display_name, filter_workers
 from .serializers import (
     RegisterSerializer, ProfileSerializer,
     ConsentSerializer, CustomTokenObtainPairSerializer, OTPRequestSerializer,
@@ -44,6 +46,12 @@ from jobs.models import Application, ChatMessage, ChatThread, EmployerReview, Jo
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+PUBLIC_WORKER_FIELDS = (
+    "user_id", "user__first_name", "user__last_name", "services", "availability", "experience",
+    "city", "state", "country", "expected_salary_full_time", "expected_salary_part_time", "hourly_rate",
+    "is_background_checked", "has_references", "profile_image",
+)
+
 
 def _user_role(user):
     return (getattr(user, "role", "") or "").strip().lower()
@@ -180,62 +188,47 @@ def _send_email_otp(email, code):
     raise RuntimeError(f"Unsupported email provider: {provider}")
 
 
+def _public_worker(profile):
+    return {
+        "id": profile.user_id,
+        "name": display_name(profile.user),
+        "services": [str(item) for item in (profile.services or [])],
+        "experience": profile.experience,
+        "availability": [str(item) for item in (profile.availability or [])],
+        "city": profile.city,
+        "state": profile.state,
+        "country": profile.country,
+        "expected_salary_full_time": str(profile.expected_salary_full_time) if profile.expected_salary_full_time else "",
+        "expected_salary_part_time": str(profile.expected_salary_part_time) if profile.expected_salary_part_time else "",
+        "hourly_rate": str(profile.hourly_rate) if profile.hourly_rate else "",
+        "is_verified": bool(profile.is_background_checked or profile.has_references),
+        "profile_image": profile.profile_image.url if profile.profile_image else None,
+    }
+
+
 @api_view(["GET"])
 @permission_classes([permissions.AllowAny])
 def public_workers(request):
-    search = (request.query_params.get("search") or "").strip()
-    role_filter = (request.query_params.get("job_role") or "").strip().lower()
-    location_filter = (request.query_params.get("location") or "").strip().lower()
-    experience_filter = (request.query_params.get("experience") or "").strip().lower()
-    availability_filter = (request.query_params.get("availability") or "").strip().lower()
-
-    queryset = WorkerProfile.objects.select_related("user").filter(user__role="worker", user__is_active=True)
-    results = []
-    for profile in queryset:
-        name = f"{profile.user.first_name} {profile.user.last_name}".strip() or "Worker"
-        services = [str(item) for item in (profile.services or [])]
-        availability = [str(item) for item in (profile.availability or [])]
-        blob = " ".join(
-            [
-                name.lower(),
-                profile.bio.lower(),
-                profile.city.lower(),
-                profile.state.lower(),
-                profile.country.lower(),
-                " ".join(s.lower() for s in services),
-                " ".join(a.lower() for a in availability),
-                (profile.experience or "").lower(),
-            ]
-        )
-        if search and search.lower() not in blob:
-            continue
-        if role_filter and all(role_filter not in item.lower() for item in services):
-            continue
-        if location_filter and location_filter not in f"{profile.city} {profile.state} {profile.country}".lower():
-            continue
-        if experience_filter and experience_filter not in (profile.experience or "").lower():
-            continue
-        if availability_filter and all(availability_filter not in item.lower() for item in availability):
-            continue
-
-        results.append(
-            {
-                "id": profile.user_id,
-                "name": name,
-                "services": services,
-                "experience": profile.experience,
-                "availability": availability,
-                "city": profile.city,
-                "state": profile.state,
-                "country": profile.country,
-                "expected_salary_full_time": str(profile.expected_salary_full_time) if profile.expected_salary_full_time else "",
-                "expected_salary_part_time": str(profile.expected_salary_part_time) if profile.expected_salary_part_time else "",
-                "hourly_rate": str(profile.hourly_rate) if profile.hourly_rate else "",
-                "is_verified": bool(profile.is_background_checked or profile.has_references),
-                "profile_image": profile.profile_image.url if profile.profile_image else None,
-            }
-        )
-    return Response(results)
+    queryset = (
+        WorkerProfile.objects.select_related("user")
+        .filter(user__role="worker", user__is_active=True)
+        .only(*PUBLIC_WORKER_FIELDS)
+        .order_by("user_id")
+    )
+    queryset = filter_workers(
+        queryset,
+        search=request.query_params.get("search"),
+        job_role=request.query_params.get("job_role"),
+        location=request.query_params.get("location"),
+        experience=request.query_params.get("experience"),
+        availability=request.query_params.get("availability"),
+    )
+
+    paginator = WorkerCursorPagination()
+    page = paginator.paginate_queryset(queryset, request)
+    if page is None:
+        return Response([_public_worker(profile) for profile in queryset])
+    return paginator.get_paginated_response([_public_worker(profile) for profile in page])
 
 # -----------------------------
 # Register User
@@ -354,7 +347,7 @@ def worker_profile(request):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     # GET request logic
-    serializer = WorkerProfileSerializer(profile)
+    serializer = WorkerProfileSerializer(profile, context={"request": request})
     return Response(serializer.data)
 
 # Optional separate endpoint for image upload (if you want dedicated endpoint)
@@ -532,7 +525,7 @@ def verify_otp(request):
 def user_consent(request):
     user = request.user
     if request.method == "GET":
-        serializer = ConsentSerializer(user)
+        serializer = ConsentSerializer(user, context={"request": request})
         return Response(serializer.data)
 
     serializer = ConsentSerializer(user, data=request.data, partial=True)
@@ -564,7 +557,7 @@ def agency_profile(request):
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
-    return Response(RecruitmentAgencyProfileSerializer(profile).data)
+    return Response(RecruitmentAgencyProfileSerializer(profile, context={"request": request}).data)
 
 
 @api_view(["GET", "POST"])
@@ -575,7 +568,8 @@ def agency_worker_submissions(request):
         return Response({"message": "Only agencies can access this endpoint."}, status=status.HTTP_403_FORBIDDEN)
     if request.method == "GET":
         queryset = AgencyWorkerSubmission.objects.filter(agency=request.user).select_related("worker").order_by("-created_at")
-        return Response(AgencyWorkerSubmissionSerializer(queryset, many=True).data)
+        queryset = AgencyWorkerSubmissionSerializer.defer_unrequested_fields(queryset, request)
+        return Response(AgencyWorkerSubmissionSerializer(queryset, many=True, context={"request": request}).data)
 
     serializer = AgencyWorkerSubmissionSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -638,7 +632,8 @@ def compliance_reports(request):
             queryset = ComplianceReport.objects.select_related("reporter", "reported_user").order_by("-created_at")
         else:
             queryset = ComplianceReport.objects.filter(reporter=request.user).select_related("reporter", "reported_user").order_by("-created_at")
-        return Response(ComplianceReportSerializer(queryset, many=True).data)
+        queryset = ComplianceReportSerializer.defer_unrequested_fields(queryset, request)
+        return Response(ComplianceReportSerializer(queryset, many=True, context={"request": request}).data)
 
     reported_user_id = request.data.get("reported_user")
     if not reported_user_id:
@@ -771,7 +766,7 @@ def government_profile(request):
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
-    return Response(GovernmentProfileSerializer(profile).data)
+    return Response(GovernmentProfileSerializer(profile, context={"request": request}).data)
 
 
 @api_view(["GET", "PUT"])
@@ -785,7 +780,7 @@ def support_provider_profile(request):
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
-    return Response(SupportServiceProviderProfileSerializer(profile).data)
+    return Response(SupportServiceProviderProfileSerializer(profile, context={"request": request}).data)
 
 
 @api_view(["GET", "POST"])
@@ -797,7 +792,8 @@ def support_service_requests(request):
             queryset = SupportServiceRequest.objects.filter(provider=request.user).select_related("requester", "provider").order_by("-created_at")
         else:
             queryset = SupportServiceRequest.objects.filter(requester=request.user).select_related("requester", "provider").order_by("-created_at")
-        return Response(SupportServiceRequestSerializer(queryset, many=True).data)
+        queryset = SupportServiceRequestSerializer.defer_unrequested_fields(queryset, request)
+        return Response(SupportServiceRequestSerializer(queryset, many=True, context={"request": request}).data)
 
     serializer = SupportServiceRequestSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -869,7 +865,7 @@ def support_service_messages(request, request_id):
 
     if request.method == "GET":
         queryset = obj.messages.select_related("sender").order_by("created_at")
-        return Response(SupportServiceMessageSerializer(queryset, many=True).data)
+        return Response(SupportServiceMessageSerializer(queryset, many=True, context={"request": request}).data)
 
     text = (request.data.get("message") or "").strip()
     if not text: